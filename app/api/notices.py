@@ -8,10 +8,16 @@ from app.services import (
     get_notices,
     search_notices,
     get_notice_by_id,
+    get_notice_history,
     get_boards,
     get_boards_by_group,
     crawl_all,
-    crawl_board
+    crawl_board,
+    probe_and_crawl,
+    submit_crawl_job,
+    get_job,
+    list_jobs,
+    cancel_job
 )
 
 router = APIRouter(prefix="/notices", tags=["notices"])
@@ -95,16 +101,34 @@ async def get_notice(notice_id: str):
     return notice
 
 
+@router.get("/{notice_id}/history")
+async def notice_history(notice_id: str):
+    """
+    공지사항 변경 이력 (이전 버전, 최신 변경부터)
+    """
+    versions = await get_notice_history(notice_id)
+    if versions is None:
+        raise HTTPException(status_code=404, detail="Notice not found")
+    return {"versions": versions, "count": len(versions)}
+
+
 @router.post("/crawl")
 async def trigger_crawl(
-    boards: Optional[str] = Query(None, description="게시판 slug (쉼표로 구분, 없으면 전체)")
+    boards: Optional[str] = Query(None, description="게시판 slug (쉼표로 구분, 없으면 전체)"),
+    wait: bool = Query(False, description="true면 크롤링이 끝날 때까지 기다려 결과 반환")
 ):
     """
-    크롤링 실행
+    크롤링 실행 - 작업으로 제출하고 작업 id를 바로 반환
 
     - **boards**: 특정 게시판만 크롤링 (예: "csai,swuniv", 없으면 전체)
+    - **wait**: true면 작업 대신 바로 실행하고 결과 반환
+    - 진행 상황은 `GET /notices/crawl/jobs/{job_id}`로 확인
     """
     board_slugs = boards.split(",") if boards else None
+    if not wait:
+        job = await submit_crawl_job(board_slugs=board_slugs)
+        return {"success": True, "job": job}
+
     result = await crawl_all(board_slugs=board_slugs)
 
     return {
@@ -113,3 +137,55 @@ async def trigger_crawl(
         "total_new": result["total_new"],
         "total_updated": result["total_updated"]
     }
+
+
+@router.post("/crawl/probe")
+async def trigger_probe_crawl(
+    boards: Optional[str] = Query(None, description="게시판 slug (쉼표로 구분, 없으면 전체)")
+):
+    """
+    변경 탐지 후 크롤링 - 목록 1페이지 지문이 바뀐 URL만 크롤링 (자주 호출해도 가벼움)
+
+    - **boards**: 특정 게시판만 확인 (예: "csai,swuniv", 없으면 전체)
+    """
+    board_slugs = boards.split(",") if boards else None
+    result = await probe_and_crawl(board_slugs=board_slugs)
+
+    return {
+        "success": True,
+        "results": result["results"],
+        "total_new": result["total_new"],
+        "total_updated": result["total_updated"],
+        "probe": result["probe"]
+    }
+
+
+@router.get("/crawl/jobs")
+async def crawl_jobs(limit: int = Query(20, ge=1, le=100, description="최대 작업 수")):
+    """
+    크롤링 작업 목록 (최신순)
+    """
+    jobs = await list_jobs(limit=limit)
+    return {"jobs": jobs, "count": len(jobs)}
+
+
+@router.get("/crawl/jobs/{job_id}")
+async def crawl_job(job_id: str):
+    """
+    크롤링 작업 상태와 게시판별 진행률 (목록 페이지, 상세, new/updated/unchanged)
+    """
+    job = await get_job(job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return job
+
+
+@router.post("/crawl/jobs/{job_id}/cancel")
+async def cancel_crawl_job(job_id: str):
+    """
+    크롤링 작업 취소 (이미 끝난 작업은 그대로 반환)
+    """
+    job = await cancel_job(job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return job
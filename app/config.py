@@ -17,6 +17,81 @@ class Settings(BaseSettings):
     API_PORT: int = 8000
     DEBUG: bool = True
 
+    # ===== 크롤러 브라우저 풀 =====
+    BROWSER_POOL_SIZE: int = 4           # 동시에 대여 가능한 브라우저 컨텍스트 수
+    BROWSER_CONTEXT_MAX_USES: int = 20   # 컨텍스트 재사용 횟수 (초과 시 새로 생성)
+
+    # ===== 크롤링 =====
+    DETAIL_CONCURRENCY: int = 4          # 크롤러당 동시에 여는 상세 페이지 탭 수
+    PIPELINE_QUEUE_SIZE: int = 2         # 목록→상세→저장 단계 사이 큐 크기 (목록 페이지 단위)
+    LIST_PREFETCH: int = 3               # 랜덤 접근 가능한 목록을 동시에 가져올 페이지 수
+    DB_BATCH_SIZE: int = 100             # 공지 저장 bulk_write 배치 크기
+    DETAIL_REFRESH_HOURS: int = 72       # 본문이 있는 공지도 마지막 상세 확인 후 N시간 지나면 재확인
+    DETAIL_REFRESH_MAX_AGE_DAYS: int = 30  # 주기 재확인은 게시일이 N일 이내인 공지만 (오래된 공지는 목록 변경 시에만)
+    DETAIL_EMPTY_RETRY_HOURS: int = 6    # 본문이 비어 있는 공지 상세 재시도 간격
+    CRAWL_CONCURRENCY: int = 6           # 동시에 크롤링하는 게시판 URL 수 (전체)
+    CRAWL_PER_HOST: int = 2              # 같은 호스트에서 동시에 크롤링하는 URL 수
+    CRAWL_LEASE_TTL_SEC: int = 120       # 게시판 크롤링 리스 만료 시간 (초, 보유 중에는 1/3마다 갱신)
+    CRAWL_WATERMARK: bool = True         # URL별 워터마크(지난번 최신 글)에 도달한 목록 페이지에서 중단
+    PROBE_ROWS: int = 10                 # 변경 탐지 지문에 쓰는 목록 1페이지 상단 행 수
+    CONTENT_EXTRACT: str = "python"      # 본문 추출 위치 ("python": HTML만 받아 추출 프로세스 풀에서, "browser": 브라우저 JS)
+    EXTRACT_WORKERS: int = 2             # 추출 프로세스 풀 크기 (0이면 풀 없이 이벤트 루프에서 실행)
+    RAW_ARCHIVE: bool = True             # 상세 원본 HTML을 raw_pages에 gzip으로 보관 (scripts/reextract.py용)
+    RAW_ARCHIVE_LEVEL: int = 6           # gzip 압축 레벨 (1~9)
+    RAW_ARCHIVE_KEEP: int = 3            # URL별로 보관할 최근 원본 수 (0이면 모두 보관)
+
+    # ===== 크롤링 작업 =====
+    JOB_PROGRESS_FLUSH_SEC: float = 2.0  # 작업 진행률 저장 주기 (초, 취소 요청도 이 주기로 확인)
+    JOB_STALE_SEC: float = 60.0          # 서버 시작 시 이 시간 넘게 진행률 저장이 없는 실행 중 작업만 다시 실행 (초)
+
+    # ===== 크롤링 작업 큐 (워커) =====
+    CRAWL_QUEUE: bool = False            # True면 API/스케줄러는 작업 큐에 넣기만 하고 워커(worker.py)가 크롤링
+    WORKER_CONCURRENCY: int = 4          # 워커 하나가 동시에 처리하는 URL 작업 수
+    TASK_LEASE_SEC: int = 120            # URL 작업 리스 만료 시간 (초, 하트비트는 1/3마다, 만료되면 다른 워커가 이어서 처리)
+    TASK_MAX_ATTEMPTS: int = 3           # URL 작업 최대 시도 횟수 (넘으면 failed)
+    WORKER_POLL_SEC: float = 2.0         # 대기 작업이 없을 때 큐 확인 주기 (초)
+    TASK_BUSY_DELAY_SEC: float = 30.0    # 다른 프로세스가 같은 게시판을 크롤링 중일 때 작업을 미루는 시간 (초)
+
+    # ===== 자동 크롤링 스케줄러 =====
+    SCHEDULER_ENABLED: bool = True       # 서버 시작 시 스케줄러 실행
+    SCHEDULE_TICK_SEC: int = 60          # 크롤링할 게시판 확인 주기 (초)
+    SCHEDULE_MIN_INTERVAL_MIN: int = 10  # 게시판 크롤링 최소 간격 (분)
+    SCHEDULE_MAX_INTERVAL_MIN: int = 720  # 게시판 크롤링 최대 간격 (분)
+    SCHEDULE_TARGET_NEW: float = 1.0     # 크롤링 1회당 기대 새 공지 수 (간격 = 이 값 / 게시 빈도)
+    SCHEDULE_QUIET_HOURS: str = "01-07"  # 크롤링하지 않는 시간대 (시작-끝 시, SCHEDULE_TIMEZONE 기준, 빈 값이면 없음)
+    SCHEDULE_TIMEZONE: str = "Asia/Seoul"
+    SCHEDULE_PROBE: bool = True          # 크롤링 전 변경 탐지로 바뀐 URL만 크롤링
+
+    # ===== 호스트별 요청 스케줄러 =====
+    HOST_RATE: float = 4.0               # 호스트당 초당 요청 수 (토큰 충전 속도)
+    HOST_BURST: int = 4                  # 순간 허용 요청 수 (버킷 크기)
+    HOST_RETRIES: int = 2                # 호스트 실패(타임아웃/연결 오류/429/5xx) 시 재시도 횟수
+    HOST_BACKOFF_BASE: float = 1.0       # 백오프 시작 시간 (초, 실패마다 2배 + jitter)
+    HOST_BACKOFF_MAX: float = 60.0       # 백오프 최대 시간 (초)
+    HOST_FAILURE_THRESHOLD: int = 5      # 연속 실패 N회면 서킷 열기
+    HOST_COOLDOWN: float = 120.0         # 서킷 열림 유지 시간 (초)
+
+    # ===== 페이지 준비 조건 (고정 대기 대체) =====
+    READY_TIMEOUT_MS: int = 8000         # 준비 조건 최대 대기 (ms)
+    READY_POLL_MS: int = 100             # 준비 조건 확인 간격 (ms)
+    READY_FALLBACK_AFTER: int = 3        # 연속 시간 초과 N회면 고정 대기로 전환
+    READY_RETRY_EVERY: int = 10          # 고정 대기 중 N페이지마다 조건 재시도
+
+    # ===== 브라우저 리소스 차단 =====
+    RESOURCE_BLOCKING: bool = True       # 이미지/폰트/미디어, 분석 스크립트 요청 차단
+    RESOURCE_MEASURE_BLOCKED: bool = False  # 차단한 같은 사이트 리소스 크기를 HEAD로 측정 (URL당 1회, 추가 요청이라 기본 꺼짐)
+
+    # ===== 네트워크 세션 녹화/재생 =====
+    NET_SESSION: str = ""                # "record": 받은 응답을 NET_SESSION_DIR에 저장, "replay": 저장된 응답으로 크롤링 (네트워크 없음), 빈 값이면 사용 안 함
+    NET_SESSION_DIR: str = "sessions/default"  # 세션 저장 디렉터리 (bodies/ + index.jsonl)
+    NET_REPLAY_LATENCY: float = 1.0      # 재생 시 녹화된 지연 시간 배율 (1: 그대로, 0: 지연 없이)
+
+    # ===== HTTP 엔진 (engine="http" 게시판) =====
+    HTTP_TIMEOUT: float = 30.0           # 요청 타임아웃 (초)
+    HTTP_MAX_CONNECTIONS: int = 32       # 공유 클라이언트 최대 커넥션 수
+    HTTP_MAX_KEEPALIVE: int = 16         # keep-alive 유지 커넥션 수
+    HTTP_DETAIL_CONCURRENCY: int = 8     # 크롤러당 동시 상세 요청 수
+
     model_config = {
         "env_file": ".env",
         "env_file_encoding": "utf-8",
@@ -0,0 +1,170 @@
+"""
+Playwright 브라우저 풀
+프로세스 전역에서 Chromium 하나를 띄워 두고, 크롤러에는 격리된 컨텍스트를 대여합니다.
+"""
+import asyncio
+import logging
+from contextlib import asynccontextmanager
+from typing import Optional, List, Dict, AsyncIterator
+from playwright.async_api import async_playwright, Playwright, Browser, BrowserContext
+
+logger = logging.getLogger(__name__)
+
+
+class BrowserPool:
+    """공유 Chromium 브라우저 풀 관리 클래스"""
+
+    playwright: Optional[Playwright] = None
+    browser: Optional[Browser] = None
+
+    size: int = 4          # 동시에 대여 가능한 컨텍스트 수
+    max_uses: int = 20     # 컨텍스트 재사용 횟수 (초과 시 폐기 후 새로 생성)
+
+    _lock: Optional[asyncio.Lock] = None
+    _slots: Optional[asyncio.Semaphore] = None
+    _idle: List[BrowserContext] = []
+    _uses: Dict[int, int] = {}
+
+    # 통계
+    launches: int = 0      # 브라우저 실행 횟수
+    leases: int = 0        # 컨텍스트 대여 횟수 (풀이 없었다면 = 브라우저 실행 횟수)
+    contexts_created: int = 0
+
+    @classmethod
+    def is_running(cls) -> bool:
+        return cls._slots is not None
+
+    @classmethod
+    async def start(cls, size: Optional[int] = None, max_uses: Optional[int] = None):
+        """풀 시작 (이미 시작되었으면 무시)"""
+        if cls.is_running():
+            return
+
+        from app.config import settings
+        cls.size = size or settings.BROWSER_POOL_SIZE
+        cls.max_uses = max_uses or settings.BROWSER_CONTEXT_MAX_USES
+        cls._lock = asyncio.Lock()
+        cls._slots = asyncio.Semaphore(cls.size)
+        cls._idle = []
+        cls._uses = {}
+
+        await cls._ensure_browser()
+        print(f"브라우저 풀 시작: 컨텍스트 {cls.size}개")
+
+    @classmethod
+    async def stop(cls):
+        """풀 종료 - 모든 컨텍스트와 브라우저 정리"""
+        if not cls.is_running():
+            return
+
+        for context in cls._idle:
+            try:
+                await context.close()
+            except Exception:
+                pass
+        cls._idle = []
+        cls._uses = {}
+
+        if cls.browser:
+            try:
+                await cls.browser.close()
+            except Exception:
+                pass
+        if cls.playwright:
+            await cls.playwright.stop()
+
+        cls.browser = None
+        cls.playwright = None
+        cls._slots = None
+        cls._lock = None
+        print(f"브라우저 풀 종료 ({cls.stats()})")
+
+    @classmethod
+    async def _ensure_browser(cls) -> Browser:
+        """브라우저가 없거나 죽었으면 (재)실행"""
+        async with cls._lock:
+            if cls.browser and cls.browser.is_connected():
+                return cls.browser
+
+            if cls.browser:
+                logger.warning("브라우저 연결 끊김, 재실행")
+                cls._idle = []
+                cls._uses = {}
+
+            if not cls.playwright:
+                cls.playwright = await async_playwright().start()
+            cls.browser = await cls.playwright.chromium.launch(headless=True)
+            cls.launches += 1
+            return cls.browser
+
+    @classmethod
+    async def _release(cls, context: BrowserContext):
+        """컨텍스트 반납 - 페이지/쿠키 정리 후 재사용, 수명이 다하면 폐기"""
+        uses = cls._uses.get(id(context), 0)
+        reusable = (
+            cls.is_running()
+            and cls.browser is not None
+            and cls.browser.is_connected()
+            and uses < cls.max_uses
+        )
+
+        if reusable:
+            try:
+                for page in list(context.pages):
+                    await page.close()
+                await context.clear_cookies()
+                cls._idle.append(context)
+                return
+            except Exception as e:
+                logger.warning(f"컨텍스트 정리 실패, 폐기: {e}")
+
+        cls._uses.pop(id(context), None)
+        try:
+            await context.close()
+        except Exception:
+            pass
+
+    @classmethod
+    @asynccontextmanager
+    async def context(cls) -> AsyncIterator[BrowserContext]:
+        """
+        격리된 브라우저 컨텍스트 대여
+
+        사용법:
+            async with BrowserPool.context() as context:
+                page = await context.new_page()
+        """
+        if not cls.is_running():
+            await cls.start()
+
+        slots = cls._slots
+        async with slots:
+            browser = await cls._ensure_browser()
+
+            context = None
+            while cls._idle:
+                candidate = cls._idle.pop()
+                if candidate.browser is browser:
+                    context = candidate
+                    break
+            if context is None:
+                context = await browser.new_context()
+                cls.contexts_created += 1
+
+            cls._uses[id(context)] = cls._uses.get(id(context), 0) + 1
+            cls.leases += 1
+
+            try:
+                yield context
+            finally:
+                await cls._release(context)
+
+    @classmethod
+    def stats(cls) -> Dict[str, int]:
+        """풀 통계 - launches_saved: 크롤러별 브라우저 실행 대비 절약된 실행 횟수"""
+        return {
+            "launches": cls.launches,
+            "leases": cls.leases,
+            "contexts_created": cls.contexts_created,
+            "launches_saved": max(cls.leases - cls.launches, 0),
+        }
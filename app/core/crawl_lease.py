@@ -0,0 +1,172 @@
+"""
+프로세스 간 크롤링 리스 (MongoDB)
+같은 게시판을 여러 프로세스(API, MCP, 워커)가 동시에 크롤링하지 않도록 crawl_leases 문서 하나를 잡습니다.
+- 획득: 만료되었거나 자기 것인 리스만 원자적으로 가져감 (다른 보유자가 있으면 중복키로 실패)
+- 갱신: 보유 중에는 TTL의 1/3마다 만료 시각 연장 (프로세스가 죽으면 TTL 후 다른 프로세스가 획득)
+- 상실: 갱신에 실패하면 (다른 프로세스가 가져감) 보유 중인 작업을 취소하고 LeaseLostError 발생
+- 같은 프로세스 안에서는 여러 작업이 한 리스를 함께 보유 (워커의 같은 게시판 URL 작업들), 마지막 작업이 끝날 때 반납
+"""
+import os
+import uuid
+import socket
+import asyncio
+import logging
+from contextlib import asynccontextmanager
+from datetime import datetime, timedelta
+from typing import AsyncIterator, Dict, Any, Optional, Set
+from pymongo import ReturnDocument
+from pymongo.errors import DuplicateKeyError
+
+from app.core.database import Database
+
+logger = logging.getLogger(__name__)
+
+
+class LeaseLostError(Exception):
+    """보유 중이던 리스를 다른 프로세스가 가져감 (만료 후 재획득)"""
+
+
+class CrawlLease:
+    """crawl_leases 컬렉션 기반 리스 관리 클래스"""
+
+    # 이 프로세스의 보유자 id
+    owner: str = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+
+    # 이 프로세스에서 보유 중인 리스 (키 → 보유 중인 태스크들 / 갱신 태스크 / 획득 토큰)
+    _holders: Dict[str, Set[asyncio.Task]] = {}
+    _keepers: Dict[str, asyncio.Task] = {}
+    _tokens: Dict[str, Optional[str]] = {}
+
+    # 통계
+    acquired: int = 0
+    busy: int = 0          # 다른 프로세스가 보유 중이라 못 잡은 횟수
+    lost: int = 0          # 갱신 실패로 잃은 횟수
+
+    @classmethod
+    def _ttl(cls) -> timedelta:
+        from app.config import settings
+        return timedelta(seconds=max(1, settings.CRAWL_LEASE_TTL_SEC))
+
+    @classmethod
+    async def acquire(cls, key: str) -> Optional[Dict[str, Any]]:
+        """
+        리스 획득 (만료되었거나 이미 이 프로세스 것이면 성공)
+
+        이미 이 프로세스 것이면 만료 시각만 연장하고 토큰은 그대로 둡니다 (같은 리스를 함께 보유하는 작업이 반납할 때 사용).
+
+        Returns:
+            리스 문서, 다른 프로세스가 보유 중이면 None
+        """
+        now = datetime.utcnow()
+        lease = await cls._extend(key, now)
+        if lease is not None:
+            return lease
+        try:
+            return await Database.crawl_leases().find_one_and_update(
+                {"_id": key, "expires_at": {"$lte": now}},
+                {"$set": {"owner": cls.owner, "token": uuid.uuid4().hex, "acquired_at": now, "expires_at": now + cls._ttl()}},
+                upsert=True,
+                return_document=ReturnDocument.AFTER
+            )
+        except DuplicateKeyError:
+            # 그 사이 누군가 잡음 - 이 프로세스의 다른 작업이면 그 리스를 함께 사용
+            return await cls._extend(key, now)
+
+    @classmethod
+    async def _extend(cls, key: str, now: datetime) -> Optional[Dict[str, Any]]:
+        """이 프로세스 것인 리스의 만료 시각 연장"""
+        return await Database.crawl_leases().find_one_and_update(
+            {"_id": key, "owner": cls.owner},
+            {"$set": {"expires_at": now + cls._ttl()}},
+            return_document=ReturnDocument.AFTER
+        )
+
+    @classmethod
+    async def renew(cls, key: str) -> bool:
+        """만료 시각 연장 - 이미 다른 프로세스가 가져갔으면 False"""
+        result = await Database.crawl_leases().update_one(
+            {"_id": key, "owner": cls.owner},
+            {"$set": {"expires_at": datetime.utcnow() + cls._ttl()}}
+        )
+        return result.matched_count > 0
+
+    @classmethod
+    async def release(cls, key: str, token: Optional[str] = None):
+        """반납 - token이 있으면 그때 잡은 리스일 때만 (그 사이 이 프로세스가 다시 잡은 리스는 유지)"""
+        query: Dict[str, Any] = {"_id": key, "owner": cls.owner}
+        if token is not None:
+            query["token"] = token
+        await Database.crawl_leases().delete_one(query)
+
+    @classmethod
+    async def _keep_alive(cls, key: str) -> bool:
+        """보유 중 주기적 갱신 - 리스를 잃으면 보유 중인 태스크를 모두 취소하고 True 반환"""
+        interval = cls._ttl().total_seconds() / 3
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                renewed = await cls.renew(key)
+            except Exception as e:
+                # 일시적인 DB 오류는 다음 주기에 재시도 (TTL 안에 성공하면 유지)
+                logger.warning(f"리스 갱신 오류 ({key}): {e}")
+                continue
+            if not renewed:
+                cls.lost += 1
+                logger.warning(f"리스 상실, 작업 취소: {key}")
+                for holder in cls._holders.get(key, ()):
+                    holder.cancel()
+                return True
+
+    @classmethod
+    @asynccontextmanager
+    async def hold(cls, key: str) -> AsyncIterator[bool]:
+        """
+        리스를 잡고 있는 동안 실행 (보유 중 자동 갱신, 끝나면 반납)
+
+        사용법:
+            async with CrawlLease.hold(f"board:{board_id}") as acquired:
+                if not acquired:
+                    return  # 다른 프로세스가 크롤링 중
+                ...
+        """
+        if key not in cls._holders:
+            lease = await cls.acquire(key)
+            if lease is None:
+                cls.busy += 1
+                yield False
+                return
+            # acquire를 기다리는 사이 같은 프로세스의 다른 작업이 먼저 잡았으면 그 리스에 합류
+            if key not in cls._holders:
+                cls.acquired += 1
+                cls._holders[key] = set()
+                cls._keepers[key] = asyncio.create_task(cls._keep_alive(key))
+                cls._tokens[key] = lease.get("token")
+
+        holders = cls._holders[key]
+        keeper = cls._keepers[key]
+        token = cls._tokens[key]
+        holder = asyncio.current_task()
+        holders.add(holder)
+        try:
+            yield True
+        except asyncio.CancelledError:
+            # 리스 상실로 인한 취소면 오류로 바꿔 호출자가 처리하게 함
+            if keeper.done() and not keeper.cancelled() and keeper.result():
+                holder.uncancel()
+                raise LeaseLostError(f"리스 상실: {key}") from None
+            raise
+        finally:
+            holders.discard(holder)
+            if not holders:
+                cls._holders.pop(key, None)
+                cls._keepers.pop(key, None)
+                cls._tokens.pop(key, None)
+                keeper.cancel()
+                try:
+                    await cls.release(key, token)
+                except Exception as e:
+                    logger.warning(f"리스 반납 실패 ({key}), TTL 후 만료: {e}")
+
+    @classmethod
+    def stats(cls) -> Dict[str, Any]:
+        return {"owner": cls.owner, "acquired": cls.acquired, "busy": cls.busy, "lost": cls.lost}
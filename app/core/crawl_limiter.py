@@ -0,0 +1,57 @@
+"""
+크롤링 동시성 제한
+게시판/URL을 동시에 크롤링할 때 전체 동시 실행 수와 호스트별 동시 실행 수를 제한합니다.
+"""
+import asyncio
+from contextlib import asynccontextmanager
+from typing import Dict, Optional, AsyncIterator
+from urllib.parse import urlsplit
+
+
+class CrawlLimiter:
+    """전역 + 호스트별 크롤링 슬롯 관리 클래스"""
+
+    _global: Optional[asyncio.Semaphore] = None
+    _hosts: Dict[str, asyncio.Semaphore] = {}
+
+    # 통계
+    running: int = 0
+    peak: int = 0          # 최대 동시 실행 수
+
+    @classmethod
+    def _global_slots(cls) -> asyncio.Semaphore:
+        if cls._global is None:
+            from app.config import settings
+            cls._global = asyncio.Semaphore(max(1, settings.CRAWL_CONCURRENCY))
+        return cls._global
+
+    @classmethod
+    def _host_slots(cls, host: str) -> asyncio.Semaphore:
+        if host not in cls._hosts:
+            from app.config import settings
+            cls._hosts[host] = asyncio.Semaphore(max(1, settings.CRAWL_PER_HOST))
+        return cls._hosts[host]
+
+    @classmethod
+    @asynccontextmanager
+    async def slot(cls, url: str) -> AsyncIterator[None]:
+        """
+        URL 크롤링 슬롯 획득 (호스트 슬롯 → 전역 슬롯 순서, 호스트 대기 중에는 전역 슬롯을 잡지 않음)
+
+        사용법:
+            async with CrawlLimiter.slot(url):
+                ...
+        """
+        host = urlsplit(url).hostname or ""
+        async with cls._host_slots(host):
+            async with cls._global_slots():
+                cls.running += 1
+                cls.peak = max(cls.peak, cls.running)
+                try:
+                    yield
+                finally:
+                    cls.running -= 1
+
+    @classmethod
+    def stats(cls) -> Dict[str, int]:
+        return {"running": cls.running, "peak": cls.peak}
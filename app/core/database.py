@@ -39,6 +39,31 @@ class Database:
         """boards 컬렉션 반환"""
         return cls.db.boards
 
+    @classmethod
+    def notice_history(cls):
+        """notice_history 컬렉션 반환 (공지 이전 버전 diff)"""
+        return cls.db.notice_history
+
+    @classmethod
+    def crawl_jobs(cls):
+        """crawl_jobs 컬렉션 반환 (비동기 크롤링 작업 상태/진행률)"""
+        return cls.db.crawl_jobs
+
+    @classmethod
+    def crawl_leases(cls):
+        """crawl_leases 컬렉션 반환 (프로세스 간 게시판 크롤링 리스)"""
+        return cls.db.crawl_leases
+
+    @classmethod
+    def crawl_tasks(cls):
+        """crawl_tasks 컬렉션 반환 (워커가 가져가는 게시판 URL 크롤링 작업 큐)"""
+        return cls.db.crawl_tasks
+
+    @classmethod
+    def raw_pages(cls):
+        """raw_pages 컬렉션 반환 (상세 페이지 원본 HTML 보관소, gzip)"""
+        return cls.db.raw_pages
+
     @classmethod
     async def create_indexes(cls):
         """인덱스 생성"""
@@ -54,6 +79,27 @@ class Database:
             name="title_content_text"
         )
 
+        # notice_history 인덱스
+        await cls.notice_history().create_index([("notice_id", 1), ("changed_at", -1)])
+
+        # crawl_jobs 인덱스
+        await cls.crawl_jobs().create_index([("status", 1), ("created_at", -1)])
+
+        # crawl_leases 인덱스 (만료된 리스 자동 삭제 - 획득 시에도 만료 여부를 직접 확인)
+        await cls.crawl_leases().create_index("expires_at", expireAfterSeconds=0)
+
+        # crawl_tasks 인덱스 (대기 작업 가져가기, URL당 대기/실행 중 작업 1개, 묶음/작업별 집계)
+        await cls.crawl_tasks().create_index([("status", 1), ("created_at", 1)])
+        await cls.crawl_tasks().create_index(
+            "url", unique=True, partialFilterExpression={"active": True}, name="url_active"
+        )
+        await cls.crawl_tasks().create_index("batch")
+        await cls.crawl_tasks().create_index("job_ids")
+
+        # raw_pages 인덱스 (URL + HTML 해시당 1개, URL별 최신 원본)
+        await cls.raw_pages().create_index([("url", 1), ("html_hash", 1)], unique=True)
+        await cls.raw_pages().create_index([("url", 1), ("fetched_at", -1)])
+
         # boards 인덱스
         await cls.boards().create_index("group")
         await cls.boards().create_index("is_active")
@@ -70,6 +116,7 @@ INITIAL_BOARDS = [
         "group": "전북대",
         "urls": [{"url": "https://www.jbnu.ac.kr/web/news/notice/sub01.do", "name": "학생공지"}],
         "crawler_type": "jbnu",
+        "engine": "http",  # form POST 직접 재현 (실패 시 클릭 방식)
         "color": "#2196F3",
         "is_active": True
     },
@@ -79,6 +126,7 @@ INITIAL_BOARDS = [
         "group": "전북대",
         "urls": [{"url": "https://www.jbnu.ac.kr/web/news/notice/sub02.do", "name": "특강&세미나"}],
         "crawler_type": "jbnu",
+        "engine": "http",  # form POST 직접 재현 (실패 시 클릭 방식)
         "color": "#2196F3",
         "is_active": True
     },
@@ -88,6 +136,7 @@ INITIAL_BOARDS = [
         "group": "전북대",
         "urls": [{"url": "https://www.jbnu.ac.kr/web/news/notice/sub05.do", "name": "공모/스터디"}],
         "crawler_type": "jbnu",
+        "engine": "http",  # form POST 직접 재현 (실패 시 클릭 방식)
         "color": "#2196F3",
         "is_active": True
     },
@@ -102,6 +151,7 @@ INITIAL_BOARDS = [
             {"url": "https://eng.jbnu.ac.kr/freshman/34/notice", "name": "신입생"}
         ],
         "crawler_type": "eng",
+        "engine": "api",  # Vue SPA - 백엔드 JSON 직접 요청 (API 탐색 시에만 브라우저)
         "color": "#9E9E9E",
         "is_active": True
     },
@@ -119,6 +169,7 @@ INITIAL_BOARDS = [
             {"url": "https://csai.jbnu.ac.kr/csai/29109/subview.do", "name": "기타공지"}
         ],
         "crawler_type": "csai",
+        "engine": "http",  # 서버 렌더링 게시판 - 브라우저 없이 HTTP로 크롤링
         "color": "#4CAF50",
         "is_active": True
     },
@@ -130,6 +181,7 @@ INITIAL_BOARDS = [
         "group": "사업단",
         "urls": [{"url": "https://swuniv.jbnu.ac.kr/main/jbnusw?gc=605XOAS", "name": "공지사항"}],
         "crawler_type": "swuniv",
+        "engine": "http",  # 서버 렌더링 게시판 - 브라우저 없이 HTTP로 크롤링
         "color": "#FF9800",
         "is_active": True
     }
@@ -137,9 +189,9 @@ INITIAL_BOARDS = [
 
 
 async def init_boards():
-    """초기 게시판 데이터 입력 (없으면 생성, slug 업데이트)"""
+    """초기 게시판 데이터 입력 (없으면 생성, slug 업데이트, engine은 없을 때만 채움)"""
     for board_data in INITIAL_BOARDS:
-        # slug가 없는 기존 데이터도 업데이트
+        # slug가 없거나 다른 기존 데이터도 업데이트
         await Database.boards().update_one(
             {"name": board_data["name"]},
             {
@@ -148,4 +200,9 @@ async def init_boards():
             },
             upsert=True
         )
+        # engine 도입 전 게시판만 채움 (운영자가 DB에서 고른 engine은 유지)
+        await Database.boards().update_one(
+            {"name": board_data["name"], "engine": {"$exists": False}},
+            {"$set": {"engine": board_data["engine"]}}
+        )
     print(f"초기 게시판 데이터 입력 완료: {len(INITIAL_BOARDS)}개")
@@ -0,0 +1,79 @@
+"""
+본문 추출 프로세스 풀
+상세 HTML → 본문/첨부파일 추출(BeautifulSoup 파싱, 표 변환)은 CPU 작업이라 이벤트 루프를 막지 않도록
+프로세스 전역 ProcessPoolExecutor 하나에서 실행합니다. 브라우저는 HTML만 넘기면 됩니다.
+- EXTRACT_WORKERS=0이면 풀 없이 호출한 자리에서 실행
+- 자식 프로세스가 죽어 풀이 깨지면 이번 작업은 직접 실행하고 다음 작업 때 풀을 새로 만듦
+"""
+import asyncio
+import logging
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Dict, Optional, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class ExtractPool:
+    """공유 추출 프로세스 풀 관리 클래스"""
+
+    executor: Optional[ProcessPoolExecutor] = None
+
+    # 통계
+    pooled: int = 0        # 풀에서 실행한 작업 수
+    inline: int = 0        # 풀 없이 직접 실행한 작업 수
+    restarts: int = 0      # 깨진 풀을 다시 만든 횟수
+
+    @classmethod
+    def _get(cls) -> Optional[ProcessPoolExecutor]:
+        """풀 반환 (없으면 생성, EXTRACT_WORKERS=0이면 None)"""
+        if cls.executor is None:
+            from app.config import settings
+            if settings.EXTRACT_WORKERS <= 0:
+                return None
+            # 이벤트 루프/DB 클라이언트 스레드가 있는 프로세스를 fork하지 않도록 spawn 사용
+            cls.executor = ProcessPoolExecutor(
+                max_workers=settings.EXTRACT_WORKERS,
+                mp_context=multiprocessing.get_context("spawn")
+            )
+        return cls.executor
+
+    @classmethod
+    async def run(cls, fn: Callable[..., T], *args: Any) -> T:
+        """
+        fn(*args)를 풀에서 실행 (fn과 인자는 pickle 가능해야 함 - 모듈 함수, 크롤러 classmethod)
+        """
+        executor = cls._get()
+        if executor is None:
+            cls.inline += 1
+            return fn(*args)
+
+        try:
+            result = await asyncio.get_running_loop().run_in_executor(executor, fn, *args)
+            cls.pooled += 1
+            return result
+        except BrokenProcessPool:
+            logger.warning("추출 프로세스 풀이 깨져 다시 만듦 (이번 작업은 직접 실행)")
+            cls.restarts += 1
+            cls.stop()
+            cls.inline += 1
+            return fn(*args)
+
+    @classmethod
+    def stop(cls):
+        """풀 종료 (대기 중인 작업 취소)"""
+        if cls.executor is not None:
+            cls.executor.shutdown(wait=False, cancel_futures=True)
+            cls.executor = None
+
+    @classmethod
+    def stats(cls) -> Dict[str, Any]:
+        return {
+            "running": cls.executor is not None,
+            "pooled": cls.pooled,
+            "inline": cls.inline,
+            "restarts": cls.restarts,
+        }
@@ -0,0 +1,220 @@
+"""
+호스트별 요청 스케줄러
+브라우저 이동과 HTTP 요청이 같은 호스트별 규칙을 따르도록 합니다.
+- 토큰 버킷: 호스트당 초당 요청 수 제한 (순간 burst 허용)
+- 백오프: 오류/타임아웃/429/5xx 발생 시 지수 증가 + jitter 만큼 다음 요청 지연
+- 서킷 브레이커: 연속 실패가 쌓이면 cool-down 동안 해당 호스트 요청을 바로 실패 처리
+"""
+import time
+import random
+import asyncio
+import logging
+from contextlib import asynccontextmanager
+from typing import Dict, Any, Optional, AsyncIterator, Awaitable, Callable, TypeVar
+from urllib.parse import urlsplit
+
+import httpx
+from playwright.async_api import Error as PlaywrightError, TimeoutError as PlaywrightTimeoutError
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class HostUnavailableError(Exception):
+    """서킷이 열린 호스트 (cool-down 중)"""
+
+
+class HostStatusError(Exception):
+    """호스트 과부하 응답 (429/5xx)"""
+
+    def __init__(self, url: str, status: int, retry_after: Optional[float] = None):
+        super().__init__(f"{status} 응답 ({url})")
+        self.status = status
+        self.retry_after = retry_after
+
+
+def is_host_failure(exc: BaseException) -> bool:
+    """호스트 상태 탓인 실패인지 (백오프/서킷 대상) - 404나 파싱 오류는 제외"""
+    if isinstance(exc, HostStatusError):
+        return True
+    if isinstance(exc, httpx.HTTPStatusError):
+        status = exc.response.status_code
+        return status == 429 or status >= 500
+    if isinstance(exc, (httpx.TransportError, asyncio.TimeoutError)):
+        return True
+    if isinstance(exc, PlaywrightError):
+        return isinstance(exc, PlaywrightTimeoutError) or "net::ERR_" in str(exc)
+    return False
+
+
+def _retry_after(value: Optional[str]) -> Optional[float]:
+    if value and value.strip().isdigit():
+        return float(value.strip())
+    return None
+
+
+class HostSlot:
+    """요청 1건의 슬롯 - 응답 상태를 넘겨 429/5xx를 실패로 기록"""
+
+    def __init__(self, url: str):
+        self.url = url
+
+    def check(self, status: Optional[int], retry_after: Optional[str] = None):
+        """429/5xx면 HostStatusError (슬롯 종료 시 실패로 기록됨)"""
+        if status is not None and (status == 429 or status >= 500):
+            raise HostStatusError(self.url, status, _retry_after(retry_after))
+
+
+class _HostState:
+    """호스트 하나의 토큰 버킷/백오프/서킷 상태"""
+
+    def __init__(self, host: str, rate: float, burst: int):
+        self.host = host
+        self.rate = rate
+        self.burst = burst
+        self.tokens = float(burst)
+        self.updated = time.monotonic()
+        self.lock = asyncio.Lock()
+
+        self.failures = 0            # 연속 실패 수
+        self.not_before = 0.0        # 백오프 - 이 시각 전에는 요청하지 않음
+        self.open_until = 0.0        # 서킷 - 이 시각까지 요청 거부
+
+        # 통계
+        self.requests = 0
+        self.total_failures = 0
+        self.retries = 0
+        self.rejected = 0
+        self.circuit_opens = 0
+        self.waited = 0.0
+
+    def _refill(self, now: float):
+        self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def _reject(self):
+        self.rejected += 1
+        remaining = self.open_until - time.monotonic()
+        raise HostUnavailableError(f"{self.host} 서킷 열림 ({remaining:.0f}초 후 재시도)")
+
+    async def acquire(self):
+        """토큰 1개 획득 (백오프 중이면 그 시각까지, 서킷이 열려 있으면 즉시 실패)"""
+        if self.open_until > time.monotonic():
+            self._reject()
+
+        async with self.lock:
+            while True:
+                now = time.monotonic()
+                if self.open_until > now:
+                    self._reject()
+                self._refill(now)
+
+                wait = self.not_before - now
+                if wait <= 0 and self.tokens >= 1:
+                    self.tokens -= 1
+                    self.requests += 1
+                    return
+                wait = max(wait, (1 - self.tokens) / self.rate)
+                self.waited += wait
+                await asyncio.sleep(wait)
+
+    def succeeded(self):
+        self.failures = 0
+
+    def failed(self, retry_after: Optional[float] = None):
+        """실패 기록 - 지수 백오프 (equal jitter), 연속 실패가 임계값이면 서킷 열기"""
+        from app.config import settings
+        now = time.monotonic()
+        self.failures += 1
+        self.total_failures += 1
+
+        delay = min(settings.HOST_BACKOFF_MAX, settings.HOST_BACKOFF_BASE * 2 ** (self.failures - 1))
+        delay = delay / 2 + random.uniform(0, delay / 2)
+        if retry_after:
+            delay = max(delay, min(retry_after, settings.HOST_BACKOFF_MAX))
+        self.not_before = max(self.not_before, now + delay)
+
+        if self.failures >= settings.HOST_FAILURE_THRESHOLD:
+            self.open_until = now + settings.HOST_COOLDOWN
+            self.circuit_opens += 1
+            # cool-down 후 첫 요청이 또 실패하면 바로 다시 열리도록 실패 수 유지
+            self.failures = settings.HOST_FAILURE_THRESHOLD - 1
+            logger.warning(f"[{self.host}] 연속 실패로 서킷 열림, {settings.HOST_COOLDOWN:.0f}초 동안 요청 중단")
+        else:
+            logger.info(f"[{self.host}] 요청 실패 {self.failures}회, {delay:.1f}초 백오프")
+
+    def to_dict(self) -> Dict[str, Any]:
+        now = time.monotonic()
+        return {
+            "state": "open" if self.open_until > now else ("backoff" if self.not_before > now else "ok"),
+            "requests": self.requests,
+            "failures": self.total_failures,
+            "retries": self.retries,
+            "rejected": self.rejected,
+            "circuit_opens": self.circuit_opens,
+            "throttle_wait_sec": round(self.waited, 3),
+        }
+
+
+class HostScheduler:
+    """호스트별 요청 스케줄러 (브라우저/HTTP 공용)"""
+
+    _hosts: Dict[str, _HostState] = {}
+
+    @classmethod
+    def _state(cls, url: str) -> _HostState:
+        host = urlsplit(url).hostname or ""
+        if host not in cls._hosts:
+            from app.config import settings
+            cls._hosts[host] = _HostState(host, max(0.01, settings.HOST_RATE), max(1, settings.HOST_BURST))
+        return cls._hosts[host]
+
+    @classmethod
+    @asynccontextmanager
+    async def slot(cls, url: str) -> AsyncIterator[HostSlot]:
+        """
+        요청 1건 실행 (재시도 없음) - 토큰 대기 후 실행, 결과로 백오프/서킷 갱신
+
+        사용법:
+            async with HostScheduler.slot(url) as slot:
+                response = await client.get(url)
+                slot.check(response.status_code, response.headers.get("retry-after"))
+        """
+        state = cls._state(url)
+        await state.acquire()
+        try:
+            yield HostSlot(url)
+        except BaseException as e:
+            if is_host_failure(e):
+                state.failed(getattr(e, "retry_after", None))
+            raise
+        else:
+            state.succeeded()
+
+    @classmethod
+    async def run(cls, url: str, fn: Callable[[HostSlot], Awaitable[T]], retries: Optional[int] = None) -> T:
+        """
+        slot 안에서 fn 실행, 호스트 실패면 백오프 후 최대 retries번 재시도
+
+        서킷이 열리면 HostUnavailableError로 바로 실패합니다.
+        """
+        from app.config import settings
+        retries = settings.HOST_RETRIES if retries is None else retries
+        attempt = 0
+        while True:
+            try:
+                async with cls.slot(url) as slot:
+                    return await fn(slot)
+            except HostUnavailableError:
+                raise
+            except Exception as e:
+                if attempt >= retries or not is_host_failure(e):
+                    raise
+                attempt += 1
+                cls._state(url).retries += 1
+                logger.info(f"요청 재시도 {attempt}/{retries} ({url}): {e}")
+
+    @classmethod
+    def stats(cls) -> Dict[str, Dict[str, Any]]:
+        return {host: state.to_dict() for host, state in cls._hosts.items()}
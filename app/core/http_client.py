@@ -0,0 +1,52 @@
+"""
+공유 HTTP 클라이언트
+httpx AsyncClient 하나를 프로세스 전역에서 재사용합니다 (keep-alive 커넥션 풀).
+네트워크 세션 녹화/재생 중이면 응답을 저장/재생하는 transport를 씌웁니다.
+"""
+import httpx
+from typing import Optional
+
+from app.core.net_session import NetSession, SessionTransport
+
+DEFAULT_HEADERS = {
+    "User-Agent": (
+        "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 "
+        "(KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36"
+    ),
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+    "Accept-Language": "ko-KR,ko;q=0.9,en;q=0.8",
+}
+
+
+class HttpClient:
+    """공유 httpx 클라이언트 관리 클래스"""
+
+    client: Optional[httpx.AsyncClient] = None
+
+    @classmethod
+    def get(cls) -> httpx.AsyncClient:
+        """클라이언트 반환 (없으면 생성)"""
+        if cls.client is None or cls.client.is_closed:
+            from app.config import settings
+            limits = httpx.Limits(
+                max_connections=settings.HTTP_MAX_CONNECTIONS,
+                max_keepalive_connections=settings.HTTP_MAX_KEEPALIVE,
+            )
+            transport = None
+            if NetSession.active():
+                transport = SessionTransport(httpx.AsyncHTTPTransport(limits=limits))
+            cls.client = httpx.AsyncClient(
+                headers=DEFAULT_HEADERS,
+                timeout=settings.HTTP_TIMEOUT,
+                follow_redirects=True,
+                limits=limits,
+                transport=transport,
+            )
+        return cls.client
+
+    @classmethod
+    async def close(cls):
+        """클라이언트 종료"""
+        if cls.client is not None:
+            await cls.client.aclose()
+            cls.client = None
@@ -0,0 +1,247 @@
+"""
+크롤링 네트워크 세션 녹화/재생
+라이브 사이트 없이 크롤러 성능 문제/회귀를 재현하도록, 크롤링 중 받은 응답을 저장했다가 그대로 다시 돌려줍니다.
+- record: 브라우저 route(route.fetch)와 공유 httpx 클라이언트(transport)를 거친 모든 응답을 저장
+- replay: 같은 요청에 저장된 응답을 돌려줌 (네트워크 없음), 녹화된 지연 시간 × NET_REPLAY_LATENCY만큼 대기
+
+저장소 (NET_SESSION_DIR):
+- bodies/<sha256>: 응답 본문 (내용 주소 - 같은 본문은 한 번만 저장)
+- index.jsonl: 요청 1건당 한 줄 (요청 키, 출처, 상태, 헤더, 본문 해시, 지연 시간)
+
+같은 요청이 여러 번 녹화되었으면 녹화 순서대로 돌려주고, 다 쓰면 마지막 응답을 반복합니다.
+재생 세션에 없는 요청은 404로 응답합니다 (호스트 재시도/백오프 대상이 아니라 실행이 결정적).
+"""
+import json
+import time
+import asyncio
+import hashlib
+import logging
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import httpx
+from playwright.async_api import Route
+
+logger = logging.getLogger(__name__)
+
+MODES = ("record", "replay")
+
+# 재생 세션에 없는 요청의 404 응답 표시
+MISS_HEADER = "x-replay-miss"
+
+# 저장하는 본문은 디코딩된 바이트라 전송 관련 헤더는 버림
+_DROP_HEADERS = frozenset({"content-encoding", "content-length", "transfer-encoding", "connection", "keep-alive"})
+
+
+def request_key(method: str, url: str, body: Optional[bytes]) -> str:
+    """요청 식별 키 (메서드 + URL + 요청 본문 해시 - JBNU 페이지 이동 POST 구분)"""
+    body_hash = hashlib.sha256(body).hexdigest() if body else ""
+    return f"{method.upper()} {url} {body_hash}"
+
+
+def _keep_headers(headers: Iterable[Tuple[str, str]]) -> List[Tuple[str, str]]:
+    return [(name, value) for name, value in headers if name.lower() not in _DROP_HEADERS]
+
+
+def _header_dict(headers: Iterable[Tuple[str, str]]) -> Dict[str, str]:
+    """Playwright fulfill용 헤더 (같은 이름은 줄바꿈으로 합침 - set-cookie 여러 개)"""
+    merged: Dict[str, str] = {}
+    for name, value in headers:
+        merged[name] = f"{merged[name]}\n{value}" if name in merged else value
+    return merged
+
+
+class NetSession:
+    """네트워크 세션 녹화/재생 관리 클래스 (NET_SESSION이 비어 있으면 아무것도 하지 않음)"""
+
+    mode: Optional[str] = None           # None(사용 안 함) / "record" / "replay"
+    root: Optional[Path] = None
+    latency_scale: float = 1.0
+
+    _started: bool = False
+    _entries: Dict[str, List[Dict[str, Any]]] = {}   # 재생: 요청 키 → 녹화된 응답 (녹화 순서)
+    _served: Dict[str, int] = {}                      # 재생: 요청 키 → 돌려준 횟수
+
+    # 통계
+    recorded: int = 0      # 녹화한 응답 수
+    replayed: int = 0      # 재생한 응답 수
+    misses: int = 0        # 재생 세션에 없어 404로 응답한 요청 수
+    bytes_stored: int = 0  # 새로 저장한 본문 바이트 (중복 본문 제외)
+
+    @classmethod
+    def start(cls, mode: Optional[str] = None, directory: Optional[str] = None, latency_scale: Optional[float] = None):
+        """세션 시작 (인자가 없으면 설정값, 이미 시작되었으면 무시)"""
+        if cls._started:
+            return
+
+        from app.config import settings
+        mode = (settings.NET_SESSION if mode is None else mode) or None
+        if mode is not None and mode not in MODES:
+            raise ValueError(f"알 수 없는 NET_SESSION: {mode} (record/replay)")
+
+        cls.mode = mode
+        cls.root = Path(directory or settings.NET_SESSION_DIR)
+        cls.latency_scale = settings.NET_REPLAY_LATENCY if latency_scale is None else latency_scale
+        cls._entries = {}
+        cls._served = {}
+
+        if mode == "record":
+            (cls.root / "bodies").mkdir(parents=True, exist_ok=True)
+        elif mode == "replay":
+            index = cls.root / "index.jsonl"
+            if not index.exists():
+                raise FileNotFoundError(f"녹화된 세션 없음: {index}")
+            with open(index, encoding="utf-8") as f:
+                for line in f:
+                    if line.strip():
+                        entry = json.loads(line)
+                        cls._entries.setdefault(entry["key"], []).append(entry)
+
+        cls._started = True
+        if mode:
+            logger.info(f"네트워크 세션 {mode}: {cls.root} (녹화된 요청 {len(cls._entries)}종)")
+
+    @classmethod
+    def stop(cls):
+        """세션 종료 (다음 start에서 설정을 다시 읽음)"""
+        cls._started = False
+        cls.mode = None
+        cls._entries = {}
+        cls._served = {}
+
+    @classmethod
+    def active(cls) -> bool:
+        """녹화/재생 중인지 (처음 호출 시 설정값으로 시작)"""
+        if not cls._started:
+            cls.start()
+        return cls.mode is not None
+
+    @classmethod
+    def record(
+        cls,
+        source: str,
+        method: str,
+        url: str,
+        request_body: Optional[bytes],
+        status: int,
+        headers: Iterable[Tuple[str, str]],
+        body: bytes,
+        latency: float
+    ):
+        """응답 1건 저장 (본문은 해시 이름 파일로 한 번만)"""
+        digest = hashlib.sha256(body).hexdigest()
+        path = cls.root / "bodies" / digest
+        if not path.exists():
+            path.write_bytes(body)
+            cls.bytes_stored += len(body)
+
+        entry = {
+            "key": request_key(method, url, request_body),
+            "source": source,
+            "status": status,
+            "headers": _keep_headers(headers),
+            "body": digest,
+            "latency": round(latency, 4),
+        }
+        with open(cls.root / "index.jsonl", "a", encoding="utf-8") as f:
+            f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+        cls.recorded += 1
+
+    @classmethod
+    async def replay(cls, method: str, url: str, request_body: Optional[bytes]) -> Optional[Tuple[Dict[str, Any], bytes]]:
+        """저장된 응답 (녹화된 지연 시간만큼 대기 후), 없으면 None"""
+        key = request_key(method, url, request_body)
+        entries = cls._entries.get(key)
+        if not entries:
+            cls.misses += 1
+            logger.warning(f"재생 세션에 없는 요청: {method} {url}")
+            return None
+
+        served = cls._served.get(key, 0)
+        cls._served[key] = served + 1
+        entry = entries[min(served, len(entries) - 1)]
+
+        delay = entry["latency"] * cls.latency_scale
+        if delay > 0:
+            await asyncio.sleep(delay)
+        cls.replayed += 1
+        return entry, (cls.root / "bodies" / entry["body"]).read_bytes()
+
+    @classmethod
+    async def handle_route(cls, route: Route):
+        """
+        브라우저 요청 처리 (page.route 핸들러, 리소스 차단 정책이 허용한 요청)
+        - record: 실제로 가져와 저장 후 그 응답으로 처리
+        - replay: 저장된 응답으로 처리
+        - 사용 안 함: 그대로 진행
+        """
+        if not cls.active():
+            await route.continue_()
+            return
+
+        request = route.request
+        if cls.mode == "replay":
+            found = await cls.replay(request.method, request.url, request.post_data_buffer)
+            if found is None:
+                await route.fulfill(status=404, headers={MISS_HEADER: "1"}, body=b"")
+                return
+            entry, body = found
+            await route.fulfill(status=entry["status"], headers=_header_dict(entry["headers"]), body=body)
+            return
+
+        started = time.perf_counter()
+        try:
+            response = await route.fetch()
+            body = await response.body()
+        except Exception as e:
+            logger.debug(f"녹화 요청 실패 ({request.url}): {e}")
+            await route.abort("failed")
+            return
+        cls.record(
+            "browser", request.method, request.url, request.post_data_buffer,
+            response.status, [(h["name"], h["value"]) for h in response.headers_array()],
+            body, time.perf_counter() - started
+        )
+        await route.fulfill(response=response, body=body)
+
+    @classmethod
+    def stats(cls) -> Dict[str, Any]:
+        return {
+            "mode": cls.mode,
+            "dir": str(cls.root) if cls.mode else None,
+            "recorded": cls.recorded,
+            "replayed": cls.replayed,
+            "misses": cls.misses,
+            "bytes_stored": cls.bytes_stored,
+        }
+
+
+class SessionTransport(httpx.AsyncBaseTransport):
+    """공유 httpx 클라이언트 transport - record: 실제 transport 응답을 저장, replay: 저장된 응답 (리다이렉트는 hop마다)"""
+
+    def __init__(self, transport: httpx.AsyncBaseTransport):
+        self.transport = transport
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        request_body = await request.aread()
+        url = str(request.url)
+
+        if NetSession.mode == "replay":
+            found = await NetSession.replay(request.method, url, request_body)
+            if found is None:
+                return httpx.Response(404, headers={MISS_HEADER: "1"}, request=request)
+            entry, body = found
+            return httpx.Response(entry["status"], headers=entry["headers"], content=body, request=request)
+
+        started = time.perf_counter()
+        response = await self.transport.handle_async_request(request)
+        try:
+            body = await response.aread()   # content-encoding 디코딩된 본문
+        finally:
+            await response.aclose()
+        headers = _keep_headers(response.headers.multi_items())
+        NetSession.record("http", request.method, url, request_body, response.status_code, headers, body, time.perf_counter() - started)
+        return httpx.Response(response.status_code, headers=headers, content=body, request=request)
+
+    async def aclose(self):
+        await self.transport.aclose()
@@ -2,18 +2,28 @@
 크롤러 모듈
 각 사이트별 크롤러를 제공합니다.
 """
+from typing import Dict, Optional, Type
+
 from .base import BaseCrawler
-from .csai_crawler import CSAICrawler
-from .eng_crawler import EngCrawler
-from .jbnu_crawler import JbnuCrawler
-from .swuniv_crawler import SwunivCrawler
+from .http_engine import HttpEngineMixin
+from .csai_crawler import CSAICrawler, CSAIHttpCrawler
+from .eng_crawler import EngCrawler, EngApiCrawler
+from .jbnu_crawler import JbnuCrawler, JbnuHttpCrawler
+from .swuniv_crawler import SwunivCrawler, SwunivHttpCrawler
 
 __all__ = [
     "BaseCrawler",
+    "HttpEngineMixin",
     "CSAICrawler",
+    "CSAIHttpCrawler",
     "EngCrawler",
+    "EngApiCrawler",
     "JbnuCrawler",
-    "SwunivCrawler"
+    "JbnuHttpCrawler",
+    "SwunivCrawler",
+    "SwunivHttpCrawler",
+    "get_crawler_class",
+    "get_probe_class"
 ]
 
 # 크롤러 타입 매핑
@@ -23,3 +33,38 @@ CRAWLER_MAP = {
     "jbnu": JbnuCrawler,
     "swuniv": SwunivCrawler,
 }
+
+# HTTP 엔진 크롤러 매핑 (board["engine"] == "http"일 때 사용)
+HTTP_CRAWLER_MAP = {
+    "csai": CSAIHttpCrawler,
+    "jbnu": JbnuHttpCrawler,
+    "swuniv": SwunivHttpCrawler,
+}
+
+# SPA 백엔드 JSON 엔진 크롤러 매핑 (board["engine"] == "api"일 때 사용)
+API_CRAWLER_MAP = {
+    "eng": EngApiCrawler,
+}
+
+# 엔진 → 크롤러 매핑 (없는 조합이면 기본 브라우저 크롤러)
+ENGINE_MAP = {
+    "http": HTTP_CRAWLER_MAP,
+    "api": API_CRAWLER_MAP,
+}
+
+
+def get_crawler_class(board: Dict) -> Optional[Type[BaseCrawler]]:
+    """게시판 설정(crawler_type, engine)에 맞는 크롤러 클래스 반환"""
+    crawler_type = board.get("crawler_type")
+    engine_map = ENGINE_MAP.get(board.get("engine"), {})
+    return engine_map.get(crawler_type) or CRAWLER_MAP.get(crawler_type)
+
+
+def get_probe_class(board: Dict) -> Optional[Type[BaseCrawler]]:
+    """
+    변경 탐지(목록 1페이지)용 크롤러 클래스
+
+    브라우저 게시판도 HTTP 엔진 크롤러가 있으면 HTTP로 확인 (지문은 URL/날짜만 쓰므로 엔진과 무관)
+    """
+    engine_map = ENGINE_MAP.get(board.get("engine"), HTTP_CRAWLER_MAP)
+    return engine_map.get(board.get("crawler_type")) or get_crawler_class(board)
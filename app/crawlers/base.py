@@ -3,137 +3,289 @@
 모든 사이트별 크롤러는 이 클래스를 상속합니다.
 """
 import re
+import time
+import asyncio
 import logging
 from abc import ABC, abstractmethod
-from playwright.async_api import async_playwright, Browser, Page
-from datetime import datetime
-from typing import List, Dict, Any, Optional, AsyncGenerator
+from playwright.async_api import BrowserContext, Page
+from datetime import datetime, timedelta
+from typing import List, Dict, Any, Optional, Tuple, AsyncGenerator, Awaitable, Callable
 from bson import ObjectId
+from pymongo import UpdateOne
+from pymongo.errors import BulkWriteError, PyMongoError
 
+from app.config import settings
 from app.core.database import Database
+from app.core.browser_pool import BrowserPool
+from app.core.host_scheduler import HostScheduler, HostSlot
+from app.core.extract_pool import ExtractPool
+from app.core.net_session import NetSession
+from .pipeline import CrawlPipeline, ProgressCallback
+from .html_extract import clean_content, extract_content, extract_links
+from .readiness import Readiness, WaitStats, wait_ready
+from .resource_policy import ResourcePolicy, ResourceStats
+from .versioning import content_hash, version_diff
+from .watermark import Watermark, list_fingerprint, notice_day, refresh_cutoff, refresh_due
+from .raw_archive import save_raw_pages
 
 logger = logging.getLogger(__name__)
 
+# 목록 행 일괄 추출 (row_schema 기반, page.evaluate 1회)
+ROW_EXTRACT_JS = """({rowSelector, schema}) => {
+    const read = (el, spec) => spec.attr ? el.getAttribute(spec.attr) : el.innerText;
+    const pick = (row, spec) => {
+        if (spec.all) {
+            return [...row.querySelectorAll(spec.selector)].map(el => read(el, spec));
+        }
+        let el = row;
+        if (spec.selector) {
+            el = (spec.index !== undefined && spec.index !== null)
+                ? row.querySelectorAll(spec.selector)[spec.index]
+                : row.querySelector(spec.selector);
+        }
+        if (el && spec.child) el = el.querySelector(spec.child);
+        return el ? read(el, spec) : null;
+    };
+    return [...document.querySelectorAll(rowSelector)].map(row => {
+        const out = {};
+        for (const [name, spec] of Object.entries(schema)) out[name] = pick(row, spec);
+        return out;
+    });
+}"""
+
+# 본문 추출 (CONTENT_EXTRACT="browser"일 때, html_extract.extract_content와 같은 결과)
+# 복제한 요소는 렌더링되지 않으므로 innerText가 textContent와 같음
+CONTENT_EXTRACT_JS = """(selector) => {
+    const el = document.querySelector(selector);
+    if (!el) return '';
+    const clone = el.cloneNode(true);
+
+    // table → 파이프 구분 텍스트 (멀티라인 셀 확장)
+    clone.querySelectorAll('table').forEach(table => {
+        let text = '';
+        table.querySelectorAll('tr').forEach(row => {
+            const cells = [...row.querySelectorAll('td, th')];
+            const cellLines = cells.map(c => {
+                return c.innerText.trim().split(/\\n/).map(l => l.trim()).filter(l => l);
+            });
+            const maxLines = Math.max(...cellLines.map(l => l.length));
+
+            if (maxLines <= 1) {
+                text += cellLines.map(l => l[0] || '').join(' | ') + '\\n';
+            } else {
+                for (let i = 0; i < maxLines; i++) {
+                    const row = cellLines.map(l => {
+                        if (l.length === 1) return l[0];
+                        return l[i] || '';
+                    });
+                    text += row.join(' | ') + '\\n';
+                }
+            }
+        });
+        table.replaceWith(document.createTextNode(text));
+    });
+
+    return clone.innerText;
+}"""
+
 
 class BaseCrawler(ABC):
     """기본 크롤러 클래스"""
 
     row_selector: str = "table tbody tr"
+
+    # 목록 N페이지를 이전 페이지 방문 없이 바로 가져올 수 있는지 (True면 list_prefetch만큼 병렬 fetch)
+    random_access_pages: bool = False
+
+    # 목록 행 스키마 - {필드명: 추출 규칙}
+    #   selector: 행 기준 CSS 선택자 (없으면 행 자체)
+    #   index:    selector 매치 중 N번째 요소 (없으면 첫 매치)
+    #   child:    찾은 요소 안에서 다시 찾을 선택자
+    #   attr:     속성값 추출 (없으면 innerText)
+    #   all:      모든 매치의 값을 리스트로
+    # 없는 요소는 None
+    row_schema: Dict[str, Dict[str, Any]] = {}
     base_domain: str = ""
     pagination_param: str = "page"
 
+    # 상세 URL에서 글 번호 추출 (기본: URL의 마지막 숫자) - 워터마크의 같은 날 글 순서 비교용
+    post_id_pattern: str = r"(\d+)\D*$"
+
     # 상세 페이지 선택자
     content_selector: str = ".view-content, .board-view-content, article, .contents"
     attachment_selector: str = "a[href*='download'], a[href*='file'], .file-list a, .attachFile a"
 
-    def __init__(self, board_id: ObjectId, board_name: str):
+    # 첨부파일을 상세 HTML의 링크로 알 수 있는지 (False면 원본 재추출 시 본문만 갱신)
+    html_attachments: bool = True
+
+    # 페이지 준비 조건 (selector 없으면 목록=row_selector, 상세=content_selector)
+    list_ready: Readiness = Readiness(stable=True)
+    detail_ready: Readiness = Readiness(non_empty=True)
+
+    # 준비 조건이 계속 맞지 않을 때 쓰는 고정 대기 (ms)
+    list_settle_ms: int = 2000
+    detail_settle_ms: int = 1000
+
+    # 브라우저 리소스 차단 정책 (이미지/폰트/미디어, 분석 스크립트)
+    resource_policy: ResourcePolicy = ResourcePolicy()
+
+    def __init__(self, board_id: ObjectId, board_name: str, detail_concurrency: Optional[int] = None):
         self.board_id = board_id
         self.board_name = board_name
-        self.playwright = None
-        self.browser: Optional[Browser] = None
+        self.detail_concurrency = max(1, detail_concurrency or settings.DETAIL_CONCURRENCY)
+        self._context_lease = None
+        self.context: Optional[BrowserContext] = None
         self.page: Optional[Page] = None          # 목록 페이지 전용
-        self.detail_page: Optional[Page] = None    # 상세 페이지 전용
+        self.detail_page: Optional[Page] = None    # 상세 페이지 전용 (detail_pages[0])
+        self.detail_pages: List[Page] = []         # 상세 페이지 풀 (동시 fetch)
+        self._free_detail_pages: Optional[asyncio.Queue] = None
+        self.wait_stats = {
+            "list": WaitStats(f"{board_name} 목록", self.list_settle_ms),
+            "detail": WaitStats(f"{board_name} 상세", self.detail_settle_ms),
+        }
+        self.resource_stats = ResourceStats(self.base_domain)
+        self._known: Dict[str, Dict[str, Any]] = {}   # select_for_detail에서 조회한 기존 문서 (url → 문서)
+        self._newest: Optional[Watermark] = None      # parse_list에서 본 가장 최신 글
+        self._list_end: Optional[str] = None          # parse_list 종료 이유
+        self._fingerprint: Optional[str] = None       # parse_list에서 읽은 목록 1페이지 지문
+        self._refresh_cutoff: Optional[str] = None    # 최근 공지 재확인 순회 중이면 재확인 구간의 가장 오래된 게시일
+        self._raw_pages: List[Dict[str, str]] = []    # 아직 보관하지 않은 상세 원본 HTML
 
     async def __aenter__(self):
-        self.playwright = await async_playwright().start()
-        self.browser = await self.playwright.chromium.launch(headless=True)
-        self.page = await self.browser.new_page()
-        self.detail_page = await self.browser.new_page()
+        # 공유 브라우저 풀에서 격리된 컨텍스트 대여 (브라우저 실행 X)
+        self._context_lease = BrowserPool.context()
+        self.context = await self._context_lease.__aenter__()
+        try:
+            self.page = await self._new_page()
+            self._free_detail_pages = asyncio.Queue()
+            for _ in range(self.detail_concurrency):
+                detail_page = await self._new_page()
+                self.detail_pages.append(detail_page)
+                self._free_detail_pages.put_nowait(detail_page)
+            self.detail_page = self.detail_pages[0]
+        except BaseException as e:
+            await self._context_lease.__aexit__(type(e), e, e.__traceback__)
+            raise
         return self
 
+    async def _new_page(self) -> Page:
+        """대여한 컨텍스트에 탭 생성 (리소스 차단 정책, 네트워크 세션 녹화/재생 적용)"""
+        page = await self.context.new_page()
+        if settings.RESOURCE_BLOCKING:
+            await self.resource_policy.apply(page, self.resource_stats)
+        elif NetSession.active():
+            await page.route("**/*", NetSession.handle_route)
+        return page
+
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        if self.detail_page:
-            await self.detail_page.close()
-        if self.page:
-            await self.page.close()
-        if self.browser:
-            await self.browser.close()
-        if self.playwright:
-            await self.playwright.stop()
+        # 페이지 정리 및 컨텍스트 반납은 풀이 담당
+        if self._context_lease:
+            await self._context_lease.__aexit__(exc_type, exc_val, exc_tb)
+        self._context_lease = None
+        self.context = None
+        self.page = None
+        self.detail_page = None
+        self.detail_pages = []
+        self._free_detail_pages = None
 
     @abstractmethod
-    async def parse_row(self, row, base_url: str) -> Optional[Dict[str, Any]]:
-        """목록에서 단일 행 파싱 - 각 크롤러가 구현"""
+    def parse_row(self, row: Dict[str, Any], base_url: str) -> Optional[Dict[str, Any]]:
+        """
+        목록에서 단일 행 파싱 - 각 크롤러가 구현
+
+        Args:
+            row: row_schema로 추출한 원시 값 ({필드명: 텍스트/속성값/리스트/None})
+        """
         pass
 
-    async def _extract_content(self, selector: str) -> str:
-        """DOM에서 본문 추출 (표→파이프 구분, AI/MCP 가독성 최적화)"""
-        content = await self.detail_page.evaluate("""(selector) => {
-            const el = document.querySelector(selector);
-            if (!el) return '';
-            const clone = el.cloneNode(true);
-
-            // table → 파이프 구분 텍스트 (멀티라인 셀 확장)
-            clone.querySelectorAll('table').forEach(table => {
-                let text = '';
-                table.querySelectorAll('tr').forEach(row => {
-                    const cells = [...row.querySelectorAll('td, th')];
-                    const cellLines = cells.map(c => {
-                        return c.innerText.trim().split(/\\n/).map(l => l.trim()).filter(l => l);
-                    });
-                    const maxLines = Math.max(...cellLines.map(l => l.length));
-
-                    if (maxLines <= 1) {
-                        text += cellLines.map(l => l[0] || '').join(' | ') + '\\n';
-                    } else {
-                        for (let i = 0; i < maxLines; i++) {
-                            const row = cellLines.map(l => {
-                                if (l.length === 1) return l[0];
-                                return l[i] || '';
-                            });
-                            text += row.join(' | ') + '\\n';
-                        }
-                    }
-                });
-                table.replaceWith(document.createTextNode(text));
-            });
+    async def _wait_ready(self, page: Page, kind: str) -> str:
+        """
+        kind("list"/"detail")의 준비 조건까지 대기
+
+        Returns:
+            "ready" / "empty" / "timeout" / "fallback"
+        """
+        if kind == "list":
+            ready, default_selector = self.list_ready, self.row_selector
+        else:
+            ready, default_selector = self.detail_ready, self.content_selector
+        return await wait_ready(page, ready, ready.selector or default_selector, self.wait_stats[kind])
 
-            return clone.innerText;
-        }""", selector)
+    async def _goto(self, page: Page, url: str, kind: str) -> str:
+        """
+        DOM 로드까지 이동 후 준비 조건 대기 (networkidle + 고정 대기 대체)
 
-        content = content.replace('\xa0', ' ')
-        content = re.sub(r'^[ \t]+$', '', content, flags=re.MULTILINE)
-        content = re.sub(r'\n{3,}', '\n\n', content)
-        return content.strip()
+        이동은 호스트 스케줄러를 거침 (요청 속도 제한, 실패 시 백오프 후 재시도, 서킷 열림 시 즉시 실패)
+        """
+        async def navigate(slot: HostSlot):
+            response = await page.goto(url, wait_until="domcontentloaded", timeout=30000)
+            if response is not None:
+                slot.check(response.status, response.headers.get("retry-after"))
+
+        started = time.perf_counter()
+        await HostScheduler.run(url, navigate)
+        self.wait_stats[kind].load += time.perf_counter() - started
+        return await self._wait_ready(page, kind)
+
+    async def _extract_rows(self, page: Optional[Page] = None) -> List[Dict[str, Any]]:
+        """현재 목록 페이지의 모든 행을 row_schema대로 한 번에 추출 (브라우저 왕복 1회)"""
+        page = page or self.page
+        return await page.evaluate(
+            ROW_EXTRACT_JS,
+            {"rowSelector": self.row_selector, "schema": self.row_schema}
+        )
 
-    async def parse_detail(self, url: str) -> Dict[str, Any]:
+    async def _extract_content(self, selector: str, page: Optional[Page] = None, html: Optional[str] = None) -> str:
         """
-        상세 페이지에서 본문과 첨부파일 파싱 (detail_page 사용)
+        상세 페이지 본문 추출 (표→파이프 구분, AI/MCP 가독성 최적화)
+
+        브라우저에서는 HTML만 받아 추출 프로세스 풀에서 Python으로 변환합니다 (html을 주면 그대로 사용).
+        CONTENT_EXTRACT="browser"면 브라우저에서 CONTENT_EXTRACT_JS로 추출 (결과는 같음)
+        """
+        page = page or self.detail_page
+        if settings.CONTENT_EXTRACT == "browser":
+            return clean_content(await page.evaluate(CONTENT_EXTRACT_JS, selector))
+        if html is None:
+            html = await page.content()
+        return await ExtractPool.run(extract_content, html, selector)
+
+    async def _extract_detail(self, html: str) -> Dict[str, Any]:
+        """상세 HTML → 본문/첨부파일 (추출 프로세스 풀)"""
+        return await ExtractPool.run(type(self).extract_detail_html, html)
+
+    async def _page_html(self, url: str, page: Page) -> str:
+        """렌더링된 상세 페이지 HTML (원본 보관 대기열에도 추가)"""
+        html = await page.content()
+        if settings.RAW_ARCHIVE:
+            self._archive_raw(url, html)
+        return html
+
+    async def parse_detail(self, url: str, page: Optional[Page] = None) -> Dict[str, Any]:
+        """
+        상세 페이지에서 본문과 첨부파일 파싱 (page 미지정 시 detail_page 사용)
 
         Returns:
             {"content": "본문 내용", "attachments": [{"name": "파일명", "url": "링크"}]}
         """
+        page = page or self.detail_page
         try:
-            await self.detail_page.goto(url, wait_until="networkidle", timeout=30000)
-            await self.detail_page.wait_for_timeout(1000)
+            await self._goto(page, url, "detail")
+            html = await self._page_html(url, page)
+            if settings.CONTENT_EXTRACT != "browser":
+                return await self._extract_detail(html)
 
             # 본문 추출 (표→파이프 구분, AI/MCP 가독성 최적화)
-            content = await self._extract_content(self.content_selector)
+            content = await self._extract_content(self.content_selector, page)
 
             # 첨부파일 추출
-            attachments = []
-            file_els = await self.detail_page.query_selector_all(self.attachment_selector)
+            links = []
+            file_els = await page.query_selector_all(self.attachment_selector)
             for file_el in file_els:
                 try:
-                    href = await file_el.get_attribute("href")
-                    name = await file_el.inner_text()
-                    name = name.strip()
-
-                    # 유효한 파일 링크만
-                    if href and name and len(name) < 200:
-                        # 상대 URL 변환
-                        if href.startswith("/"):
-                            href = f"{self.base_domain}{href}"
-                        elif not href.startswith("http"):
-                            continue
-
-                        # 외부 링크 제외 (같은 도메인만)
-                        if self.base_domain and self.base_domain not in href:
-                            continue
-
-                        attachments.append({"name": name, "url": href})
+                    links.append((await file_el.get_attribute("href"), await file_el.inner_text()))
                 except Exception:
                     continue
+            attachments = self._filter_attachments(links)
 
             return {"content": content, "attachments": attachments}
 
@@ -141,6 +293,102 @@ class BaseCrawler(ABC):
             logger.error(f"[{self.board_name}] 상세 페이지 파싱 오류 ({url}): {e}")
             return {"content": "", "attachments": []}
 
+    @classmethod
+    def extract_detail_html(cls, html: str) -> Dict[str, Any]:
+        """
+        상세 HTML → 본문/첨부파일 (브라우저 없이 - 추출 프로세스 풀, 원본 재추출에서 실행)
+
+        Returns:
+            {"content": "...", "attachments": [...]} - html_attachments가 False면 attachments는 None
+        """
+        return {
+            "content": extract_content(html, cls.content_selector),
+            "attachments": cls._filter_attachments(extract_links(html, cls.attachment_selector)) if cls.html_attachments else None,
+        }
+
+    def _archive_raw(self, url: str, html: str, kind: str = "page"):
+        """상세 원본 HTML을 보관 대기열에 추가 (save_notices에서 공지와 함께 저장)"""
+        if html:
+            self._raw_pages.append({"url": url, "html": html, "kind": kind})
+
+    async def _flush_raw_pages(self):
+        pages, self._raw_pages = self._raw_pages, []
+        await save_raw_pages(self.board_id, pages)
+
+    @classmethod
+    def _filter_attachments(cls, links: List[Tuple[Optional[str], str]]) -> List[Dict[str, str]]:
+        """(href, 텍스트) 목록에서 유효한 같은 도메인 파일 링크만 첨부파일로 변환"""
+        attachments = []
+        for href, name in links:
+            name = (name or "").strip()
+
+            # 유효한 파일 링크만
+            if not href or not name or len(name) >= 200:
+                continue
+
+            # 상대 URL 변환
+            if href.startswith("/"):
+                href = f"{cls.base_domain}{href}"
+            elif not href.startswith("http"):
+                continue
+
+            # 외부 링크 제외 (같은 도메인만)
+            if cls.base_domain and cls.base_domain not in href:
+                continue
+
+            attachments.append({"name": name, "url": href})
+        return attachments
+
+    async def _fetch_detail(self, notice: Dict[str, Any]) -> Dict[str, Any]:
+        """상세 페이지 풀에서 빈 탭을 빌려 상세 파싱"""
+        page = await self._free_detail_pages.get()
+        try:
+            logger.info(f"[{self.board_name}] 상세 크롤링: {notice['title'][:30]}")
+            return await self.parse_detail(notice["url"], page)
+        finally:
+            self._free_detail_pages.put_nowait(page)
+
+    async def fetch_details(self, notices: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        여러 공지의 상세 페이지를 동시에 파싱 (최대 detail_concurrency개)
+
+        Returns:
+            notices와 같은 순서의 상세 결과 목록
+        """
+        return await asyncio.gather(*(self._fetch_detail(notice) for notice in notices))
+
+    def post_id(self, url: str) -> Optional[int]:
+        """상세 URL의 글 번호 (없으면 None)"""
+        match = re.search(self.post_id_pattern, url)
+        return int(match.group(1)) if match else None
+
+    def _mark(self, notice: Dict[str, Any]) -> Watermark:
+        return Watermark(notice["url"], notice.get("date"), self.post_id(notice["url"]))
+
+    def list_fingerprint(self, rows: List[Dict[str, Any]], url: str) -> str:
+        """목록 1페이지 원시 행 → 상단 PROBE_ROWS개 글의 지문 (parse_list와 probe가 같은 계산 사용)"""
+        marks = []
+        for row in rows:
+            try:
+                notice = self.parse_row(row, url)
+            except Exception:
+                continue
+            if notice:
+                marks.append(self._mark(notice))
+            if len(marks) >= settings.PROBE_ROWS:
+                break
+        return list_fingerprint(marks)
+
+    async def probe(self, url: str) -> str:
+        """목록 1페이지만 가져와 지문 계산 (HTTP/API 엔진이면 브라우저 없이)"""
+        rows = await self._fetch_rows(url, 1)
+        return self.list_fingerprint(rows or [], url)
+
+    def _list_url(self, url: str, page_num: int) -> str:
+        """목록 N페이지 URL"""
+        separator = "&" if "?" in url else "?"
+        return f"{url}{separator}{self.pagination_param}={page_num}"
+
     async def _navigate_to_page(self, url: str, page_num: int) -> bool:
         """
         페이지 이동 - 서브클래스에서 오버라이드하여 페이지네이션 방식 변경
@@ -148,134 +396,483 @@ class BaseCrawler(ABC):
         Returns:
             True: 이동 성공, False: 더 이상 페이지 없음
         """
-        separator = "&" if "?" in url else "?"
-        page_url = f"{url}{separator}{self.pagination_param}={page_num}"
-        await self.page.goto(page_url, wait_until="networkidle", timeout=30000)
-        await self.page.wait_for_timeout(2000)
+        await self._goto(self.page, self._list_url(url, page_num), "list")
         return True
 
-    async def parse_list(self, url: str, max_pages: Optional[int] = None, min_year: int = 2025) -> AsyncGenerator[List[Dict[str, Any]], None]:
-        """목록 페이지 파싱 - 페이지 단위로 yield (메모리 절약)"""
+    async def _fetch_rows(self, url: str, page_num: int) -> Optional[List[Dict[str, Any]]]:
+        """
+        목록 N페이지의 원시 행 추출
+
+        Returns:
+            행 목록, None이면 더 이상 페이지 없음
+        """
+        if not await self._navigate_to_page(url, page_num):
+            return None
+        return await self._extract_rows()
+
+    async def parse_list(
+        self,
+        url: str,
+        max_pages: Optional[int] = None,
+        min_year: int = 2025,
+        watermark: Optional[Watermark] = None,
+        start_page: int = 1
+    ) -> AsyncGenerator[List[Dict[str, Any]], None]:
+        """
+        목록 페이지 파싱 - 페이지 단위로 yield (메모리 절약)
+
+        random_access_pages 크롤러는 list_prefetch개 페이지를 동시에 가져오고,
+        결과는 항상 페이지 순서대로 처리합니다.
+        watermark가 있으면 그 글이 나온 (또는 전부 그보다 이전 글인) 페이지까지만 읽습니다.
+        최근 공지 재확인 순회 중(_refresh_cutoff)이면 재확인 구간의 글이 있는 페이지는 워터마크를 지나도 계속 읽습니다.
+        가장 최신 글은 _newest, 종료 이유는 _list_end에 남깁니다.
+        start_page는 중단된 작업을 이어서 크롤링할 때 사용합니다.
+        """
         logger.info(f"[{self.board_name}] 크롤링 시작: {url} (min_year={min_year})")
-        current_page = 1
+        window = max(1, settings.LIST_PREFETCH) if self.random_access_pages else 1
+        # 체크포인트가 max_pages를 넘으면 (그 사이 max_pages가 줄어든 경우) 마지막 페이지부터
+        start_page = max(1, min(start_page, max_pages) if max_pages else start_page)
+        current_page = start_page
         stop_crawling = False
+        previous_urls: List[str] = []   # 직전 페이지 공지 URL (범위 밖 페이지에 마지막 페이지를 주는 사이트 감지)
+        self._newest = None
+        self._list_end = "last_page"
+        self._fingerprint = None
 
         while not stop_crawling:
-            if not await self._navigate_to_page(url, current_page):
+            # 워터마크가 있으면 보통 1페이지에서 끝나므로 첫 페이지는 단독으로 요청
+            size = 1 if watermark and current_page == start_page and self._refresh_cutoff is None else window
+            page_nums = list(range(current_page, current_page + size))
+            if max_pages:
+                page_nums = [n for n in page_nums if n <= max_pages]
+            if not page_nums:
+                self._list_end = "max_pages"
                 break
+            fetched = await asyncio.gather(*(self._fetch_rows(url, n) for n in page_nums))
 
-            rows = await self.page.query_selector_all(self.row_selector)
-            logger.info(f"[{self.board_name}] 페이지 {current_page}: {len(rows)}행")
+            for page_num, rows in zip(page_nums, fetched):
+                if rows is None:
+                    stop_crawling = True
+                    break
 
-            if not rows:
-                break
+                logger.info(f"[{self.board_name}] 페이지 {page_num}: {len(rows)}행")
 
-            page_notices = []
-            for row in rows:
-                try:
-                    notice = await self.parse_row(row, url)
-                    if not notice:
-                        continue
+                if page_num == 1:
+                    self._fingerprint = self.list_fingerprint(rows, url)
 
-                    # 연도 체크
-                    if notice.get("date"):
-                        try:
-                            year = int(notice["date"][:4])
-                            if year < min_year:
-                                logger.info(f"[{self.board_name}] {min_year}년 이전 글 발견, 크롤링 중단")
-                                stop_crawling = True
-                                break
-                        except (ValueError, IndexError):
-                            pass
-
-                    page_notices.append(notice)
-
-                except Exception as e:
-                    logger.error(f"[{self.board_name}] 행 파싱 오류: {e}")
-                    continue
+                if not rows:
+                    stop_crawling = True
+                    break
+
+                page_notices = []
+                marks = []
+                for row in rows:
+                    try:
+                        notice = self.parse_row(row, url)
+                        if not notice:
+                            continue
 
-            if page_notices:
-                yield page_notices
+                        # 연도 체크
+                        if notice.get("date"):
+                            try:
+                                year = int(notice["date"][:4])
+                                if year < min_year:
+                                    logger.info(f"[{self.board_name}] {min_year}년 이전 글 발견, 크롤링 중단")
+                                    self._list_end = "min_year"
+                                    stop_crawling = True
+                                    break
+                            except (ValueError, IndexError):
+                                pass
+
+                        page_notices.append(notice)
+                        mark = self._mark(notice)
+                        marks.append(mark)
+                        if mark.date and (self._newest is None or mark.key() > self._newest.key()):
+                            self._newest = mark
+
+                    except Exception as e:
+                        logger.error(f"[{self.board_name}] 행 파싱 오류: {e}")
+                        continue
 
-            if not page_notices or stop_crawling:
-                break
+                urls = [notice["url"] for notice in page_notices]
+                if urls and urls == previous_urls:
+                    logger.info(f"[{self.board_name}] 페이지 {page_num}: 이전 페이지와 같은 목록, 마지막 페이지 도달")
+                    stop_crawling = True
+                    break
+                previous_urls = urls
+
+                if page_notices:
+                    yield page_notices
+
+                if not page_notices or stop_crawling:
+                    stop_crawling = True
+                    break
+
+                if watermark and watermark.reached(marks) and self.in_refresh_window(page_notices):
+                    logger.info(f"[{self.board_name}] 페이지 {page_num}: 워터마크 이후지만 재확인 구간({self._refresh_cutoff}~)이라 계속")
+                elif watermark and watermark.reached(marks):
+                    logger.info(f"[{self.board_name}] 페이지 {page_num}에서 워터마크({watermark.date}) 도달, 크롤링 중단")
+                    self._list_end = "watermark"
+                    stop_crawling = True
+                    break
+
+                if max_pages and page_num >= max_pages:
+                    logger.info(f"[{self.board_name}] 최대 페이지({max_pages}) 도달")
+                    self._list_end = "max_pages"
+                    stop_crawling = True
+                    break
+
+            current_page += size
+
+    def in_refresh_window(self, page_notices: List[Dict[str, Any]]) -> bool:
+        """재확인 순회 중이고 페이지에 게시일이 재확인 구간 안인 글이 있는지 (워터마크/연속 no-new 중단 보류)"""
+        if self._refresh_cutoff is None:
+            return False
+        return any((notice_day(notice.get("date")) or "") >= self._refresh_cutoff for notice in page_notices)
+
+    def _refresh_reason(self, notice: Dict[str, Any], doc: Optional[Dict[str, Any]], now: datetime) -> Optional[str]:
+        """
+        상세를 (다시) 가져올 이유 - None이면 건너뜀
 
-            if max_pages and current_page >= max_pages:
-                logger.info(f"[{self.board_name}] 최대 페이지({max_pages}) 도달")
-                break
+        - new: DB에 없음
+        - metadata: 목록의 제목/날짜/작성자가 저장된 값과 다름
+        - empty: 본문이 비어 있고 DETAIL_EMPTY_RETRY_HOURS가 지남
+        - age: 게시일이 DETAIL_REFRESH_MAX_AGE_DAYS 이내이고 마지막 확인 후 DETAIL_REFRESH_HOURS가 지남
+
+        워터마크/변경 탐지는 새 글이 없으면 1페이지에서 끝나므로, 기존 글의 metadata/age는
+        URL마다 DETAIL_REFRESH_HOURS에 한 번 도는 재확인 순회(crawl_url)에서 판단됩니다.
+        """
+        if doc is None:
+            return "new"
+        if any((notice.get(key) or None) != (doc.get(key) or None) for key in ("title", "date", "author")):
+            return "metadata"
+
+        checked_at = doc.get("detail_checked_at") or doc.get("crawled_at")
+        if not doc.get("has_content"):
+            if checked_at is None or now - checked_at >= timedelta(hours=settings.DETAIL_EMPTY_RETRY_HOURS):
+                return "empty"
+            return None
+
+        if checked_at is None or now - checked_at < timedelta(hours=settings.DETAIL_REFRESH_HOURS):
+            return None
+        try:
+            posted = datetime.strptime((notice.get("date") or "")[:10], "%Y-%m-%d")
+        except ValueError:
+            return None
+        if now - posted <= timedelta(days=settings.DETAIL_REFRESH_MAX_AGE_DAYS):
+            return "age"
+        return None
+
+    async def select_for_detail(self, page_notices: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        상세 크롤링 대상 선별 (_refresh_reason 정책)
 
-            current_page += 1
+        페이지 전체 URL을 $in 쿼리 한 번으로 조회하고, 목록 메타데이터/해시/확인 시각만 받아 메모리에서 판단.
+        조회한 문서는 save_notices에서 변경 여부 판단에 사용합니다.
+        """
+        if not page_notices:
+            return []
+
+        cursor = Database.notices().find(
+            {"url": {"$in": [notice["url"] for notice in page_notices]}},
+            {
+                "_id": 0,
+                "url": 1,
+                "title": 1,
+                "date": 1,
+                "author": 1,
+                "content_hash": 1,
+                "crawled_at": 1,
+                "detail_checked_at": 1,
+                "has_content": {"$gt": [{"$strLenCP": {"$ifNull": ["$content", ""]}}, 0]},
+            }
+        )
+        existing = {doc["url"]: doc async for doc in cursor}
+
+        now = datetime.utcnow()
+        targets = []
+        reasons: Dict[str, int] = {}
+        for notice in page_notices:
+            doc = existing.get(notice["url"])
+            reason = self._refresh_reason(notice, doc, now)
+            if reason is None:
+                continue
+            reasons[reason] = reasons.get(reason, 0) + 1
+            if doc is not None:
+                self._known[notice["url"]] = doc
+            targets.append(notice)
+
+        if reasons:
+            logger.info(f"[{self.board_name}] 상세 대상 {len(targets)}/{len(page_notices)}건 {reasons}")
+        return targets
+
+    def _upsert_spec(self, notice: Dict[str, Any], notice_hash: str, now: datetime) -> Tuple[Dict[str, Any], Dict[str, Any], bool]:
+        """공지 1건 전체 저장 (filter, update, upsert)"""
+        return (
+            {"url": notice["url"]},
+            {
+                "$set": {
+                    "title": notice["title"],
+                    "author": notice.get("author"),
+                    "date": notice["date"],
+                    "content": notice.get("content", ""),
+                    "attachments": notice.get("attachments", []),
+                    "content_hash": notice_hash,
+                    "detail_checked_at": now,
+                    "board_id": self.board_id,
+                    "board_name": self.board_name,
+                },
+                "$setOnInsert": {
+                    "crawled_at": now
+                }
+            },
+            True
+        )
 
-    async def crawl_and_save(self, urls: List[Dict[str, str]], max_pages: Optional[int] = None, min_year: int = 2025) -> Dict[str, int]:
-        """크롤링 실행 및 MongoDB 저장 - 페이지 단위로 즉시 저장"""
-        total_new = 0
-        total_updated = 0
+    def _touch_spec(self, notice: Dict[str, Any], known: Dict[str, Any], notice_hash: str, now: datetime) -> Tuple[Dict[str, Any], Dict[str, Any], bool]:
+        """내용이 같은 공지 - 확인 시각, 달라진 목록 메타데이터(제목/날짜/작성자), 해시 없던 문서는 해시만 갱신 (filter, update, upsert)"""
+        fields: Dict[str, Any] = {"detail_checked_at": now}
+        for key in ("title", "date", "author"):
+            if (notice.get(key) or None) != (known.get(key) or None):
+                fields[key] = notice.get(key)
+        if known.get("content_hash") != notice_hash:
+            fields["content_hash"] = notice_hash
+        return ({"url": notice["url"]}, {"$set": fields}, False)
+
+    async def _bulk_save(self, specs: List[Tuple[Dict, Dict, bool]]) -> Dict[str, int]:
+        """
+        specs를 unordered bulk_write로 저장 - {"new": 추가, "modified": 갱신, "saved": 성공한 문서 수}
 
-        for url_info in urls:
+        일부 문서가 실패해도 나머지는 그대로 저장한 뒤 실패한 문서만 개별 재시도합니다.
+        """
+        if not specs:
+            return {"new": 0, "modified": 0, "saved": 0}
+        ops = [UpdateOne(query, update, upsert=upsert) for query, update, upsert in specs]
+        try:
+            result = await Database.notices().bulk_write(ops, ordered=False)
+            return {"new": result.upserted_count, "modified": result.modified_count, "saved": len(specs)}
+        except BulkWriteError as e:
+            details = e.details
+            write_errors = details.get("writeErrors", [])
+            retried = await self._retry_failed(specs, write_errors)
+            return {
+                "new": details.get("nUpserted", 0) + retried["new"],
+                "modified": details.get("nModified", 0) + retried["modified"],
+                "saved": len(specs) - len(write_errors) + retried["saved"],
+            }
+
+    async def _retry_failed(self, specs: List[Tuple[Dict, Dict, bool]], write_errors: List[Dict[str, Any]]) -> Dict[str, int]:
+        """bulk_write에서 실패한 문서만 개별 재시도 (동시 upsert 중복키 경합 등)"""
+        new = 0
+        modified = 0
+        saved = 0
+        for error in write_errors:
+            query, update, upsert = specs[error["index"]]
             try:
-                no_new_pages = 0  # 연속으로 new=0인 페이지 수
+                result = await Database.notices().update_one(query, update, upsert=upsert)
+                saved += 1
+                if result.upserted_id:
+                    new += 1
+                elif result.modified_count:
+                    modified += 1
+            except PyMongoError as e:
+                logger.error(f"[{self.board_name}] 공지 저장 실패 ({query['url']}): {error.get('errmsg')} / 재시도: {e}")
+        return {"new": new, "modified": modified, "saved": saved}
+
+    async def _load_versions(self, urls: List[str]) -> Dict[str, Dict[str, Any]]:
+        """해시가 달라진 공지의 현재 저장 버전 (이력 diff용)"""
+        if not urls:
+            return {}
+        cursor = Database.notices().find(
+            {"url": {"$in": urls}},
+            {"url": 1, "title": 1, "content": 1, "attachments": 1, "content_hash": 1}
+        )
+        return {doc["url"]: doc async for doc in cursor}
 
-                async for page_notices in self.parse_list(url_info["url"], max_pages=max_pages, min_year=min_year):
-                    page_new = 0
+    async def save_notices(self, notices: List[Dict[str, Any]]) -> Dict[str, int]:
+        """
+        상세까지 채운 공지 저장 - DB_BATCH_SIZE개씩 unordered bulk_write
 
-                    for notice in page_notices:
-                        # 이미 존재하는 공지인지 확인
-                        existing = await Database.notices().find_one({"url": notice["url"]})
+        제목/본문/첨부파일 해시가 저장된 해시와 같으면 확인 시각과 달라진 날짜/작성자만 갱신(unchanged)하고,
+        다르면 전체를 갱신하면서 이전 버전을 notice_history에 diff로 남깁니다.
+        일부 문서가 실패해도 나머지는 그대로 저장한 뒤 실패한 문서만 개별 재시도합니다.
+        """
+        new = 0
+        updated = 0
+        unchanged = 0
+        batch_size = max(1, settings.DB_BATCH_SIZE)
+        now = datetime.utcnow()
+
+        for start in range(0, len(notices), batch_size):
+            batch = notices[start:start + batch_size]
+            hashes = [content_hash(notice) for notice in batch]
+            known = [self._known.pop(notice["url"], None) for notice in batch]
+
+            # 해시가 다른(또는 해시 도입 전) 기존 문서만 본문까지 조회
+            versions = await self._load_versions([
+                notice["url"] for notice, doc, notice_hash in zip(batch, known, hashes)
+                if doc is not None and doc.get("content_hash") != notice_hash
+            ])
+
+            specs = []
+            touches = []    # 내용이 같아 확인 시각/메타데이터만 갱신
+            history = []
+            for notice, doc, notice_hash in zip(batch, known, hashes):
+                old = versions.get(notice["url"])
+                if doc is not None and (doc.get("content_hash") == notice_hash or (old and content_hash(old) == notice_hash)):
+                    touches.append(self._touch_spec(notice, doc, notice_hash, now))
+                    continue
 
-                        # 이미 content까지 있으면 스킵
-                        if existing and existing.get("content"):
-                            continue
+                # 본문이 있던 공지의 상세를 못 가져왔으면 (빈 결과) 기존 내용 유지, 다음 크롤링에 재시도
+                if doc is not None and doc.get("has_content") and not notice.get("content") and not notice.get("attachments"):
+                    logger.warning(f"[{self.board_name}] 상세 결과가 비어 기존 내용 유지: {notice['url']}")
+                    continue
 
-                        # 새 공지이거나 content가 없으면 상세 페이지 크롤링
-                        logger.info(f"[{self.board_name}] 상세 크롤링: {notice['title'][:30]}")
-                        detail = await self.parse_detail(notice["url"])
-                        notice["content"] = detail["content"]
-                        notice["attachments"] = detail["attachments"]
-
-                        # DB 저장
-                        result = await Database.notices().update_one(
-                            {"url": notice["url"]},
-                            {
-                                "$set": {
-                                    "title": notice["title"],
-                                    "author": notice.get("author"),
-                                    "date": notice["date"],
-                                    "content": notice.get("content", ""),
-                                    "attachments": notice.get("attachments", []),
-                                    "board_id": self.board_id,
-                                    "board_name": self.board_name,
-                                },
-                                "$setOnInsert": {
-                                    "crawled_at": datetime.utcnow()
-                                }
-                            },
-                            upsert=True
-                        )
-
-                        if result.upserted_id:
-                            total_new += 1
-                            page_new += 1
-                        elif result.modified_count:
-                            total_updated += 1
-
-                    logger.info(f"[{self.board_name}] 페이지 저장 완료: page_new={page_new}, total_new={total_new}, total_updated={total_updated}")
-
-                    # 연속 2페이지 new=0이면 이전 데이터 도달로 판단, 중단
-                    if page_new == 0:
-                        no_new_pages += 1
-                        if no_new_pages >= 2:
-                            logger.info(f"[{self.board_name}] 새 공지 없음 (연속 {no_new_pages}페이지), 크롤링 중단")
-                            break
-                    else:
-                        no_new_pages = 0
-
-            except Exception as e:
-                logger.error(f"[{self.board_name}] 크롤링 오류: {e}")
-                continue
+                if doc is not None:
+                    diff = version_diff(old, notice) if old else {}
+                    if diff:
+                        history.append({
+                            "notice_id": old["_id"],
+                            "url": notice["url"],
+                            "board_id": self.board_id,
+                            "changed_at": now,
+                            "prev_hash": old.get("content_hash") or content_hash(old),
+                            "hash": notice_hash,
+                            "diff": diff,
+                        })
+                specs.append(self._upsert_spec(notice, notice_hash, now))
+
+            # 확인 시각 갱신도 modified로 집계되므로 전체 저장과 따로 써서 updated에 섞이지 않게 함
+            saved = await self._bulk_save(specs)
+            new += saved["new"]
+            updated += saved["modified"]
+            unchanged += (await self._bulk_save(touches))["saved"]
+
+            if history:
+                try:
+                    await Database.notice_history().insert_many(history, ordered=False)
+                except PyMongoError as e:
+                    logger.error(f"[{self.board_name}] 이력 저장 실패: {e}")
+
+        await self._flush_raw_pages()
+        return {"new": new, "updated": updated, "unchanged": unchanged}
 
-        await Database.boards().update_one(
-            {"_id": self.board_id},
-            {"$set": {"last_crawled_at": datetime.utcnow()}}
+    async def _save_list_state(self, url_info: Dict[str, Any], previous: Optional[Watermark], end: Optional[str]):
+        """
+        크롤링을 끝까지 마친 URL의 워터마크(이번에 본 가장 최신 글)와 1페이지 지문, 재확인 순회 시각 갱신 (boards.urls.$)
+
+        이전 워터마크가 있는데 max_pages로 먼저 끊겼으면 그 사이 글을 아직 못 읽은 것이므로 모두 유지합니다.
+        """
+        url = url_info["url"]
+        if end == "max_pages" and (previous is not None or self._refresh_cutoff is not None):
+            logger.info(f"[{self.board_name}] 워터마크/재확인 구간 전에 최대 페이지 도달, 워터마크 유지: {url}")
+            return
+
+        fields: Dict[str, Any] = {}
+        if self._refresh_cutoff is not None:
+            fields["urls.$.refreshed_at"] = datetime.utcnow()
+        newest = self._newest
+        if newest is not None and (previous is None or newest.url != previous.url):
+            fields["urls.$.watermark"] = newest.to_dict()
+        if self._fingerprint and self._fingerprint != url_info.get("fingerprint"):
+            fields["urls.$.fingerprint"] = self._fingerprint
+        if not fields:
+            return
+
+        try:
+            await Database.boards().update_one({"_id": self.board_id, "urls.url": url}, {"$set": fields})
+            if "urls.$.watermark" in fields:
+                logger.info(f"[{self.board_name}] 워터마크 갱신: {newest.date} #{newest.post_id} ({url})")
+        except PyMongoError as e:
+            logger.error(f"[{self.board_name}] 워터마크 저장 실패 ({url}): {e}")
+
+    async def crawl_url(
+        self,
+        url_info: Dict[str, Any],
+        max_pages: Optional[int] = None,
+        min_year: int = 2025,
+        progress: Optional[ProgressCallback] = None,
+        checkpoint: Optional[Callable[[Dict[str, Any]], Awaitable[None]]] = None,
+        resume: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """
+        URL 하나 크롤링 및 저장 - 목록 → 상세 → 저장 파이프라인(CrawlPipeline)
+
+        목록 탐색, 상세 크롤링, DB 저장이 서로 다른 페이지에 대해 동시에 진행됩니다.
+        url_info["watermark"]가 있으면 그 지점까지만 읽고, 오류 없이 끝나면 워터마크/지문을 갱신합니다.
+        progress를 주면 목록 페이지/상세/저장 건수를 단계마다 보고합니다.
+        checkpoint를 주면 목록 페이지 저장마다 {"page", "url", "newest", "fingerprint"}를 넘기고,
+        그 체크포인트를 resume으로 주면 마지막으로 저장한 페이지부터 다시 크롤링합니다 (작업 큐 워커).
+
+        Returns:
+            {"new": 0, "updated": 0, "unchanged": 0, "stages": {...}}
+        """
+        watermark = Watermark.from_dict(url_info.get("watermark")) if settings.CRAWL_WATERMARK else None
+
+        # DETAIL_REFRESH_HOURS마다 한 번은 워터마크를 지나 재확인 구간 끝까지 읽음 (metadata/age 재확인)
+        now = datetime.utcnow()
+        self._refresh_cutoff = refresh_cutoff(now) if refresh_due(url_info, now) else None
+        if self._refresh_cutoff is not None:
+            logger.info(f"[{self.board_name}] 최근 공지 재확인 순회 ({self._refresh_cutoff} 이후 게시): {url_info['url']}")
+
+        # 삭제된 글로 목록이 당겨졌을 수 있으므로 마지막 저장 페이지부터 다시 읽음 (이미 저장된 글은 unchanged)
+        start_page = resume["page"] if resume and resume.get("page") else 1
+        if start_page > 1:
+            logger.info(f"[{self.board_name}] 체크포인트에서 이어서 크롤링: {start_page}페이지 ({url_info['url']})")
+
+        async def save_checkpoint(page_num: int, last_url: Optional[str]):
+            await checkpoint({
+                "page": page_num,
+                "url": last_url,
+                "newest": self._newest.to_dict() if self._newest else None,
+                "fingerprint": self._fingerprint
+            })
+
+        pipeline = CrawlPipeline(
+            self,
+            url_info["url"],
+            max_pages=max_pages,
+            min_year=min_year,
+            queue_size=settings.PIPELINE_QUEUE_SIZE,
+            watermark=watermark,
+            progress=progress,
+            start_page=start_page,
+            checkpoint=save_checkpoint if checkpoint else None
         )
+        result = await pipeline.run()
+        await self._flush_raw_pages()
 
-        return {"new": total_new, "updated": total_updated}
+        # 중단 전 실행에서 본 최신 글/1페이지 지문과 합침
+        if start_page > 1:
+            earlier = Watermark.from_dict(resume.get("newest"))
+            if earlier is not None and (self._newest is None or earlier.key() > self._newest.key()):
+                self._newest = earlier
+            self._fingerprint = self._fingerprint or resume.get("fingerprint")
+
+        end = "no_new" if pipeline.stop.is_set() else self._list_end
+        await self._save_list_state(url_info, watermark, end)
+        return result
+
+    async def crawl_stats(self) -> Dict[str, Any]:
+        """
+        이 크롤러의 페이지 대기/리소스 차단 통계
+
+        Returns:
+            {"waits": {"list": {...}, "detail": {...}}, "resources": {...}}
+        """
+        waits = {kind: stats.to_dict() for kind, stats in self.wait_stats.items() if stats.pages}
+        if waits:
+            logger.info(f"[{self.board_name}] 페이지 대기 통계: {waits}")
+
+        resources = {}
+        if self.resource_stats.allowed or self.resource_stats.blocked:
+            await self.resource_stats.flush()
+            resources = self.resource_stats.to_dict()
+            # 크기를 측정하지 않으면(RESOURCE_MEASURE_BLOCKED=false) 절약 바이트는 미상
+            if resources["bytes_avoided"] is None:
+                saved = "절약 크기 미상"
+            else:
+                saved = f"{resources['bytes_avoided'] / 1024:.0f}KB 절약, 크기 미상 {resources['unsized']}건"
+            logger.info(f"[{self.board_name}] 리소스 차단: {resources['blocked']}건 ({saved})")
+
+        return {"waits": waits, "resources": resources}
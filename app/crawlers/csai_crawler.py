@@ -4,6 +4,8 @@ URL 패턴: csai.jbnu.ac.kr/csai/{board_id}/subview.do
 """
 from typing import Dict, Any, Optional
 from .base import BaseCrawler
+from .readiness import Readiness
+from .http_engine import HttpEngineMixin
 
 
 class CSAICrawler(BaseCrawler):
@@ -14,27 +16,32 @@ class CSAICrawler(BaseCrawler):
     content_selector = ".artclView"
     attachment_selector = ".artclItem a[href*='download'], .artclItem a[href*='file'], .file-wrap a"
 
-    async def parse_row(self, row, base_url: str) -> Optional[Dict[str, Any]]:
+    row_schema = {
+        "class": {"attr": "class"},
+        "num": {"selector": "td:nth-child(1)"},
+        "title": {"selector": "td.artclTitle a, td a"},
+        "href": {"selector": "td.artclTitle a, td a", "attr": "href"},
+        "author": {"selector": "td:nth-child(3)"},   # 작성자 (3번째 열)
+        "date": {"selector": "td:nth-child(4)"},     # 날짜 (4번째 열)
+    }
+
+    list_ready = Readiness(stable=True)
+    detail_ready = Readiness(non_empty=True)   # 이미지만 있는 글은 로드 완료 후 빈 페이지로 판정
+
+    def parse_row(self, row: Dict[str, Any], base_url: str) -> Optional[Dict[str, Any]]:
         """단일 행 파싱"""
         # 상단 고정 공지 건너뛰기 (class="headline" 또는 번호가 숫자가 아닌 경우)
-        row_class = await row.get_attribute("class") or ""
+        row_class = row.get("class") or ""
         if "headline" in row_class:
             return None
 
-        num_el = await row.query_selector("td:nth-child(1)")
-        if num_el:
-            num_text = await num_el.inner_text()
-            if not num_text.strip().isdigit():
-                return None
-
-        title_el = await row.query_selector("td.artclTitle a, td a")
-        if not title_el:
+        num_text = row.get("num")
+        if num_text is not None and not num_text.strip().isdigit():
             return None
 
-        title = await title_el.inner_text()
-        href = await title_el.get_attribute("href")
-
-        if not href:
+        title = row.get("title")
+        href = row.get("href")
+        if title is None or not href:
             return None
 
         # 상대 URL을 절대 URL로 변환
@@ -43,19 +50,10 @@ class CSAICrawler(BaseCrawler):
         else:
             full_url = href
 
-        # 날짜 (4번째 열)
-        date_el = await row.query_selector("td:nth-child(4)")
-        date_text = ""
-        if date_el:
-            date_text = await date_el.inner_text()
-            date_text = date_text.strip().replace(".", "-")
+        date_text = (row.get("date") or "").strip().replace(".", "-")
 
-        # 작성자 (3번째 열)
-        author_el = await row.query_selector("td:nth-child(3)")
-        author = None
-        if author_el:
-            author = await author_el.inner_text()
-            author = author.strip() if author else None
+        author = row.get("author")
+        author = author.strip() if author else None
 
         return {
             "url": full_url,
@@ -63,3 +61,7 @@ class CSAICrawler(BaseCrawler):
             "date": date_text,
             "author": author
         }
+
+
+class CSAIHttpCrawler(HttpEngineMixin, CSAICrawler):
+    """컴퓨터인공지능학부 크롤러 (HTTP 엔진, 브라우저 없음)"""
@@ -2,10 +2,24 @@
 공과대학 크롤러
 URL 패턴: eng.jbnu.ac.kr/{path}/notice
 Vue SPA 기반 - 상세 URL에 ?type=board 필수, 첨부파일은 버튼 클릭 다운로드
+EngApiCrawler는 SPA가 호출하는 백엔드 JSON을 직접 요청 (브라우저는 API 탐색 시 1회만)
 """
+import re
+import asyncio
 import logging
-from typing import Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
+from bson import ObjectId
+from playwright.async_api import Page
+
+from app.config import settings
+from app.core.host_scheduler import HostScheduler
+from app.core.extract_pool import ExtractPool
 from .base import BaseCrawler
+from .readiness import Readiness
+from .resource_policy import ResourcePolicy
+from .http_engine import HttpEngineMixin
+from .html_extract import extract_content
+from .spa_api import Endpoint, CapturedJson, Path, capture_json, iter_nodes, iter_record_lists, get_path, find_key
 
 logger = logging.getLogger(__name__)
 
@@ -17,18 +31,37 @@ class EngCrawler(BaseCrawler):
     base_domain = "https://eng.jbnu.ac.kr"
     content_selector = ".content_wrap"
 
-    async def parse_detail(self, url: str) -> Dict[str, Any]:
+    # 첨부파일은 버튼 클릭 다운로드라 HTML 링크로 알 수 없음
+    html_attachments = False
+
+    row_schema = {
+        "cells": {"selector": "td", "all": True},
+        "title": {"selector": "td", "index": 1, "child": "a"},
+    }
+
+    # SPA는 문서 로드 후 API 응답으로 그려지므로 빈 페이지 판정을 늦게
+    list_ready = Readiness(stable=True, empty_after_ms=3000)
+    detail_ready = Readiness(non_empty=True, empty_after_ms=3000)
+    detail_settle_ms = 2000
+
+    # 자체 Vue 번들은 반드시 허용 (차단 패턴과 겹쳐도 우선, API는 xhr/fetch라 기본 허용)
+    resource_policy = ResourcePolicy(allow_patterns=(
+        r"^https://eng\.jbnu\.ac\.kr/.*\.(js|css)(\?|$)",
+    ))
+
+    async def parse_detail(self, url: str, page: Optional[Page] = None) -> Dict[str, Any]:
         """ENG 상세 페이지 파싱 - 첨부파일은 button 클릭으로 다운로드 URL 추출"""
+        page = page or self.detail_page
         try:
-            await self.detail_page.goto(url, wait_until="networkidle", timeout=30000)
-            await self.detail_page.wait_for_timeout(2000)
+            await self._goto(page, url, "detail")
 
             # 본문 추출 (표→파이프 구분, AI/MCP 가독성 최적화)
-            content = await self._extract_content(self.content_selector)
+            html = await self._page_html(url, page)
+            content = await self._extract_content(self.content_selector, page, html)
 
             # 첨부파일 추출 - 버튼 클릭 → download 이벤트에서 URL 캡처
             attachments = []
-            file_items = await self.detail_page.query_selector_all(".file_item")
+            file_items = await page.query_selector_all(".file_item")
             for item in file_items:
                 try:
                     name_el = await item.query_selector("span")
@@ -41,7 +74,7 @@ class EngCrawler(BaseCrawler):
                     if not name:
                         continue
 
-                    async with self.detail_page.expect_download(timeout=5000) as download_info:
+                    async with page.expect_download(timeout=5000) as download_info:
                         await btn.click()
                     download = await download_info.value
                     download_url = download.url
@@ -57,35 +90,32 @@ class EngCrawler(BaseCrawler):
             logger.error(f"[공과대학] 상세 페이지 파싱 오류 ({url}): {e}")
             return {"content": "", "attachments": []}
 
-    async def parse_row(self, row, base_url: str) -> Optional[Dict[str, Any]]:
+    def parse_row(self, row: Dict[str, Any], base_url: str) -> Optional[Dict[str, Any]]:
         """단일 행 파싱"""
-        cells = await row.query_selector_all("td")
+        cells = row.get("cells") or []
         if len(cells) < 4:
             return None
 
         # td[0]: 글 번호
-        post_id = await cells[0].inner_text()
-        post_id = post_id.strip()
+        post_id = (cells[0] or "").strip()
         if not post_id.isdigit():
             return None
 
         # td[1]: 제목
-        title_el = await cells[1].query_selector("a")
-        if not title_el:
+        title = row.get("title")
+        if title is None:
             return None
-        title = await title_el.inner_text()
         title = title.strip()
 
         # URL 생성 (Vue SPA - type=board 파라미터 필수)
         full_url = f"{base_url}/detail/{post_id}?type=board"
 
         # td[2]: 작성자
-        author = await cells[2].inner_text()
+        author = cells[2]
         author = author.strip() if author else None
 
         # td[3]: 날짜
-        date_text = await cells[3].inner_text()
-        date_text = date_text.strip()[:10]
+        date_text = (cells[3] or "").strip()[:10]
 
         return {
             "url": full_url,
@@ -93,3 +123,256 @@ class EngCrawler(BaseCrawler):
             "date": date_text,
             "author": author
         }
+
+
+class EngApi:
+    """목록 URL별로 찾아낸 SPA 백엔드 API 정보"""
+
+    def __init__(self, list_endpoint: Endpoint, items_path: Path, keys: Dict[str, Optional[str]]):
+        self.list_endpoint = list_endpoint
+        self.items_path = items_path
+        self.keys = keys                                  # {"id", "title", "author", "date"} → 레코드 키
+        self.detail_endpoint: Optional[Endpoint] = None
+        self.content_path: Optional[Path] = None
+        self.file_name_key: Optional[str] = None
+        self.file_key: Optional[str] = None               # 다운로드 URL에 들어가는 파일 레코드 키
+        self.file_url_template: Optional[str] = None      # "...{file}..."
+        self.sample_detail: Any = None                    # 탐색 때 받은 상세 JSON
+
+    def to_row(self, record: Dict[str, Any]) -> Dict[str, Any]:
+        """JSON 레코드 → row_schema 형식 (EngCrawler.parse_row 그대로 사용)"""
+        def text(name: str) -> str:
+            key = self.keys.get(name)
+            value = record.get(key) if key else None
+            return "" if value is None else str(value)
+
+        return {"cells": [text("id"), text("title"), text("author"), text("date")], "title": text("title")}
+
+
+class EngApiCrawler(HttpEngineMixin, EngCrawler):
+    """
+    공과대학 크롤러 (SPA 백엔드 JSON 엔진)
+
+    목록 URL마다 한 번만 브라우저로 SPA를 띄워 목록/상세/첨부파일 JSON 요청을 캡처하고,
+    렌더링된 행과 값을 맞춰 레코드 키를 알아낸 뒤 이후 요청은 모두 HTTP로 재현합니다.
+    찾아낸 API는 프로세스 전역에 캐시되어 다음 크롤링부터는 브라우저를 띄우지 않습니다.
+    API를 찾지 못하면 기존 렌더링 방식으로 대체합니다.
+    """
+
+    engine = "api"
+
+    # 목록 요청에서 페이지 번호로 볼 파라미터 이름
+    page_keys = ("page", "pageNo", "pageIndex", "currentPage", "pageNum", "curPage", "p")
+
+    _apis: Dict[str, EngApi] = {}  # 목록 URL → API (프로세스 전역 캐시)
+
+    def __init__(self, board_id: ObjectId, board_name: str, detail_concurrency: Optional[int] = None):
+        super().__init__(board_id, board_name, detail_concurrency)
+        self._failed: set = set()
+        self._discover_lock = asyncio.Lock()
+        self._list_lock = asyncio.Lock()
+
+    @staticmethod
+    def _list_base(detail_url: str) -> str:
+        return detail_url.split("/detail/")[0]
+
+    async def _api(self, url: str) -> Optional[EngApi]:
+        """목록 URL의 API (없으면 브라우저로 한 번 캡처해 찾기)"""
+        if url in self._apis or url in self._failed:
+            return self._apis.get(url)
+
+        async with self._discover_lock:
+            if url in self._apis or url in self._failed:
+                return self._apis.get(url)
+            try:
+                api = await self._discover(url)
+            except Exception as e:
+                logger.warning(f"[{self.board_name}] API 탐색 오류 ({url}): {e}")
+                api = None
+
+            if api is None:
+                logger.warning(f"[{self.board_name}] API를 찾지 못함, 렌더링 방식으로 대체 ({url})")
+                self._failed.add(url)
+            else:
+                logger.info(f"[{self.board_name}] API 탐색 완료: 목록 {api.list_endpoint.url}, 상세 {api.detail_endpoint.url}")
+                self._apis[url] = api
+            return api
+
+    async def _discover(self, url: str) -> Optional[EngApi]:
+        """목록/상세 페이지를 렌더링하며 JSON 요청을 캡처하고 렌더링 결과와 대조해 API 정보 구성"""
+        await self._ensure_browser()
+        page = self.page
+
+        async with self._list_lock:
+            captured = await capture_json(page, lambda: EngCrawler._navigate_to_page(self, url, 1))
+            rows = await EngCrawler._extract_rows(self, page)
+
+        sample = next((n for n in (self.parse_row(r, url) for r in rows) if n), None)
+        if not sample:
+            return None
+        post_id = sample["url"].split("/detail/")[1].split("?")[0]
+
+        api = self._match_list(captured, sample, post_id)
+        if api is None:
+            return None
+
+        # 상세 API
+        detail_page = await self._free_detail_pages.get()
+        try:
+            async def open_detail():
+                async with HostScheduler.slot(sample["url"]):
+                    await detail_page.goto(sample["url"], wait_until="networkidle", timeout=30000)
+
+            captured = await capture_json(detail_page, open_detail)
+            if not self._match_detail(api, captured, post_id):
+                return None
+            try:
+                await self._learn_file_template(api, detail_page)
+            except Exception as e:
+                # 템플릿 없이도 본문은 API로, 첨부파일은 렌더링 방식으로 처리 가능
+                logger.warning(f"[{self.board_name}] 첨부파일 URL 캡처 실패: {e}")
+        finally:
+            self._free_detail_pages.put_nowait(detail_page)
+
+        return api
+
+    def _match_list(self, captured: List[CapturedJson], sample: Dict[str, Any], post_id: str) -> Optional[EngApi]:
+        """렌더링된 첫 행(번호/제목/작성자/날짜)과 값이 같은 레코드 목록을 가진 응답 찾기"""
+        title = sample["title"]
+        for response in captured:
+            for path, records in iter_record_lists(response.data):
+                for record in records:
+                    id_key = find_key(record, lambda v: not isinstance(v, bool) and str(v) == post_id)
+                    title_key = find_key(record, lambda v: isinstance(v, str) and v.strip() == title)
+                    if not id_key or not title_key:
+                        continue
+
+                    keys = {
+                        "id": id_key,
+                        "title": title_key,
+                        "author": find_key(record, lambda v: isinstance(v, str) and bool(sample["author"]) and v.strip() == sample["author"]),
+                        "date": find_key(record, lambda v: isinstance(v, str) and bool(sample["date"]) and v.strip()[:10] == sample["date"]),
+                    }
+                    endpoint = Endpoint.from_captured(response).templated(1, "page", keys=self.page_keys)
+                    if not endpoint.has("page"):
+                        continue
+                    return EngApi(endpoint, path, keys)
+        return None
+
+    def _match_detail(self, api: EngApi, captured: List[CapturedJson], post_id: str) -> bool:
+        """post_id로 요청했고 HTML 본문(가장 긴 HTML 문자열)을 가진 응답 찾기"""
+        best = None
+        for response in captured:
+            endpoint = Endpoint.from_captured(response).templated(post_id, "id")
+            if not endpoint.has("id"):
+                continue
+            for path, value in iter_nodes(response.data):
+                if isinstance(value, str) and "<" in value and (best is None or len(value) > best[0]):
+                    best = (len(value), endpoint, path, response.data)
+        if best is None:
+            return False
+
+        _, api.detail_endpoint, api.content_path, data = best
+        api.sample_detail = data
+        return True
+
+    @staticmethod
+    def _find_files(data: Any) -> Tuple[Optional[List[Dict[str, Any]]], Optional[str]]:
+        """상세 JSON에서 첨부파일 레코드 목록과 파일명 키 찾기"""
+        for _, records in iter_record_lists(data):
+            name_key = find_key(records[0], lambda v: isinstance(v, str) and re.search(r"\.\w{2,5}$", v.strip()) is not None)
+            if name_key:
+                return records, name_key
+        return None, None
+
+    @staticmethod
+    def _match_file_url(api: EngApi, record: Dict[str, Any], name_key: str, download_url: str):
+        """파일 레코드 값 중 다운로드 URL에 들어 있는 값(긴 것 우선)으로 URL 템플릿 구성"""
+        values = sorted(
+            (
+                (key, str(value)) for key, value in record.items()
+                if key != name_key and value not in (None, "") and not isinstance(value, (bool, dict, list))
+            ),
+            key=lambda kv: len(kv[1]),
+            reverse=True
+        )
+        for key, value in values:
+            if value in download_url:
+                api.file_key = key
+                api.file_url_template = download_url.replace(value, "{file}")
+                return
+
+    async def _learn_file_template(self, api: EngApi, page: Page):
+        """렌더링된 상세 페이지에서 첫 첨부파일 다운로드 URL을 한 번 캡처해 파일 URL 템플릿 구성"""
+        files, name_key = self._find_files(api.sample_detail)
+        if not files:
+            return
+
+        button = await page.query_selector(".file_item button")
+        if not button:
+            return
+        async with page.expect_download(timeout=5000) as download_info:
+            await button.click()
+        download = await download_info.value
+        download_url = download.url
+        await download.cancel()
+
+        self._match_file_url(api, files[0], name_key, download_url)
+
+    async def _fetch_rows(self, url: str, page_num: int) -> Optional[List[Dict[str, Any]]]:
+        api = await self._api(url)
+        if api is None:
+            await self._ensure_browser()
+            async with self._list_lock:
+                return await EngCrawler._fetch_rows(self, url, page_num)
+
+        data = await api.list_endpoint.fetch(self.client, page=page_num)
+        records = get_path(data, api.items_path) or []
+        return [api.to_row(record) for record in records if isinstance(record, dict)]
+
+    def _archive_fragment(self, url: str, html: str):
+        """상세 JSON의 본문 HTML 조각 보관 (렌더링 방식으로 대체하면 페이지 전체를 보관)"""
+        if settings.RAW_ARCHIVE:
+            self._archive_raw(url, html, kind="fragment")
+
+    async def parse_detail(self, url: str, page: Optional[Page] = None) -> Dict[str, Any]:
+        """상세 JSON → 본문/첨부파일 (첨부파일 URL 템플릿을 모르면 렌더링 방식으로 대체)"""
+        api = self._apis.get(self._list_base(url))
+        post_id = url.split("/detail/")[1].split("?")[0] if "/detail/" in url else None
+        files, name_key = None, None
+
+        if api and api.detail_endpoint and post_id:
+            try:
+                data = await api.detail_endpoint.fetch(self.client, id=post_id)
+                html = get_path(data, api.content_path) or ""
+                content = await ExtractPool.run(extract_content, f"<div>{html}</div>", "div")
+
+                files, name_key = self._find_files(data)
+                if not files:
+                    self._archive_fragment(url, html)
+                    return {"content": content, "attachments": []}
+                if api.file_url_template and api.file_key:
+                    attachments = [
+                        {
+                            "name": str(record.get(name_key) or "").strip(),
+                            "url": api.file_url_template.replace("{file}", str(record.get(api.file_key))),
+                        }
+                        for record in files
+                        if record.get(name_key) and record.get(api.file_key) is not None
+                    ]
+                    self._archive_fragment(url, html)
+                    return {"content": content, "attachments": attachments}
+            except Exception as e:
+                logger.warning(f"[{self.board_name}] 상세 API 요청 실패 ({e}), 렌더링 방식으로 대체 ({url})")
+
+        await self._ensure_browser()
+        page = await self._free_detail_pages.get()
+        try:
+            detail = await EngCrawler.parse_detail(self, url, page)
+        finally:
+            self._free_detail_pages.put_nowait(page)
+
+        # 렌더링 방식으로 받은 첨부파일 URL로 템플릿 학습 (다음 공지부터 API만 사용)
+        if api and files and detail["attachments"] and not api.file_url_template:
+            self._match_file_url(api, files[0], name_key, detail["attachments"][0]["url"])
+        return detail
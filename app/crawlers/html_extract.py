@@ -0,0 +1,221 @@
+"""
+HTML 추출 유틸리티 (브라우저 없이 동작)
+BeautifulSoup으로 파싱한 HTML에서 row_schema 행 추출, 본문/첨부파일 추출을 수행합니다.
+BaseCrawler의 브라우저(JS) 추출과 같은 규칙을 따릅니다.
+"""
+import re
+from typing import List, Dict, Any, Optional, Tuple, Iterator
+from bs4 import BeautifulSoup, Tag, NavigableString
+from bs4.element import Comment, Declaration, Doctype, ProcessingInstruction
+
+# JS String.prototype.trim()이 제거하는 공백 문자
+JS_WHITESPACE = (
+    "\t\n\v\f\r \u00a0\u1680\u2000\u2001\u2002\u2003\u2004\u2005\u2006"
+    "\u2007\u2008\u2009\u200a\u2028\u2029\u202f\u205f\u3000\ufeff"
+)
+
+# textContent에 포함되지 않는 노드
+_NON_TEXT = (Comment, Declaration, Doctype, ProcessingInstruction)
+
+# 렌더링 시 보이지 않는 요소 (innerText 근사용)
+_HIDDEN_TAGS = {"script", "style", "template", "head", "noscript", "title", "meta", "link"}
+
+# 블록 레벨 요소 (innerText 근사용 - 앞뒤 줄바꿈)
+_BLOCK_TAGS = {
+    "address", "article", "aside", "blockquote", "dd", "details", "dialog", "div", "dl", "dt",
+    "fieldset", "figcaption", "figure", "footer", "form", "h1", "h2", "h3", "h4", "h5", "h6",
+    "header", "hr", "li", "main", "nav", "ol", "p", "pre", "section", "summary", "table",
+    "tbody", "thead", "tfoot", "tr", "ul", "caption",
+}
+
+_COLLAPSIBLE = re.compile(r"[ \t\n\r\f]+")
+
+# table 바로 아래에 올 수 있는 구역 요소 (암묵적 tbody를 끊음)
+_TABLE_SECTIONS = {"caption", "colgroup", "thead", "tbody", "tfoot"}
+
+
+class _AllTags(frozenset):
+    """모든 태그 이름을 포함하는 집합 - preserve_whitespace_tags로 넘겨 공백 문자열 보존"""
+
+    def __contains__(self, name) -> bool:
+        return True
+
+
+def parse_html(html: str) -> BeautifulSoup:
+    """
+    HTML 파싱 (브라우저와 같게 CRLF → LF 정규화, 속성값은 항상 문자열, 암묵적 tbody 추가)
+
+    BeautifulSoup은 기본으로 공백만 있는 문자열을 "\n"/" " 하나로 줄이지만,
+    브라우저 textContent는 그대로 두므로 (들여쓰기 보존) 모든 태그에서 공백을 보존합니다.
+    """
+    html = html.replace("\r\n", "\n").replace("\r", "\n")
+    soup = BeautifulSoup(html, "html.parser", multi_valued_attributes=None, preserve_whitespace_tags=_AllTags())
+    _insert_implicit_tbody(soup)
+    return soup
+
+
+def _insert_implicit_tbody(soup: BeautifulSoup):
+    """
+    table 바로 아래의 tr을 tbody로 감쌈 (브라우저 HTML 파서 규칙)
+
+    html.parser는 tbody를 만들지 않아 <tbody> 없이 렌더링하는 서버 HTML에서
+    브라우저 기준 선택자("table tbody tr")가 행을 찾지 못하므로 브라우저 DOM과 맞춥니다.
+    """
+    for table in soup.find_all("table"):
+        if table.find("tr", recursive=False) is None:
+            continue
+        body: Optional[Tag] = None
+        for child in list(table.children):
+            if isinstance(child, Tag) and child.name in _TABLE_SECTIONS:
+                body = None
+            elif isinstance(child, Tag) and child.name == "tr":
+                if body is None:
+                    body = soup.new_tag("tbody")
+                    child.insert_before(body)
+                body.append(child.extract())
+            elif body is not None:
+                body.append(child.extract())   # 행 사이 공백/주석도 브라우저처럼 tbody 안으로
+
+
+def _is_text(node) -> bool:
+    return isinstance(node, NavigableString) and not isinstance(node, _NON_TEXT)
+
+
+def _iter_text(root: Tag, replace_tables: bool = False) -> Iterator[str]:
+    """
+    DOM textContent 순서대로 텍스트 조각 반환
+
+    replace_tables=True이면 최상위 table을 파이프 구분 텍스트로 치환 (본문 추출 규칙)
+    """
+    stack = [iter(root.children)]
+    while stack:
+        node = next(stack[-1], None)
+        if node is None:
+            stack.pop()
+            continue
+        if isinstance(node, Tag):
+            if node.name == "template":
+                continue  # template 내용은 DocumentFragment라 textContent에서 제외
+            if replace_tables and node.name == "table":
+                yield table_to_text(node)
+                continue
+            stack.append(iter(node.children))
+        elif _is_text(node):
+            yield str(node)
+
+
+def text_content(tag: Tag) -> str:
+    """DOM Node.textContent"""
+    return "".join(_iter_text(tag))
+
+
+def inner_text(tag: Tag) -> str:
+    """
+    렌더링된 요소의 innerText 근사 (목록 셀, 첨부파일 이름용)
+
+    공백 축약, <br> 줄바꿈, 블록 요소 경계 줄바꿈, 셀 사이 탭을 반영합니다.
+    """
+    parts: List[str] = []
+    block = "\x00"  # 블록 경계 표시 (연속 시 줄바꿈 1개)
+
+    def walk(node: Tag):
+        for child in node.children:
+            if isinstance(child, Tag):
+                name = child.name
+                if name in _HIDDEN_TAGS or child.has_attr("hidden"):
+                    continue
+                if name == "br":
+                    parts.append("\n")
+                    continue
+                is_block = name in _BLOCK_TAGS
+                if is_block:
+                    parts.append(block)
+                walk(child)
+                if is_block:
+                    parts.append(block)
+                elif name in ("td", "th") and child.find_next_sibling(("td", "th")) is not None:
+                    parts.append("\t")
+            elif _is_text(child):
+                parts.append(_COLLAPSIBLE.sub(" ", str(child)))
+
+    walk(tag)
+    text = "".join(parts)
+    text = re.sub(r" *\x00[\x00 ]*", "\x00", text)
+    text = re.sub(r" *\n *", "\n", text)
+    text = text.strip("\x00 ").replace("\x00", "\n")
+    return text
+
+
+def table_to_text(table: Tag) -> str:
+    """table → 파이프 구분 텍스트 (멀티라인 셀 확장) - BaseCrawler JS 추출과 동일 규칙"""
+    text = ""
+    for row in table.select("tr"):
+        cell_lines = []
+        for cell in row.select("td, th"):
+            lines = [line.strip(JS_WHITESPACE) for line in text_content(cell).strip(JS_WHITESPACE).split("\n")]
+            cell_lines.append([line for line in lines if line])
+        max_lines = max((len(lines) for lines in cell_lines), default=0)
+
+        if max_lines <= 1:
+            text += " | ".join(lines[0] if lines else "" for lines in cell_lines) + "\n"
+        else:
+            for i in range(max_lines):
+                row_text = [
+                    lines[0] if len(lines) == 1 else (lines[i] if i < len(lines) else "")
+                    for lines in cell_lines
+                ]
+                text += " | ".join(row_text) + "\n"
+    return text
+
+
+def clean_content(content: str) -> str:
+    """본문 텍스트 정제 (\\xa0 제거, 빈 줄 정리)"""
+    content = content.replace('\xa0', ' ')
+    content = re.sub(r'^[ \t]+$', '', content, flags=re.MULTILINE)
+    content = re.sub(r'\n{3,}', '\n\n', content)
+    return content.strip()
+
+
+def extract_content(html: str, selector: str) -> str:
+    """HTML에서 본문 추출 (표→파이프 구분, AI/MCP 가독성 최적화)"""
+    el = parse_html(html).select_one(selector)
+    if el is None:
+        return ""
+    return clean_content("".join(_iter_text(el, replace_tables=True)))
+
+
+def extract_links(html: str, selector: str) -> List[Tuple[Optional[str], str]]:
+    """선택자에 맞는 링크의 (href, 텍스트) 목록"""
+    return [(a.get("href"), inner_text(a)) for a in parse_html(html).select(selector)]
+
+
+def _read(el: Tag, spec: Dict[str, Any]) -> Optional[str]:
+    if spec.get("attr"):
+        return el.get(spec["attr"])
+    return inner_text(el)
+
+
+def _pick(row: Tag, spec: Dict[str, Any]) -> Any:
+    selector = spec.get("selector")
+    if spec.get("all"):
+        return [_read(el, spec) for el in row.select(selector)]
+
+    el: Optional[Tag] = row
+    if selector:
+        if spec.get("index") is not None:
+            matches = row.select(selector)
+            el = matches[spec["index"]] if spec["index"] < len(matches) else None
+        else:
+            el = row.select_one(selector)
+    if el is not None and spec.get("child"):
+        el = el.select_one(spec["child"])
+    return _read(el, spec) if el is not None else None
+
+
+def extract_rows(html: str, row_selector: str, schema: Dict[str, Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """목록 HTML에서 row_schema대로 모든 행 추출 (BaseCrawler._extract_rows의 Python 버전)"""
+    soup = parse_html(html)
+    return [
+        {name: _pick(row, spec) for name, spec in schema.items()}
+        for row in soup.select(row_selector)
+    ]
@@ -0,0 +1,105 @@
+"""
+HTTP 크롤러 엔진
+서버 렌더링 게시판을 브라우저 없이 httpx + HTML 파서로 크롤링합니다.
+사이트 크롤러와 함께 상속하여 같은 row_schema/선택자/parse_row를 그대로 사용합니다.
+
+    class CSAIHttpCrawler(HttpEngineMixin, CSAICrawler): ...
+"""
+import asyncio
+import logging
+from typing import List, Dict, Any, Optional
+from bson import ObjectId
+
+from app.config import settings
+from app.core.http_client import HttpClient
+from app.core.host_scheduler import HostScheduler, HostSlot
+from .html_extract import extract_rows
+
+logger = logging.getLogger(__name__)
+
+
+class HttpEngineMixin:
+    """브라우저 대신 공유 HTTP 클라이언트로 목록/상세를 가져오는 엔진"""
+
+    engine = "http"
+    random_access_pages = True  # 목록 N페이지를 URL만으로 바로 요청 가능
+
+    def __init__(self, board_id: ObjectId, board_name: str, detail_concurrency: Optional[int] = None):
+        super().__init__(board_id, board_name, detail_concurrency or settings.HTTP_DETAIL_CONCURRENCY)
+        self.client = None
+        self._list_html: Optional[str] = None
+        self._detail_slots: Optional[asyncio.Semaphore] = None
+        self._browser_lock = asyncio.Lock()
+
+    async def __aenter__(self):
+        self.client = HttpClient.get()
+        self._detail_slots = asyncio.Semaphore(self.detail_concurrency)
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        # 대체 경로로 브라우저를 썼다면 컨텍스트 반납
+        if self.context is not None:
+            await super().__aexit__(exc_type, exc_val, exc_tb)
+        # 공유 클라이언트는 닫지 않음 (앱 종료 시 HttpClient.close)
+        self.client = None
+        self._list_html = None
+        self._detail_slots = None
+
+    async def _ensure_browser(self):
+        """
+        대체 경로용 브라우저 준비 - 처음 필요할 때만 풀에서 컨텍스트를 대여하고
+        사이트 크롤러의 page/detail_pages를 그대로 만들어 브라우저 방식 메서드를 쓸 수 있게 함
+        """
+        async with self._browser_lock:
+            if self.context is None:
+                await super().__aenter__()
+
+    async def _fetch_html(self, url: str) -> str:
+        """GET (호스트 스케줄러 경유 - 속도 제한, 백오프 재시도, 서킷)"""
+        async def get(slot: HostSlot) -> str:
+            response = await self.client.get(url)
+            slot.check(response.status_code, response.headers.get("retry-after"))
+            response.raise_for_status()
+            return response.text
+
+        return await HostScheduler.run(url, get)
+
+    async def _fetch_list_html(self, url: str, page_num: int) -> Optional[str]:
+        """
+        목록 N페이지 HTML (서브클래스에서 오버라이드하여 요청 방식 변경)
+
+        Returns:
+            HTML, None이면 더 이상 페이지 없음
+        """
+        return await self._fetch_html(self._list_url(url, page_num))
+
+    async def _fetch_rows(self, url: str, page_num: int) -> Optional[List[Dict[str, Any]]]:
+        # 상태 없이 동작 - 여러 페이지를 동시에 요청해도 안전
+        html = await self._fetch_list_html(url, page_num)
+        if html is None:
+            return None
+        return extract_rows(html, self.row_selector, self.row_schema)
+
+    async def _navigate_to_page(self, url: str, page_num: int) -> bool:
+        self._list_html = await self._fetch_list_html(url, page_num)
+        return self._list_html is not None
+
+    async def _extract_rows(self, page=None) -> List[Dict[str, Any]]:
+        if not self._list_html:
+            return []
+        return extract_rows(self._list_html, self.row_selector, self.row_schema)
+
+    async def parse_detail(self, url: str, page=None) -> Dict[str, Any]:
+        try:
+            html = await self._fetch_html(url)
+            if settings.RAW_ARCHIVE:
+                self._archive_raw(url, html)
+            return await self._extract_detail(html)
+        except Exception as e:
+            logger.error(f"[{self.board_name}] 상세 페이지 파싱 오류 ({url}): {e}")
+            return {"content": "", "attachments": []}
+
+    async def _fetch_detail(self, notice: Dict[str, Any]) -> Dict[str, Any]:
+        async with self._detail_slots:
+            logger.info(f"[{self.board_name}] 상세 크롤링: {notice['title'][:30]}")
+            return await self.parse_detail(notice["url"])
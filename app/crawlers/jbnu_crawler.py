@@ -2,11 +2,23 @@
 전북대학교 메인 크롤러
 URL 패턴: www.jbnu.ac.kr/web/news/notice/subXX.do
 페이지네이션: 클릭 + navigation 방식 (POST form submit)
+           JbnuHttpCrawler는 form submit을 직접 POST로 재현
 """
 import re
+import time
+import asyncio
 import logging
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional, Tuple
+from urllib.parse import urljoin
+from bson import ObjectId
+from playwright.async_api import Page
+
+from app.config import settings
+from app.core.host_scheduler import HostScheduler, HostSlot, HostUnavailableError
 from .base import BaseCrawler
+from .readiness import Readiness
+from .http_engine import HttpEngineMixin
+from .html_extract import parse_html, extract_rows
 
 logger = logging.getLogger(__name__)
 
@@ -19,35 +31,57 @@ class JbnuCrawler(BaseCrawler):
     content_selector = ".com-post-content-01"
     attachment_selector = ".file-wrap a, .attachFile a, a[href*='fileDown']"
 
+    row_schema = {
+        "title": {"selector": "td.td-title a, td a.title"},
+        "onclick": {"selector": "td.td-title a, td a.title", "attr": "onclick"},
+        "date": {"selector": "ul.etc-list li"},
+        "cells": {"selector": "td", "all": True},
+    }
+
+    list_ready = Readiness(stable=True)
+    detail_ready = Readiness(non_empty=True)
+
+    _loaded_list: Optional[str] = None  # 목록 탭에 열려 있는 게시판 URL
+
     async def _navigate_to_page(self, url: str, page_num: int) -> bool:
         """JBNU는 클릭 방식 페이지네이션"""
-        if page_num == 1:
-            await self.page.goto(url, wait_until="networkidle", timeout=30000)
-            await self.page.wait_for_timeout(2000)
-            return True
+        # 체크포인트에서 이어서 크롤링하면 1페이지를 거치지 않으므로 먼저 목록을 엶
+        jump = self._loaded_list != url
+        if page_num == 1 or jump:
+            await self._goto(self.page, url, "list")
+            self._loaded_list = url
+            if page_num == 1:
+                return True
 
+        # 다음 블록 페이지는 현재 페이지네이션에 없을 수 있으므로 버튼이 없어도 pf_LinkPage(n)로 이동
+        # (마지막 페이지 다음은 빈 목록/같은 목록 → parse_list가 종료)
         next_btn = await self.page.query_selector(f'[onclick="pf_LinkPage({page_num})"]')
-        if not next_btn:
-            logger.info(f"[{self.board_name}] 마지막 페이지 도달")
-            return False
 
         try:
-            async with self.page.expect_navigation(wait_until="networkidle"):
-                await next_btn.click()
-            await self.page.wait_for_timeout(1000)
+            started = time.perf_counter()
+            async with HostScheduler.slot(url) as slot:
+                async with self.page.expect_navigation(wait_until="domcontentloaded") as navigation:
+                    if next_btn:
+                        await next_btn.click()
+                    else:
+                        # 페이지네이션에 보이지 않는 페이지 (다음 블록, 체크포인트)로 바로 이동
+                        await self.page.evaluate("(n) => pf_LinkPage(n)", page_num)
+                response = await navigation.value
+                if response is not None:
+                    slot.check(response.status, response.headers.get("retry-after"))
+            self.wait_stats["list"].load += time.perf_counter() - started
+            await self._wait_ready(self.page, "list")
             return True
+        except HostUnavailableError:
+            raise
         except Exception as e:
             logger.error(f"[{self.board_name}] 페이지 이동 오류: {e}")
             return False
 
-    async def parse_row(self, row, base_url: str) -> Optional[Dict[str, Any]]:
+    def parse_row(self, row: Dict[str, Any], base_url: str) -> Optional[Dict[str, Any]]:
         """단일 행 파싱"""
-        title_el = await row.query_selector("td.td-title a, td a.title")
-        if not title_el:
-            return None
-
-        onclick = await title_el.get_attribute("onclick")
-        if not onclick or "pf_DetailMove" not in onclick:
+        onclick = row.get("onclick")
+        if row.get("title") is None or not onclick or "pf_DetailMove" not in onclick:
             return None
 
         match = re.search(r"pf_DetailMove\(['\"]?(\d+)['\"]?\)", onclick)
@@ -57,21 +91,16 @@ class JbnuCrawler(BaseCrawler):
         post_id = match.group(1)
         full_url = f"{self.base_domain}/web/Board/{post_id}/detailView.do"
 
-        title = await title_el.inner_text()
-        title = title.strip()
+        title = row["title"].strip()
 
         # 날짜 추출
-        date_text = ""
-        etc_list = await row.query_selector("ul.etc-list li")
-        if etc_list:
-            date_text = await etc_list.inner_text()
-            date_text = date_text.strip()
+        date_text = (row.get("date") or "").strip()
 
         # 작성자 추출
-        cells = await row.query_selector_all("td")
+        cells = row.get("cells") or []
         author = None
         if len(cells) >= 5:
-            author = await cells[4].inner_text()
+            author = cells[4]
             author = author.strip() if author else None
 
         return {
@@ -80,3 +109,164 @@ class JbnuCrawler(BaseCrawler):
             "date": date_text,
             "author": author
         }
+
+
+class JbnuHttpCrawler(HttpEngineMixin, JbnuCrawler):
+    """
+    전북대학교 메인 크롤러 (HTTP 엔진)
+
+    pf_LinkPage(n)가 하는 form submit을 직접 POST로 재현하여 목록 N페이지를
+    순서와 무관하게 병렬로 가져오고, 상세(/web/Board/{id}/detailView.do)도 HTTP로 요청합니다.
+    직접 요청 결과가 검증에 실패하면 브라우저 클릭 방식으로 대체합니다.
+    """
+
+    # pf_LinkPage 스크립트에서 필드명을 찾지 못했을 때 시도할 페이지 번호 필드
+    page_field_candidates = ("pageIndex", "page", "pageNo", "currentPage", "cpage")
+
+    def __init__(self, board_id: ObjectId, board_name: str, detail_concurrency: Optional[int] = None):
+        super().__init__(board_id, board_name, detail_concurrency)
+        self._first_pages: Dict[str, str] = {}                       # url → 1페이지 HTML
+        self._forms: Dict[str, Optional[Tuple[str, Dict[str, str], str]]] = {}  # url → (action, 필드, 페이지 필드)
+        self._last_pages: Dict[str, int] = {}                        # url → 페이지네이션에 보인 최대 페이지 (목록 끝 판단 힌트)
+        self._url_locks: Dict[str, asyncio.Lock] = {}
+        self._click_lock = asyncio.Lock()
+
+    def _note_last_page(self, url: str, html: str):
+        """페이지네이션 링크(pf_LinkPage(n))에서 알 수 있는 최대 페이지 기록"""
+        pages = [int(n) for n in re.findall(r"pf_LinkPage\(\s*['\"]?(\d+)", html)]
+        if pages:
+            self._last_pages[url] = max(self._last_pages.get(url, 1), max(pages))
+
+    def _parse_page_form(self, url: str, html: str) -> Optional[Tuple[str, Dict[str, str], str]]:
+        """1페이지 HTML에서 pf_LinkPage가 submit하는 form의 action, 필드, 페이지 필드명 추출"""
+        soup = parse_html(html)
+
+        # pf_LinkPage 정의에서 "document.{form}.{field}.value = ..." 찾기
+        form_name = page_field = None
+        for script in soup.find_all("script"):
+            body = script.string or ""
+            match = re.search(r"function\s+pf_LinkPage\s*\([^)]*\)\s*\{(.*?)\}", body, re.S)
+            if not match:
+                continue
+            assign = re.search(r"(?:document\.)?(\w+)\.(\w+)\.value\s*=", match.group(1))
+            if assign:
+                form_name, page_field = assign.group(1), assign.group(2)
+            break
+
+        forms = soup.find_all("form")
+        form = None
+        if form_name:
+            form = next((f for f in forms if form_name in (f.get("name"), f.get("id"))), None)
+        if form is None:
+            candidates = (page_field,) if page_field else self.page_field_candidates
+            for f in forms:
+                names = {i.get("name") for i in f.find_all("input")}
+                field = next((c for c in candidates if c in names), None)
+                if field:
+                    form, page_field = f, field
+                    break
+        if form is None or not page_field:
+            return None
+
+        fields = {
+            i.get("name"): i.get("value") or ""
+            for i in form.find_all("input")
+            if i.get("name") and (i.get("type") or "text").lower() not in ("button", "submit", "image", "file")
+        }
+        action = urljoin(url, form.get("action") or url)
+        return action, fields, page_field
+
+    async def _first_page(self, url: str) -> str:
+        """1페이지 HTML (URL별 1회만 요청, form 정보 캐시)"""
+        lock = self._url_locks.setdefault(url, asyncio.Lock())
+        async with lock:
+            if url not in self._first_pages:
+                html = await self._fetch_html(url)
+                self._first_pages[url] = html
+                self._forms[url] = self._parse_page_form(url, html)
+                self._note_last_page(url, html)
+            return self._first_pages[url]
+
+    def _is_valid_page(self, url: str, page_num: int, html: str) -> bool:
+        """직접 요청 결과 검증 - 행이 있고, 1페이지와 다른 목록이어야 함 (서버가 파라미터를 무시하면 1페이지가 옴)"""
+        notices = self._page_notices(url, html)
+        if not notices:
+            return False
+        return notices != self._page_notices(url, self._first_pages[url])
+
+    def _page_notices(self, url: str, html: str) -> List[str]:
+        """목록 HTML의 공지 URL 목록"""
+        rows = extract_rows(html, self.row_selector, self.row_schema)
+        return [n["url"] for n in (self.parse_row(r, url) for r in rows) if n]
+
+    async def _fetch_list_html(self, url: str, page_num: int) -> Optional[str]:
+        first_html = await self._first_page(url)
+        if page_num == 1:
+            return first_html
+
+        form = self._forms.get(url)
+        if form:
+            action, fields, page_field = form
+            async def post(slot: HostSlot) -> str:
+                response = await self.client.post(action, data={**fields, page_field: str(page_num)})
+                slot.check(response.status_code, response.headers.get("retry-after"))
+                response.raise_for_status()
+                return response.text
+
+            try:
+                html = await HostScheduler.run(action, post)
+                if self._is_valid_page(url, page_num, html):
+                    self._note_last_page(url, html)
+                    return html
+                # 페이지네이션에 보인 적 없는 페이지가 비어 있으면 목록 끝 (보인 페이지가 비면 재현 실패로 보고 클릭 방식)
+                if page_num > self._last_pages.get(url, 1) and not self._page_notices(url, html):
+                    logger.info(f"[{self.board_name}] 페이지 {page_num}: 빈 목록, 마지막 페이지 도달")
+                    return html
+                logger.warning(f"[{self.board_name}] 페이지 {page_num} 직접 요청 검증 실패, 클릭 방식으로 대체")
+            except Exception as e:
+                logger.warning(f"[{self.board_name}] 페이지 {page_num} 직접 요청 실패 ({e}), 클릭 방식으로 대체")
+
+        return await self._fetch_list_html_by_click(url, page_num)
+
+    async def _fetch_list_html_by_click(self, url: str, page_num: int) -> Optional[str]:
+        """브라우저 목록 탭에서 pf_LinkPage(n) 실행 후 HTML (탭 하나를 순차 사용)"""
+        await self._ensure_browser()
+        async with self._click_lock:
+            page = self.page
+            try:
+                await self._goto(page, url, "list")
+                async with HostScheduler.slot(url) as slot:
+                    async with page.expect_navigation(wait_until="domcontentloaded") as navigation:
+                        await page.evaluate("(n) => pf_LinkPage(n)", page_num)
+                    response = await navigation.value
+                    if response is not None:
+                        slot.check(response.status, response.headers.get("retry-after"))
+                await self._wait_ready(page, "list")
+                html = await page.content()
+            except HostUnavailableError:
+                raise
+            except Exception as e:
+                logger.error(f"[{self.board_name}] 페이지 이동 오류: {e}")
+                return None
+
+        self._note_last_page(url, html)
+        return html
+
+    async def parse_detail(self, url: str, page: Optional[Page] = None) -> Dict[str, Any]:
+        """상세는 HTTP GET, 본문 영역이 없으면 브라우저로 대체"""
+        try:
+            html = await self._fetch_html(url)
+            if parse_html(html).select_one(self.content_selector) is not None:
+                if settings.RAW_ARCHIVE:
+                    self._archive_raw(url, html)
+                return await self._extract_detail(html)
+            logger.warning(f"[{self.board_name}] 상세 HTTP 응답에 본문 없음, 브라우저로 대체 ({url})")
+        except Exception as e:
+            logger.warning(f"[{self.board_name}] 상세 HTTP 요청 실패 ({e}), 브라우저로 대체 ({url})")
+
+        await self._ensure_browser()
+        page = await self._free_detail_pages.get()
+        try:
+            return await JbnuCrawler.parse_detail(self, url, page)
+        finally:
+            self._free_detail_pages.put_nowait(page)
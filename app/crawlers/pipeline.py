@@ -0,0 +1,254 @@
+"""
+크롤링 파이프라인
+목록 탐색 → 상세 크롤링 → DB 저장 단계를 bounded queue로 연결해 동시에 실행합니다.
+"""
+import time
+import asyncio
+import logging
+from typing import Dict, Any, List, Optional, Callable, Awaitable, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .base import BaseCrawler
+    from .watermark import Watermark
+
+logger = logging.getLogger(__name__)
+
+# 단계 종료 신호
+_DONE = object()
+
+# 진행 상황 콜백 - progress(게시판 이름, pages=1 / details=N / new=N, updated=N, unchanged=N)
+ProgressCallback = Callable[..., None]
+
+# 체크포인트 콜백 - 목록 페이지 저장 후 checkpoint(페이지 번호, 그 페이지 마지막 공지 URL)
+CheckpointCallback = Callable[[int, Optional[str]], Awaitable[None]]
+
+
+class StageStats:
+    """파이프라인 단계별 통계 (처리량, busy 시간, 입력 큐 깊이)"""
+
+    def __init__(self, name: str):
+        self.name = name
+        self.items = 0            # 처리한 목록 페이지 수
+        self.busy = 0.0           # 실제 작업 시간 (큐 대기 제외, 초)
+        self.wait = 0.0           # 입력/출력 큐 대기 시간 (초)
+        self.queue_max = 0        # 입력 큐 최대 깊이
+        self._queue_sum = 0
+        self._queue_samples = 0
+
+    def sample_queue(self, queue: Optional[asyncio.Queue]):
+        """입력 큐 깊이 기록"""
+        if queue is None:
+            return
+        depth = queue.qsize()
+        self.queue_max = max(self.queue_max, depth)
+        self._queue_sum += depth
+        self._queue_samples += 1
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "items": self.items,
+            "busy_sec": round(self.busy, 3),
+            "wait_sec": round(self.wait, 3),
+            "queue_max": self.queue_max,
+            "queue_avg": round(self._queue_sum / self._queue_samples, 2) if self._queue_samples else 0,
+        }
+
+
+class CrawlPipeline:
+    """
+    URL 하나에 대한 list → detail → persist 파이프라인
+
+    - 큐 크기 제한으로 backpressure (목록이 저장보다 queue_size 페이지 이상 앞서지 않음)
+    - min_year 또는 워터마크(지난번 최신 글) 도달 시 목록 단계가 스스로 종료
+    - start_page부터 시작 가능, 페이지 저장마다 checkpoint 콜백 (작업 큐 재개용)
+    - 연속 no_new_limit 페이지 새 공지 없음 → 저장 단계가 stop 신호, 남은 페이지는 버림
+      (최근 공지 재확인 순회 중 재확인 구간 페이지는 세지 않음)
+    """
+
+    def __init__(
+        self,
+        crawler: "BaseCrawler",
+        url: str,
+        max_pages: Optional[int] = None,
+        min_year: int = 2025,
+        queue_size: int = 2,
+        no_new_limit: int = 2,
+        watermark: Optional["Watermark"] = None,
+        progress: Optional[ProgressCallback] = None,
+        start_page: int = 1,
+        checkpoint: Optional[CheckpointCallback] = None
+    ):
+        self.crawler = crawler
+        self.url = url
+        self.max_pages = max_pages
+        self.min_year = min_year
+        self.watermark = watermark
+        self.progress = progress
+        self.start_page = max(1, start_page)
+        self.checkpoint = checkpoint
+        self.no_new_limit = no_new_limit
+
+        self.detail_queue: asyncio.Queue = asyncio.Queue(maxsize=max(1, queue_size))
+        self.persist_queue: asyncio.Queue = asyncio.Queue(maxsize=max(1, queue_size))
+        self.stop = asyncio.Event()
+
+        self.stats = {
+            "list": StageStats("list"),
+            "detail": StageStats("detail"),
+            "persist": StageStats("persist"),
+        }
+        self.new = 0
+        self.updated = 0
+        self.unchanged = 0
+
+    @property
+    def board_name(self) -> str:
+        return self.crawler.board_name
+
+    def _report(self, **counts: int):
+        """진행 상황 콜백 호출 (콜백 오류는 크롤링에 영향 없음)"""
+        if self.progress is None:
+            return
+        try:
+            self.progress(self.board_name, **counts)
+        except Exception as e:
+            logger.warning(f"[{self.board_name}] 진행 상황 보고 실패: {e}")
+
+    async def _put(self, queue: asyncio.Queue, item, stats: StageStats):
+        started = time.perf_counter()
+        await queue.put(item)
+        stats.wait += time.perf_counter() - started
+
+    async def _get(self, queue: asyncio.Queue, stats: StageStats):
+        stats.sample_queue(queue)
+        started = time.perf_counter()
+        item = await queue.get()
+        stats.wait += time.perf_counter() - started
+        return item
+
+    async def _list_stage(self):
+        """목록 페이지 탐색/파싱 → detail_queue"""
+        stats = self.stats["list"]
+        pages = self.crawler.parse_list(
+            self.url,
+            max_pages=self.max_pages,
+            min_year=self.min_year,
+            watermark=self.watermark,
+            start_page=self.start_page
+        )
+        try:
+            while not self.stop.is_set():
+                started = time.perf_counter()
+                try:
+                    page_notices = await pages.__anext__()
+                except StopAsyncIteration:
+                    break
+                finally:
+                    stats.busy += time.perf_counter() - started
+
+                # parse_list는 빈 페이지에서 멈추므로 yield된 페이지는 start_page부터 연속
+                page_num = self.start_page + stats.items
+                stats.items += 1
+                self._report(pages=1)
+                await self._put(self.detail_queue, (page_num, page_notices), stats)
+        finally:
+            await pages.aclose()
+        await self.detail_queue.put(_DONE)
+
+    async def _detail_stage(self):
+        """기존 공지 조회 + 상세 동시 크롤링 → persist_queue"""
+        stats = self.stats["detail"]
+        while True:
+            item = await self._get(self.detail_queue, stats)
+            if item is _DONE:
+                break
+            if self.stop.is_set():
+                continue  # 중단 신호 이후 페이지는 버림 (목록 단계 종료까지 큐 비우기)
+
+            page_num, page_notices = item
+            started = time.perf_counter()
+            targets = await self.crawler.select_for_detail(page_notices)
+            details = await self.crawler.fetch_details(targets)
+            for notice, detail in zip(targets, details):
+                notice["content"] = detail["content"]
+                notice["attachments"] = detail["attachments"]
+            stats.busy += time.perf_counter() - started
+            stats.items += 1
+            self._report(details=len(targets))
+
+            refreshing = self.crawler.in_refresh_window(page_notices)
+            await self._put(self.persist_queue, (page_num, page_notices[-1]["url"], targets, refreshing), stats)
+
+        await self.persist_queue.put(_DONE)
+
+    async def _persist_stage(self):
+        """DB 저장 + 연속 no-new 페이지 판정"""
+        stats = self.stats["persist"]
+        no_new_pages = 0  # 연속으로 new=0인 페이지 수
+
+        while True:
+            item = await self._get(self.persist_queue, stats)
+            if item is _DONE:
+                break
+            if self.stop.is_set():
+                continue
+            page_num, last_url, notices, refreshing = item
+
+            started = time.perf_counter()
+            result = await self.crawler.save_notices(notices)
+            stats.busy += time.perf_counter() - started
+            stats.items += 1
+
+            self.new += result["new"]
+            self.updated += result["updated"]
+            self.unchanged += result.get("unchanged", 0)
+            self._report(new=result["new"], updated=result["updated"], unchanged=result.get("unchanged", 0))
+            if self.checkpoint is not None:
+                try:
+                    await self.checkpoint(page_num, last_url)
+                except Exception as e:
+                    logger.warning(f"[{self.board_name}] 체크포인트 저장 실패 (페이지 {page_num}): {e}")
+            logger.info(
+                f"[{self.board_name}] 페이지 저장 완료: page_new={result['new']}, "
+                f"total_new={self.new}, total_updated={self.updated}, total_unchanged={self.unchanged}"
+            )
+
+            # 연속 2페이지 new=0이면 이전 데이터 도달로 판단, 중단 (재확인 구간은 새 공지가 없어도 계속)
+            if result["new"] == 0 and not refreshing:
+                no_new_pages += 1
+                if no_new_pages >= self.no_new_limit:
+                    logger.info(f"[{self.board_name}] 새 공지 없음 (연속 {no_new_pages}페이지), 크롤링 중단")
+                    self.stop.set()
+            elif result["new"]:
+                no_new_pages = 0
+
+    async def run(self) -> Dict[str, Any]:
+        """
+        파이프라인 실행
+
+        Returns:
+            {"new": 0, "updated": 0, "unchanged": 0, "stages": {"list": {...}, "detail": {...}, "persist": {...}}}
+        """
+        async with asyncio.TaskGroup() as group:
+            group.create_task(self._list_stage())
+            group.create_task(self._detail_stage())
+            group.create_task(self._persist_stage())
+
+        stages = {name: stage.to_dict() for name, stage in self.stats.items()}
+        bottleneck = max(stages, key=lambda name: stages[name]["busy_sec"])
+        logger.info(f"[{self.board_name}] 파이프라인 통계 (병목: {bottleneck}): {stages}")
+
+        return {"new": self.new, "updated": self.updated, "unchanged": self.unchanged, "stages": stages}
+
+
+def merge_stage_stats(results: List[Dict[str, Dict[str, Any]]]) -> Dict[str, Dict[str, Any]]:
+    """여러 URL 파이프라인의 단계 통계 합산"""
+    merged: Dict[str, Dict[str, Any]] = {}
+    for stages in results:
+        for name, stage in stages.items():
+            total = merged.setdefault(name, {"items": 0, "busy_sec": 0.0, "wait_sec": 0.0, "queue_max": 0})
+            total["items"] += stage["items"]
+            total["busy_sec"] = round(total["busy_sec"] + stage["busy_sec"], 3)
+            total["wait_sec"] = round(total["wait_sec"] + stage["wait_sec"], 3)
+            total["queue_max"] = max(total["queue_max"], stage["queue_max"])
+    return merged
@@ -0,0 +1,123 @@
+"""
+상세 페이지 원본 HTML 보관소 (MongoDB raw_pages)
+크롤링 중 가져온 상세 HTML을 gzip으로 압축해 (URL, HTML 해시)마다 한 번만 저장하고, URL별로 최근 RAW_ARCHIVE_KEEP개만 남깁니다.
+본문 선택자나 표 변환 규칙을 바꾸면 scripts/reextract.py가 사이트에 다시 요청하지 않고 이 원본으로 본문/첨부파일을 다시 추출합니다.
+- kind="page": 상세 페이지 전체 HTML (크롤러의 content_selector/attachment_selector로 추출)
+- kind="fragment": 본문 HTML 조각 (공과대학 JSON API 본문, 첨부파일은 JSON에서 오므로 본문만 다시 추출)
+"""
+import gzip
+import hashlib
+import logging
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+from bson import Binary, ObjectId
+from pymongo import UpdateOne
+from pymongo.errors import PyMongoError
+
+from app.config import settings
+from app.core.database import Database
+from .html_extract import extract_content
+
+logger = logging.getLogger(__name__)
+
+
+def html_hash(html: str) -> str:
+    """원본 HTML 해시 (sha256 hex)"""
+    return hashlib.sha256(html.encode("utf-8")).hexdigest()
+
+
+def compress(html: str) -> bytes:
+    return gzip.compress(html.encode("utf-8"), compresslevel=settings.RAW_ARCHIVE_LEVEL)
+
+
+def decompress(body: bytes) -> str:
+    return gzip.decompress(body).decode("utf-8")
+
+
+def raw_page_op(board_id: ObjectId, url: str, html: str, kind: str, now: datetime) -> UpdateOne:
+    """보관 upsert - 같은 (URL, 해시)면 마지막으로 본 시각만 갱신"""
+    body = compress(html)
+    digest = html_hash(html)
+    return UpdateOne(
+        {"url": url, "html_hash": digest},
+        {
+            "$setOnInsert": {
+                "url": url,
+                "html_hash": digest,
+                "board_id": board_id,
+                "kind": kind,
+                "encoding": "gzip",
+                "body": Binary(body),
+                "size": len(html.encode("utf-8")),
+                "compressed_size": len(body),
+                "created_at": now,
+            },
+            "$set": {"fetched_at": now},
+        },
+        upsert=True
+    )
+
+
+async def save_raw_pages(board_id: ObjectId, pages: List[Dict[str, str]]):
+    """상세 원본 여러 개 저장 (unordered, 실패해도 크롤링은 계속) - 새 원본이 생긴 URL은 오래된 원본 정리"""
+    if not pages:
+        return
+    now = datetime.utcnow()
+    ops = [raw_page_op(board_id, page["url"], page["html"], page["kind"], now) for page in pages]
+    try:
+        result = await Database.raw_pages().bulk_write(ops, ordered=False)
+        if result.upserted_count:
+            await prune_raw_pages(list({page["url"] for page in pages}))
+    except PyMongoError as e:
+        logger.error(f"원본 HTML 보관 실패 ({len(ops)}건): {e}")
+
+
+async def prune_raw_pages(urls: List[str]) -> int:
+    """
+    URL별로 최근 RAW_ARCHIVE_KEEP개 원본만 남기고 삭제 (0이면 모두 유지)
+
+    조회수/토큰처럼 매번 바뀌는 부분 때문에 같은 글도 해시가 달라 원본이 계속 쌓이므로,
+    재추출에 쓰는 최신 원본과 직전 몇 개만 보관합니다.
+    """
+    keep = settings.RAW_ARCHIVE_KEEP
+    if keep <= 0 or not urls:
+        return 0
+    cursor = Database.raw_pages().find({"url": {"$in": urls}}, {"url": 1, "fetched_at": 1}).sort("fetched_at", -1)
+    counts: Dict[str, int] = {}
+    stale = []
+    async for doc in cursor:
+        counts[doc["url"]] = counts.get(doc["url"], 0) + 1
+        if counts[doc["url"]] > keep:
+            stale.append(doc["_id"])
+    if not stale:
+        return 0
+    result = await Database.raw_pages().delete_many({"_id": {"$in": stale}})
+    return result.deleted_count
+
+
+def reextract(crawler_type: str, kind: str, body: bytes) -> Dict[str, Any]:
+    """
+    보관된 원본에서 본문/첨부파일 다시 추출 (네트워크 없음, 프로세스 풀에서 실행)
+
+    Returns:
+        {"content": "...", "attachments": [...] 또는 None(원본으로 알 수 없음 - 기존 값 유지)}
+    """
+    # 프로세스 풀 자식에서 처음 불릴 때 크롤러 모듈 로드
+    from app.crawlers import CRAWLER_MAP
+
+    html = decompress(body)
+    if kind == "fragment":
+        return {"content": extract_content(f"<div>{html}</div>", "div"), "attachments": None}
+
+    crawler_class = CRAWLER_MAP[crawler_type]
+    return crawler_class.extract_detail_html(html)
+
+
+def latest_by_url(docs: List[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+    """URL별 가장 최근에 본 원본"""
+    latest: Dict[str, Dict[str, Any]] = {}
+    for doc in docs:
+        current: Optional[Dict[str, Any]] = latest.get(doc["url"])
+        if current is None or doc["fetched_at"] > current["fetched_at"]:
+            latest[doc["url"]] = doc
+    return latest
@@ -0,0 +1,181 @@
+"""
+페이지 준비 조건 (고정 대기 대체)
+goto 후 wait_for_timeout 대신 크롤러가 선언한 조건(행 존재 + 안정, 본문 비어있지 않음)을
+짧은 간격으로 확인하고, 준비되는 즉시 다음 단계로 넘어갑니다.
+"""
+import time
+import itertools
+import logging
+from typing import List, Dict, Any, Optional
+from playwright.async_api import Page, TimeoutError as PlaywrightTimeoutError
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+# 준비 조건 확인 (wait_for_function으로 poll_ms마다 실행)
+#   - selector 매치가 min_count개 이상 (non_empty면 텍스트가 있는 요소가 하나 이상)
+#   - stable이면 매치 수/텍스트 길이가 직전 확인과 같을 때까지 대기 (렌더링 중간 상태 방지)
+#   - empty_polls가 있으면 문서 로드 완료 후 그 횟수만큼 변화가 없을 때 "빈 페이지"로 판정
+READY_JS = """({selector, minCount, nonEmpty, stable, emptyPolls, key}) => {
+    const els = [...document.querySelectorAll(selector)];
+    const sig = els.length + ':' + els.reduce((n, el) => n + el.textContent.length, 0);
+    const state = window[key] || (window[key] = {sig: null, same: 0});
+    state.same = state.sig === sig ? state.same + 1 : 0;
+    state.sig = sig;
+
+    const found = els.length >= minCount && (!nonEmpty || els.some(el => el.textContent.trim()));
+    if (found && (!stable || state.same >= 1)) return 'ready';
+    if (!found && emptyPolls !== null && document.readyState === 'complete' && state.same >= emptyPolls) {
+        return 'empty';
+    }
+    return false;
+}"""
+
+# 호출마다 다른 window 상태 키 (같은 문서에서 다시 기다릴 때 이전 상태 재사용 방지)
+_ready_keys = itertools.count()
+
+
+class Readiness:
+    """
+    크롤러가 선언하는 페이지 준비 조건
+
+    selector가 None이면 목록은 row_selector, 상세는 content_selector를 사용합니다.
+    """
+
+    def __init__(
+        self,
+        selector: Optional[str] = None,
+        min_count: int = 1,
+        non_empty: bool = False,
+        stable: bool = True,
+        empty_after_ms: Optional[int] = 500
+    ):
+        self.selector = selector
+        self.min_count = min_count
+        self.non_empty = non_empty              # 텍스트가 있는 요소가 있어야 준비
+        self.stable = stable                    # 연속 두 번 같은 상태여야 준비
+        self.empty_after_ms = empty_after_ms    # 로드 완료 후 이 시간 동안 변화 없으면 빈 페이지 (None: SPA처럼 늦게 그려지면 끝까지 대기)
+
+
+class WaitStats:
+    """
+    페이지 종류(list/detail)별 대기 통계와 대체 모드 상태
+
+    연속 READY_FALLBACK_AFTER번 조건이 시간 초과되면 (선택자가 맞지 않는 등)
+    매번 타임아웃만큼 기다리지 않도록 기존 고정 대기로 전환하고,
+    READY_RETRY_EVERY 페이지마다 조건을 다시 시도해 맞으면 조건 대기로 복귀합니다.
+    """
+
+    def __init__(self, name: str, settle_ms: int):
+        self.name = name
+        self.settle_ms = settle_ms    # 기존 고정 대기 시간 (대체 모드/비교 기준)
+        self.pages = 0
+        self.ready = 0                # 조건 충족
+        self.empty = 0                # 빈 페이지 판정
+        self.timeouts = 0             # 조건 시간 초과
+        self.fallbacks = 0            # 고정 대기로 처리한 페이지
+        self.load = 0.0               # goto/navigation 시간 (초)
+        self.needed = 0.0             # 로드 후 조건 충족까지 걸린 시간 합 (페이지가 실제로 필요했던 시간)
+        self.waited = 0.0             # 로드 후 대기에 쓴 전체 시간 (타임아웃/고정 대기 포함)
+        self._consecutive_timeouts = 0
+        self._fallback_pages = 0
+
+    @property
+    def fallback_mode(self) -> bool:
+        return self._consecutive_timeouts >= max(1, settings.READY_FALLBACK_AFTER)
+
+    def should_try_predicate(self) -> bool:
+        """이번 페이지에 조건 대기를 쓸지 (대체 모드면 READY_RETRY_EVERY 페이지마다 한 번)"""
+        if not self.fallback_mode:
+            return True
+        self._fallback_pages += 1
+        return self._fallback_pages % max(1, settings.READY_RETRY_EVERY) == 0
+
+    def record(self, outcome: str, elapsed: float):
+        """outcome: "ready" / "empty" / "timeout" / "fallback" """
+        self.pages += 1
+        self.waited += elapsed
+        if outcome == "ready" or outcome == "empty":
+            setattr(self, outcome, getattr(self, outcome) + 1)
+            self.needed += elapsed
+            if self.fallback_mode:
+                logger.info(f"[{self.name}] 준비 조건 다시 충족, 조건 대기로 복귀")
+            self._consecutive_timeouts = 0
+            self._fallback_pages = 0
+        elif outcome == "timeout":
+            self.timeouts += 1
+            self._consecutive_timeouts += 1
+            if self._consecutive_timeouts == max(1, settings.READY_FALLBACK_AFTER):
+                logger.warning(f"[{self.name}] 준비 조건 연속 {self._consecutive_timeouts}회 시간 초과, 고정 대기({self.settle_ms}ms)로 전환")
+        else:
+            self.fallbacks += 1
+
+    def to_dict(self) -> Dict[str, Any]:
+        fixed = self.pages * self.settle_ms / 1000
+        return {
+            "pages": self.pages,
+            "ready": self.ready,
+            "empty": self.empty,
+            "timeouts": self.timeouts,
+            "fallbacks": self.fallbacks,
+            "load_sec": round(self.load, 3),
+            "needed_sec": round(self.needed, 3),
+            "waited_sec": round(self.waited, 3),
+            "avg_ready_ms": round(self.needed * 1000 / (self.ready + self.empty), 1) if self.ready + self.empty else 0,
+            "fixed_sleep_sec": round(fixed, 3),   # 기존 고정 대기였다면 쓴 시간
+            "saved_sec": round(fixed - self.waited, 3),
+        }
+
+
+async def wait_ready(page: Page, ready: Readiness, selector: str, stats: WaitStats) -> str:
+    """
+    준비 조건까지 대기 (최대 READY_TIMEOUT_MS)
+
+    Returns:
+        "ready" / "empty" / "timeout" / "fallback"
+    """
+    started = time.perf_counter()
+
+    if not stats.should_try_predicate():
+        await page.wait_for_timeout(stats.settle_ms)
+        outcome = "fallback"
+    else:
+        poll_ms = max(10, settings.READY_POLL_MS)
+        empty_polls = None
+        if ready.empty_after_ms is not None:
+            empty_polls = max(1, -(-ready.empty_after_ms // poll_ms))
+        try:
+            handle = await page.wait_for_function(
+                READY_JS,
+                arg={
+                    "selector": selector,
+                    "minCount": ready.min_count,
+                    "nonEmpty": ready.non_empty,
+                    "stable": ready.stable,
+                    "emptyPolls": empty_polls,
+                    "key": f"__crawlReady{next(_ready_keys)}",
+                },
+                polling=poll_ms,
+                timeout=settings.READY_TIMEOUT_MS
+            )
+            outcome = await handle.json_value()
+        except PlaywrightTimeoutError:
+            outcome = "timeout"
+
+    stats.record(outcome, time.perf_counter() - started)
+    return outcome
+
+
+def merge_wait_stats(results: List[Dict[str, Dict[str, Any]]]) -> Dict[str, Dict[str, Any]]:
+    """여러 크롤러의 대기 통계 합산 (avg_ready_ms는 합산 값으로 다시 계산)"""
+    merged: Dict[str, Dict[str, Any]] = {}
+    for waits in results:
+        for kind, stats in waits.items():
+            total = merged.setdefault(kind, {key: 0 for key in stats})
+            for key, value in stats.items():
+                total[key] = round(total[key] + value, 3)
+    for total in merged.values():
+        done = total["ready"] + total["empty"]
+        total["avg_ready_ms"] = round(total["needed_sec"] * 1000 / done, 1) if done else 0
+    return merged
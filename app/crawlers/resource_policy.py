@@ -0,0 +1,158 @@
+"""
+브라우저 리소스 차단 정책
+크롤링에 필요 없는 이미지/폰트/미디어와 분석·광고 스크립트 요청을 페이지 route에서 중단합니다.
+본문/행 추출은 DOM 텍스트와 링크만 쓰므로 문서, 스크립트(SPA 번들), XHR, CSS는 그대로 둡니다.
+"""
+import re
+import asyncio
+import logging
+from typing import List, Dict, Any, Optional, Iterable, Set
+from urllib.parse import urlsplit
+from playwright.async_api import Page, Route
+
+from app.config import settings
+from app.core.http_client import HttpClient
+from app.core.host_scheduler import HostScheduler
+from app.core.net_session import NetSession
+
+logger = logging.getLogger(__name__)
+
+# 허용하는 Playwright resource_type (나머지 image, media, font, texttrack 등은 차단)
+#   stylesheet: 목록 행은 innerText로 읽으므로 display 규칙이 결과에 영향
+#   other: 첨부파일 다운로드 등
+DEFAULT_ALLOW_TYPES = frozenset({
+    "document", "script", "xhr", "fetch", "stylesheet",
+    "eventsource", "websocket", "manifest", "other",
+})
+
+# 허용 타입이어도 차단할 URL (분석/광고/채팅 위젯)
+DEFAULT_BLOCK_PATTERNS = (
+    r"google-analytics\.com",
+    r"googletagmanager\.com",
+    r"doubleclick\.net",
+    r"googlesyndication\.com",
+    r"connect\.facebook\.net",
+    r"wcs\.naver\.(net|com)",
+    r"static\.hotjar\.com",
+    r"clarity\.ms",
+    r"channel\.io",
+)
+
+# 차단한 리소스 크기 캐시 (URL → bytes, 프로세스 전역 - 배너/폰트는 페이지마다 반복되므로 URL당 1회 측정)
+_sizes: Dict[str, Optional[int]] = {}
+
+
+class ResourcePolicy:
+    """
+    크롤러별 리소스 허용 정책
+
+    판정 순서: allow_patterns 매치 → 허용, block_patterns 매치 → 차단,
+    allow_types에 있는 타입 → 허용, 나머지 → 차단
+    """
+
+    def __init__(
+        self,
+        allow_types: Iterable[str] = DEFAULT_ALLOW_TYPES,
+        allow_patterns: Iterable[str] = (),
+        block_patterns: Iterable[str] = DEFAULT_BLOCK_PATTERNS
+    ):
+        self.allow_types = frozenset(allow_types)
+        self.allow_patterns = [re.compile(p) for p in allow_patterns]
+        self.block_patterns = [re.compile(p) for p in block_patterns]
+
+    def blocks(self, resource_type: str, url: str) -> bool:
+        if any(p.search(url) for p in self.allow_patterns):
+            return False
+        if any(p.search(url) for p in self.block_patterns):
+            return True
+        return resource_type not in self.allow_types
+
+    async def apply(self, page: Page, stats: "ResourceStats"):
+        """페이지의 모든 요청에 정책 적용 (페이지가 닫히면 route도 함께 사라짐)"""
+        async def handle(route: Route):
+            request = route.request
+            if self.blocks(request.resource_type, request.url):
+                stats.record_blocked(request.resource_type, request.url)
+                await route.abort("blockedbyclient")
+            else:
+                stats.allowed += 1
+                await NetSession.handle_route(route)  # 녹화/재생 중이 아니면 그대로 진행
+
+        await page.route("**/*", handle)
+
+
+class ResourceStats:
+    """크롤러별 차단 통계 - 차단 요청 수(타입별)와 절약한 바이트 (크기를 하나도 모르면 None)"""
+
+    def __init__(self, base_domain: str):
+        self.host = urlsplit(base_domain).hostname or ""
+        self.allowed = 0
+        self.blocked = 0
+        self.blocked_by_type: Dict[str, int] = {}
+        self.bytes_avoided = 0
+        self.unsized = 0          # 크기를 모르는 차단 요청 (외부 도메인, Content-Length 없음)
+        self._pending: Set[asyncio.Task] = set()
+
+    def record_blocked(self, resource_type: str, url: str):
+        self.blocked += 1
+        self.blocked_by_type[resource_type] = self.blocked_by_type.get(resource_type, 0) + 1
+
+        # 같은 사이트 리소스만 HEAD로 크기 측정 (외부 추적 도메인에는 요청하지 않음)
+        if not settings.RESOURCE_MEASURE_BLOCKED or urlsplit(url).hostname != self.host:
+            self.unsized += 1
+            return
+        if url in _sizes:
+            self._add_size(_sizes[url])
+            return
+        task = asyncio.ensure_future(self._measure(url))
+        self._pending.add(task)
+        task.add_done_callback(self._pending.discard)
+
+    def _add_size(self, size: Optional[int]):
+        if size is None:
+            self.unsized += 1
+        else:
+            self.bytes_avoided += size
+
+    async def _measure(self, url: str):
+        size = None
+        try:
+            async with HostScheduler.slot(url):
+                response = await HttpClient.get().head(url)
+            if response.is_success and response.headers.get("content-length", "").isdigit():
+                size = int(response.headers["content-length"])
+        except Exception as e:
+            logger.debug(f"차단 리소스 크기 측정 실패 ({url}): {e}")
+        _sizes[url] = size
+        self._add_size(size)
+
+    async def flush(self):
+        """진행 중인 크기 측정 완료 대기"""
+        if self._pending:
+            await asyncio.gather(*list(self._pending), return_exceptions=True)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "allowed": self.allowed,
+            "blocked": self.blocked,
+            "blocked_by_type": dict(self.blocked_by_type),
+            "bytes_avoided": self.bytes_avoided if self.blocked > self.unsized else None,
+            "unsized": self.unsized,
+        }
+
+
+def merge_resource_stats(results: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """여러 크롤러의 리소스 차단 통계 합산"""
+    results = [stats for stats in results if stats]
+    if not results:
+        return {}
+
+    merged: Dict[str, Any] = {"allowed": 0, "blocked": 0, "blocked_by_type": {}, "bytes_avoided": None, "unsized": 0}
+    for stats in results:
+        for key in ("allowed", "blocked", "unsized"):
+            merged[key] += stats[key]
+        if stats["bytes_avoided"] is not None:
+            merged["bytes_avoided"] = (merged["bytes_avoided"] or 0) + stats["bytes_avoided"]
+        for kind, count in stats["blocked_by_type"].items():
+            merged["blocked_by_type"][kind] = merged["blocked_by_type"].get(kind, 0) + count
+    return merged
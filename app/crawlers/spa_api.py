@@ -0,0 +1,205 @@
+"""
+SPA 백엔드 JSON API 유틸리티
+브라우저에서 SPA가 호출하는 JSON 요청을 캡처하고, 값만 바꿔 HTTP로 재현할 수 있게 합니다.
+"""
+import json
+import asyncio
+import logging
+from typing import List, Dict, Any, Optional, Tuple, Iterator, Callable, Awaitable
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode, quote, unquote
+from playwright.async_api import Page, Response
+
+from app.core.host_scheduler import HostScheduler, HostSlot
+
+logger = logging.getLogger(__name__)
+
+Path = Tuple[Any, ...]
+
+
+class CapturedJson:
+    """브라우저에서 캡처한 JSON 응답 1건"""
+
+    def __init__(self, method: str, url: str, post_data: Optional[str], content_type: str, data: Any):
+        self.method = method
+        self.url = url
+        self.post_data = post_data
+        self.content_type = content_type  # 요청 Content-Type
+        self.data = data
+
+
+async def capture_json(page: Page, action: Callable[[], Awaitable[Any]]) -> List[CapturedJson]:
+    """action(페이지 이동 등)을 실행하는 동안 오는 JSON 응답을 모두 캡처"""
+    captured: List[CapturedJson] = []
+    pending = []
+
+    async def read(response: Response):
+        if "json" not in (response.headers.get("content-type") or ""):
+            return
+        try:
+            data = await response.json()
+        except Exception:
+            return
+        request = response.request
+        captured.append(CapturedJson(
+            request.method,
+            request.url,
+            request.post_data,
+            request.headers.get("content-type", ""),
+            data
+        ))
+
+    def on_response(response: Response):
+        pending.append(asyncio.ensure_future(read(response)))
+
+    page.on("response", on_response)
+    try:
+        await action()
+    finally:
+        page.remove_listener("response", on_response)
+        await asyncio.gather(*pending, return_exceptions=True)
+    return captured
+
+
+def iter_nodes(data: Any, path: Path = ()) -> Iterator[Tuple[Path, Any]]:
+    """JSON 트리의 모든 노드를 (경로, 값)으로 순회"""
+    yield path, data
+    if isinstance(data, dict):
+        for key, value in data.items():
+            yield from iter_nodes(value, path + (key,))
+    elif isinstance(data, list):
+        for i, value in enumerate(data):
+            yield from iter_nodes(value, path + (i,))
+
+
+def iter_record_lists(data: Any) -> Iterator[Tuple[Path, List[Dict[str, Any]]]]:
+    """JSON 안의 dict 리스트(레코드 목록)를 모두 (경로, 리스트)로 반환"""
+    for path, node in iter_nodes(data):
+        if isinstance(node, list) and node and all(isinstance(item, dict) for item in node):
+            yield path, node
+
+
+def get_path(data: Any, path: Path) -> Any:
+    """경로의 값 (없으면 None)"""
+    for key in path:
+        try:
+            data = data[key]
+        except (KeyError, IndexError, TypeError):
+            return None
+    return data
+
+
+def find_key(record: Dict[str, Any], match: Callable[[Any], bool]) -> Optional[str]:
+    """조건에 맞는 값을 가진 첫 번째 키"""
+    return next((key for key, value in record.items() if match(value)), None)
+
+
+def _replace_value(data: Any, value: str, placeholder: str) -> Any:
+    """JSON 안에서 value와 같은 스칼라 값을 placeholder로 치환 (숫자였으면 "{#name}")"""
+    if isinstance(data, dict):
+        return {k: _replace_value(v, value, placeholder) for k, v in data.items()}
+    if isinstance(data, list):
+        return [_replace_value(v, value, placeholder) for v in data]
+    if not isinstance(data, bool) and data is not None and str(data) == value:
+        return placeholder.replace("{", "{#") if isinstance(data, int) else placeholder
+    return data
+
+
+def _fill(data: Any, values: Dict[str, str]) -> Any:
+    """placeholder("{name}", 숫자면 "{#name}")를 실제 값으로 채움"""
+    if isinstance(data, dict):
+        return {k: _fill(v, values) for k, v in data.items()}
+    if isinstance(data, list):
+        return [_fill(v, values) for v in data]
+    if isinstance(data, str) and data.startswith("{") and data.endswith("}"):
+        name = data[1:-1]
+        if name.startswith("#") and name[1:] in values:
+            return int(values[name[1:]])
+        if name in values:
+            return values[name]
+    return data
+
+
+class Endpoint:
+    """
+    캡처한 요청 템플릿 - URL 경로/쿼리/본문 중 특정 값을 "{이름}"으로 바꿔 두고
+    fetch 시 실제 값을 채워 같은 요청을 재현
+    """
+
+    def __init__(self, method: str, url: str, body: Any = None, body_kind: Optional[str] = None):
+        self.method = method
+        self.url = url
+        self.body = body            # dict(json) / list[(k, v)](form) / None
+        self.body_kind = body_kind  # "json" / "form" / None
+
+    @classmethod
+    def from_captured(cls, captured: CapturedJson) -> "Endpoint":
+        body, kind = None, None
+        if captured.post_data:
+            if "json" in captured.content_type:
+                body, kind = json.loads(captured.post_data), "json"
+            else:
+                body, kind = parse_qsl(captured.post_data, keep_blank_values=True), "form"
+        return cls(captured.method, captured.url, body, kind)
+
+    def placeholders(self) -> str:
+        return self.url + json.dumps(self.body, ensure_ascii=False, default=str)
+
+    def has(self, name: str) -> bool:
+        text = unquote(self.placeholders())
+        return "{" + name + "}" in text or "{#" + name + "}" in text
+
+    def templated(self, value: Any, name: str, keys: Optional[Tuple[str, ...]] = None) -> "Endpoint":
+        """
+        value와 같은 값을 "{name}"으로 치환한 새 템플릿
+
+        keys를 주면 쿼리/본문에서 그 키(대소문자 무시)만 치환, 없으면 경로 세그먼트까지 모두 치환
+        """
+        value = str(value)
+        placeholder = "{" + name + "}"
+        lowered = {k.lower() for k in keys} if keys else None
+
+        def match_key(key: str) -> bool:
+            return lowered is None or key.lower() in lowered
+
+        parts = urlsplit(self.url)
+        path = parts.path
+        if lowered is None:
+            path = "/".join(placeholder if seg == value else seg for seg in parts.path.split("/"))
+        query = urlencode(
+            [(k, placeholder if v == value and match_key(k) else v) for k, v in parse_qsl(parts.query, keep_blank_values=True)],
+            safe="{}"
+        )
+        url = urlunsplit((parts.scheme, parts.netloc, path, query, parts.fragment))
+
+        body = self.body
+        if self.body_kind == "json" and isinstance(body, dict):
+            body = {
+                k: (_replace_value(v, value, placeholder) if match_key(k) else v)
+                for k, v in body.items()
+            } if lowered is not None else _replace_value(body, value, placeholder)
+        elif self.body_kind == "form":
+            body = [(k, placeholder if v == value and match_key(k) else v) for k, v in body]
+
+        return Endpoint(self.method, url, body, self.body_kind)
+
+    async def fetch(self, client, **values: Any) -> Any:
+        """값을 채워 요청하고 JSON 반환"""
+        values = {k: str(v) for k, v in values.items()}
+        url = self.url
+        for name, value in values.items():
+            url = url.replace(quote("{" + name + "}"), quote(value, safe="")).replace("{" + name + "}", quote(value, safe=""))
+
+        kwargs: Dict[str, Any] = {}
+        if self.body_kind == "json":
+            kwargs["json"] = _fill(self.body, values)
+        elif self.body_kind == "form":
+            kwargs["content"] = urlencode([(k, str(_fill(v, values))) for k, v in self.body])
+            kwargs["headers"] = {"Content-Type": "application/x-www-form-urlencoded"}
+
+        async def request(slot: HostSlot) -> Any:
+            response = await client.request(self.method, url, **kwargs)
+            slot.check(response.status_code, response.headers.get("retry-after"))
+            response.raise_for_status()
+            return response.json()
+
+        return await HostScheduler.run(url, request)
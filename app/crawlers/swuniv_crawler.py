@@ -5,6 +5,8 @@ URL 패턴: swuniv.jbnu.ac.kr/main/jbnusw?gc=605XOAS
 import logging
 from typing import Dict, Any, Optional
 from .base import BaseCrawler
+from .readiness import Readiness
+from .http_engine import HttpEngineMixin
 
 logger = logging.getLogger(__name__)
 
@@ -17,23 +19,24 @@ class SwunivCrawler(BaseCrawler):
     content_selector = ".content_wrap"
     attachment_selector = "a[href*='download'], a[href*='file']"
 
-    async def _navigate_to_page(self, url: str, page_num: int) -> bool:
-        """SWUNIV 특수 URL 패턴 페이지네이션"""
-        page_url = f"{url}&do=list&page={page_num}"
-        await self.page.goto(page_url, wait_until="networkidle", timeout=30000)
-        await self.page.wait_for_timeout(2000)
-        return True
+    row_schema = {
+        "title": {"selector": "td a"},
+        "href": {"selector": "td a", "attr": "href"},
+        "cells": {"selector": "td", "all": True},
+    }
 
-    async def parse_row(self, row, base_url: str) -> Optional[Dict[str, Any]]:
-        """단일 행 파싱"""
-        title_el = await row.query_selector("td a")
-        if not title_el:
-            return None
+    list_ready = Readiness(stable=True)
+    detail_ready = Readiness(non_empty=True)
 
-        title = await title_el.inner_text()
-        href = await title_el.get_attribute("href")
+    def _list_url(self, url: str, page_num: int) -> str:
+        """SWUNIV 특수 URL 패턴 페이지네이션"""
+        return f"{url}&do=list&page={page_num}"
 
-        if not href:
+    def parse_row(self, row: Dict[str, Any], base_url: str) -> Optional[Dict[str, Any]]:
+        """단일 행 파싱"""
+        title = row.get("title")
+        href = row.get("href")
+        if title is None or not href:
             return None
 
         # URL 처리
@@ -48,13 +51,11 @@ class SwunivCrawler(BaseCrawler):
             full_url = href
 
         # 날짜와 작성자 찾기
-        cells = await row.query_selector_all("td")
         date_text = ""
         author = None
 
-        for i, cell in enumerate(cells):
-            text = await cell.inner_text()
-            text = text.strip()
+        for i, text in enumerate(row.get("cells") or []):
+            text = (text or "").strip()
 
             # 날짜 패턴 체크 (YYYY-MM-DD)
             if len(text) == 10 and text[4] == "-" and text[7] == "-":
@@ -68,3 +69,7 @@ class SwunivCrawler(BaseCrawler):
             "date": date_text,
             "author": author
         }
+
+
+class SwunivHttpCrawler(HttpEngineMixin, SwunivCrawler):
+    """SW중심대학사업단 크롤러 (HTTP 엔진, 브라우저 없음)"""
@@ -0,0 +1,79 @@
+"""
+공지 버전 관리 유틸리티
+본문 해시로 변경 여부를 판단하고, 이전 버전은 새 버전 기준 역방향 줄 단위 diff로 저장합니다.
+"""
+import json
+import hashlib
+import difflib
+from typing import List, Dict, Any
+
+# 해시/이력 대상 필드
+VERSIONED_FIELDS = ("title", "content", "attachments")
+
+
+def content_hash(notice: Dict[str, Any]) -> str:
+    """제목 + 본문 + 첨부파일 해시 (sha256 hex)"""
+    payload = json.dumps(
+        {
+            "title": notice.get("title") or "",
+            "content": notice.get("content") or "",
+            "attachments": [
+                {"name": a.get("name"), "url": a.get("url")}
+                for a in (notice.get("attachments") or [])
+            ],
+        },
+        ensure_ascii=False,
+        sort_keys=True,
+        separators=(",", ":")
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def line_diff(old: str, new: str) -> List[List[Any]]:
+    """
+    new → old 복원용 줄 단위 diff
+
+    Returns:
+        [[시작 줄, 끝 줄, [old 줄들]], ...] - new의 [시작, 끝) 줄을 old 줄들로 바꾸면 old
+    """
+    old_lines = old.split("\n")
+    new_lines = new.split("\n")
+    matcher = difflib.SequenceMatcher(None, new_lines, old_lines, autojunk=False)
+    return [
+        [i1, i2, old_lines[j1:j2]]
+        for tag, i1, i2, j1, j2 in matcher.get_opcodes()
+        if tag != "equal"
+    ]
+
+
+def restore(new: str, diff: List[List[Any]]) -> str:
+    """line_diff 결과로 이전 버전 복원"""
+    lines = new.split("\n")
+    for start, end, old_lines in reversed(diff):
+        lines[start:end] = old_lines
+    return "\n".join(lines)
+
+
+def version_diff(old: Dict[str, Any], new: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    바뀐 필드만 담은 이력 항목
+
+    title/attachments는 이전 값 그대로, content는 line_diff
+    """
+    diff: Dict[str, Any] = {}
+    if (old.get("title") or "") != (new.get("title") or ""):
+        diff["title"] = old.get("title")
+    if (old.get("content") or "") != (new.get("content") or ""):
+        diff["content"] = line_diff(old.get("content") or "", new.get("content") or "")
+    if (old.get("attachments") or []) != (new.get("attachments") or []):
+        diff["attachments"] = old.get("attachments") or []
+    return diff
+
+
+def restore_version(new: Dict[str, Any], diff: Dict[str, Any]) -> Dict[str, Any]:
+    """현재 버전과 이력 항목으로 이전 버전 (title, content, attachments) 복원"""
+    return {
+        "title": diff.get("title", new.get("title")),
+        "content": restore(new.get("content") or "", diff["content"]) if "content" in diff else new.get("content"),
+        "attachments": diff.get("attachments", new.get("attachments")),
+    }
@@ -0,0 +1,89 @@
+"""
+URL별 크롤링 워터마크
+board["urls"][i]["watermark"]에 지난 크롤링에서 본 가장 최신 글(post_id, url, date)을 저장하고,
+다음 크롤링은 목록이 그 지점에 도달한 페이지에서 멈춥니다.
+board["urls"][i]["fingerprint"]는 목록 1페이지 상단 행의 지문으로, 변경 탐지(probe)에 씁니다.
+board["urls"][i]["refreshed_at"]은 최근 공지 재확인 순회를 마친 시각으로, DETAIL_REFRESH_HOURS마다
+워터마크/변경 탐지와 상관없이 게시일이 DETAIL_REFRESH_MAX_AGE_DAYS 이내인 페이지를 모두 다시 읽습니다.
+"""
+import re
+import hashlib
+from datetime import datetime, timedelta
+from typing import Dict, Any, List, Optional, Tuple
+
+from app.config import settings
+
+_DAY = re.compile(r"^\d{4}-\d{2}-\d{2}$")
+
+
+def notice_day(date: Optional[str]) -> Optional[str]:
+    """목록 날짜를 YYYY-MM-DD로 정규화 (형식이 다르면 None)"""
+    day = (date or "").strip().replace(".", "-")[:10]
+    return day if _DAY.match(day) else None
+
+
+class Watermark:
+    """지난 크롤링에서 본 가장 최신 글"""
+
+    def __init__(self, url: str, date: Optional[str], post_id: Optional[int] = None):
+        self.url = url
+        self.date = notice_day(date)
+        self.post_id = post_id
+
+    @classmethod
+    def from_dict(cls, data: Optional[Dict[str, Any]]) -> Optional["Watermark"]:
+        if not data or not data.get("url"):
+            return None
+        return cls(data["url"], data.get("date"), data.get("post_id"))
+
+    def key(self) -> Tuple[str, int]:
+        """최신 순 비교 키 (날짜, 글 번호)"""
+        return (self.date or "", self.post_id if self.post_id is not None else -1)
+
+    def is_older(self, other: "Watermark") -> bool:
+        """other가 이 워터마크보다 확실히 이전 글인지 (같은 날이면 글 번호로 판단)"""
+        if not self.date or not other.date:
+            return False
+        if other.date != self.date:
+            return other.date < self.date
+        return self.post_id is not None and other.post_id is not None and other.post_id < self.post_id
+
+    def reached(self, page: List["Watermark"]) -> bool:
+        """
+        목록 한 페이지가 이미 본 구간에 도달했는지
+
+        - 워터마크 글이 페이지에 있음
+        - 워터마크 글이 삭제된 경우: 날짜를 읽은 모든 행이 워터마크보다 이전 글
+          (상단 고정 공지처럼 일부 행만 오래된 경우는 도달로 보지 않음)
+        """
+        if any(row.url == self.url for row in page):
+            return True
+        dated = [row for row in page if row.date]
+        return bool(dated) and all(self.is_older(row) for row in dated)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "post_id": self.post_id,
+            "url": self.url,
+            "date": self.date,
+            "updated_at": datetime.utcnow(),
+        }
+
+
+def list_fingerprint(marks: List[Watermark]) -> str:
+    """목록 상단 행들의 지문 (글 번호/URL/날짜만 사용 - 엔진에 따라 달라지는 제목 공백 등은 제외)"""
+    payload = "\n".join(f"{mark.post_id}|{mark.url}|{mark.date or ''}" for mark in marks)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def refresh_due(url_info: Dict[str, Any], now: datetime) -> bool:
+    """최근 공지 재확인 순회가 필요한지 (마지막 순회 후 DETAIL_REFRESH_HOURS가 지남)"""
+    if settings.DETAIL_REFRESH_HOURS <= 0 or settings.DETAIL_REFRESH_MAX_AGE_DAYS <= 0:
+        return False
+    refreshed_at = url_info.get("refreshed_at")
+    return refreshed_at is None or now - refreshed_at >= timedelta(hours=settings.DETAIL_REFRESH_HOURS)
+
+
+def refresh_cutoff(now: datetime) -> str:
+    """재확인 구간의 가장 오래된 게시일 (YYYY-MM-DD)"""
+    return (now - timedelta(days=settings.DETAIL_REFRESH_MAX_AGE_DAYS)).strftime("%Y-%m-%d")
@@ -10,6 +10,13 @@ from contextlib import asynccontextmanager
 
 from app.api import notices
 from app.core.database import Database, init_boards
+from app.core.browser_pool import BrowserPool
+from app.core.http_client import HttpClient
+from app.core.host_scheduler import HostScheduler
+from app.core.extract_pool import ExtractPool
+from app.core.net_session import NetSession
+from app.services.schedule_service import CrawlScheduler
+from app.services.job_service import resume_jobs, stop_jobs
 from app.config import settings
 
 # 로깅 설정
@@ -40,6 +47,19 @@ async def lifespan(app: FastAPI):
     # 초기 게시판 데이터 (없으면)
     await init_boards()
 
+    # 크롤러용 공유 브라우저 풀
+    await BrowserPool.start()
+
+    # 네트워크 세션 녹화/재생 (NET_SESSION 설정 시)
+    NetSession.start()
+
+    # 이전 프로세스에서 끝나지 않은 크롤링 작업
+    await resume_jobs()
+
+    # 게시판별 자동 크롤링
+    if settings.SCHEDULER_ENABLED:
+        CrawlScheduler.start()
+
     print(f"📍 API 문서: http://{settings.API_HOST}:{settings.API_PORT}/docs")
     print("=" * 50)
 
@@ -47,6 +67,11 @@ async def lifespan(app: FastAPI):
 
     # ===== 종료 =====
     print("🛑 서버 종료 중...")
+    await CrawlScheduler.stop()
+    await stop_jobs()
+    await BrowserPool.stop()
+    ExtractPool.stop()
+    await HttpClient.close()
     await Database.disconnect()
 
 
@@ -58,7 +83,7 @@ app = FastAPI(
 
 ## 기능
 - 📢 공지사항 조회 및 검색
-- 🔄 크롤링 실행
+- 🔄 크롤링 실행 (게시 빈도에 맞춘 자동 크롤링)
 - 📋 게시판 관리
     """,
     version="2.0.0",
@@ -81,7 +106,15 @@ app.include_router(notices.router)
 @app.get("/health")
 async def health_check():
     """헬스체크"""
-    return {"status": "ok", "version": "2.0.0"}
+    return {
+        "status": "ok",
+        "version": "2.0.0",
+        "browser_pool": BrowserPool.stats(),
+        "hosts": HostScheduler.stats(),
+        "extract_pool": ExtractPool.stats(),
+        "net_session": NetSession.stats(),
+        "scheduler": CrawlScheduler.stats()
+    }
 
 
 if __name__ == "__main__":
@@ -34,6 +34,9 @@ class BoardUrl(BaseModel):
     """게시판 URL 정보"""
     url: str
     name: str  # "학사공지", "장학공지" 등
+    watermark: Optional[dict] = None  # 지난 크롤링의 최신 글 {"post_id", "url", "date", "updated_at"}
+    fingerprint: Optional[str] = None  # 지난 크롤링의 목록 1페이지 지문 (변경 탐지가 비교)
+    refreshed_at: Optional[datetime] = None  # 최근 공지 재확인 순회를 마친 시각 (DETAIL_REFRESH_HOURS마다 다시 순회)
 
 
 class BoardInDB(BaseModel):
@@ -43,9 +46,14 @@ class BoardInDB(BaseModel):
     group: str                        # "전북대", "단과대", "학과", "사업단"
     urls: List[BoardUrl]
     crawler_type: str                 # "csai", "eng", "jbnu", "swuniv"
+    engine: str = "browser"           # "browser" (Playwright), "http" (httpx + HTML 파서), "api" (SPA 백엔드 JSON)
     color: str                        # "#4CAF50"
     is_active: bool = True
     last_crawled_at: Optional[datetime] = None
+    last_checked_at: Optional[datetime] = None  # 마지막 크롤링/변경 탐지 시각 (게시 빈도 계산 기준)
+    post_rate: Optional[float] = None           # 게시 빈도 (새 공지/시간, 지수이동평균)
+    next_crawl_at: Optional[datetime] = None    # 스케줄러의 다음 크롤링 시각
+    pending_batch: Optional[PyObjectId] = None  # 작업 큐에 넣은 마지막 URL 작업 묶음 (끝나면 제거)
     created_at: Optional[datetime] = None
 
     model_config = {
@@ -76,6 +84,9 @@ class NoticeInDB(BaseModel):
     date: str                         # "2026-01-30"
     board_id: PyObjectId
     board_name: str                   # denormalized
+    content_hash: Optional[str] = None          # sha256(제목 + 본문 + 첨부파일)
+    detail_checked_at: Optional[datetime] = None  # 마지막 상세 확인 시각
+    reextracted_at: Optional[datetime] = None     # 보관된 원본으로 마지막 재추출한 시각
     crawled_at: datetime
 
     model_config = {
@@ -85,6 +96,46 @@ class NoticeInDB(BaseModel):
     }
 
 
+class NoticeHistoryInDB(BaseModel):
+    """MongoDB notice_history 컬렉션 모델 (변경 전 버전)"""
+    id: Optional[PyObjectId] = Field(default=None, alias="_id")
+    notice_id: PyObjectId
+    url: str
+    board_id: PyObjectId
+    changed_at: datetime
+    prev_hash: str                    # 변경 전 content_hash
+    hash: str                         # 변경 후 content_hash
+    diff: dict                        # {"title": 이전 제목, "content": [[시작, 끝, [이전 줄]]], "attachments": [...]} (바뀐 필드만)
+    source: Optional[str] = None      # "reextract": 보관된 원본 재추출로 바뀜 (없으면 크롤링)
+
+    model_config = {
+        "populate_by_name": True,
+        "json_encoders": {ObjectId: str},
+        "arbitrary_types_allowed": True
+    }
+
+
+class RawPageInDB(BaseModel):
+    """MongoDB raw_pages 컬렉션 모델 (상세 페이지 원본 HTML 보관소)"""
+    id: Optional[PyObjectId] = Field(default=None, alias="_id")
+    url: str                          # (url, html_hash) unique
+    html_hash: str                    # sha256(원본 HTML)
+    board_id: PyObjectId
+    kind: str = "page"                # "page": 상세 페이지 전체, "fragment": JSON API 본문 HTML 조각
+    encoding: str = "gzip"
+    body: bytes                       # 압축된 원본 HTML
+    size: int                         # 원본 바이트 수
+    compressed_size: int
+    created_at: datetime
+    fetched_at: datetime              # 같은 원본을 마지막으로 본 시각
+
+    model_config = {
+        "populate_by_name": True,
+        "json_encoders": {ObjectId: str},
+        "arbitrary_types_allowed": True
+    }
+
+
 class NoticeResponse(BaseModel):
     """공지사항 API 응답 모델"""
     id: str
@@ -107,12 +158,70 @@ class NoticeListResponse(BaseModel):
 
 # ========== 크롤링 관련 ==========
 
+class CrawlJobInDB(BaseModel):
+    """MongoDB crawl_jobs 컬렉션 모델 (비동기 크롤링 작업)"""
+    id: Optional[PyObjectId] = Field(default=None, alias="_id")
+    mode: str = "local"               # "local": 이 서버에서 실행, "queue": 작업 큐에 넣고 워커가 실행
+    status: str                       # "queued", "running", "done", "failed", "cancelled"
+    owner: Optional[str] = None       # 실행 중인 프로세스 (재시작 시 죽은 프로세스의 작업만 다시 실행)
+    boards: Optional[List[str]] = None  # 게시판 slug (None이면 전체)
+    created_at: datetime
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
+    attempts: int = 0                 # 실행 횟수 (재시작 후 이어서 실행하면 증가)
+    progress: dict = {}               # {게시판 이름: {"pages", "details", "new", "updated", "unchanged"}}
+    result: Optional[dict] = None     # crawl_all 결과
+    error: Optional[str] = None
+    cancel_requested: bool = False
+
+    model_config = {
+        "populate_by_name": True,
+        "json_encoders": {ObjectId: str},
+        "arbitrary_types_allowed": True
+    }
+
+
+class CrawlTaskInDB(BaseModel):
+    """MongoDB crawl_tasks 컬렉션 모델 (작업 큐의 게시판 URL 크롤링 작업)"""
+    id: Optional[PyObjectId] = Field(default=None, alias="_id")
+    batch: PyObjectId                 # 같이 넣은 게시판 URL 작업 묶음
+    board_id: PyObjectId
+    board_name: str
+    url: str
+    job_ids: List[PyObjectId] = []    # 이 작업을 기다리는 크롤링 작업
+    status: str                       # "queued", "running", "done", "failed", "cancelled"
+    active: Optional[bool] = None     # 대기/실행 중이면 True (URL당 하나, 부분 유니크 인덱스)
+    owner: Optional[str] = None       # 실행 중인 워커
+    lease_until: Optional[datetime] = None  # 리스 만료 시각 (지나면 다른 워커가 가져감)
+    not_before: Optional[datetime] = None   # 게시판 리스가 사용 중이라 미룬 작업의 다음 실행 가능 시각
+    attempts: int = 0
+    checkpoint: Optional[dict] = None  # {"page", "url", "newest", "fingerprint"} - 마지막으로 저장한 목록 페이지
+    progress: dict = {}               # {"pages", "details", "new", "updated", "unchanged"}
+    result: Optional[dict] = None     # {"new", "updated", "unchanged"}
+    error: Optional[str] = None
+    cancel_requested: bool = False
+    created_at: datetime
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
+
+    model_config = {
+        "populate_by_name": True,
+        "json_encoders": {ObjectId: str},
+        "arbitrary_types_allowed": True
+    }
+
+
 class CrawlResult(BaseModel):
     """크롤링 결과"""
     board_name: str
     new: int
     updated: int
-    error: Optional[str] = None
+    unchanged: int = 0
+    skipped: bool = False             # 다른 프로세스가 크롤링 중이라 건너뜀
+    error: Optional[str] = None       # 게시판 전체 실패 시 대표 오류
+    errors: List[dict] = []           # 실패한 URL별 [{"url", "error"}] (일부 URL만 실패해도 포함)
 
 
 class CrawlResponse(BaseModel):
@@ -3,10 +3,13 @@
 REST API와 MCP가 공유하는 비즈니스 로직
 """
 from .crawl_service import crawl_board, crawl_all
+from .probe_service import probe_and_crawl
+from .job_service import submit_crawl_job, get_job, list_jobs, cancel_job
 from .notice_service import (
     get_notices,
     search_notices,
     get_notice_by_id,
+    get_notice_history,
     get_boards,
     get_boards_by_group
 )
@@ -14,9 +17,15 @@ from .notice_service import (
 __all__ = [
     "crawl_board",
     "crawl_all",
+    "probe_and_crawl",
+    "submit_crawl_job",
+    "get_job",
+    "list_jobs",
+    "cancel_job",
     "get_notices",
     "search_notices",
     "get_notice_by_id",
+    "get_notice_history",
     "get_boards",
     "get_boards_by_group"
 ]
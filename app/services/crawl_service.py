@@ -2,71 +2,265 @@
 크롤링 서비스
 REST API와 MCP가 공유하는 크롤링 로직
 """
-from typing import Dict, List, Optional
+import time
+import asyncio
+import logging
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional, Type
 from bson import ObjectId
 
+from app.config import settings
 from app.core.database import Database
-from app.crawlers import CRAWLER_MAP
+from app.core.browser_pool import BrowserPool
+from app.core.crawl_limiter import CrawlLimiter
+from app.core.crawl_lease import CrawlLease, LeaseLostError
+from app.core.host_scheduler import HostScheduler
+from app.crawlers import BaseCrawler, get_crawler_class
+from app.crawlers.pipeline import ProgressCallback, merge_stage_stats
+from app.crawlers.readiness import merge_wait_stats
+from app.crawlers.resource_policy import merge_resource_stats
 
+logger = logging.getLogger(__name__)
 
-async def crawl_board(board_id: str) -> Dict:
+# 게시 빈도 지수이동평균 가중치 (최근 관측 비중)
+POST_RATE_ALPHA = 0.3
+
+
+def crawl_interval(post_rate: Optional[float]) -> timedelta:
+    """
+    게시 빈도(새 공지/시간) → 다음 크롤링까지 간격
+
+    크롤링 1회에 새 공지 SCHEDULE_TARGET_NEW개가 쌓일 시간, SCHEDULE_MIN/MAX_INTERVAL_MIN 범위로 제한
+    """
+    low = settings.SCHEDULE_MIN_INTERVAL_MIN
+    high = max(low, settings.SCHEDULE_MAX_INTERVAL_MIN)
+    if not post_rate or post_rate <= 0:
+        return timedelta(minutes=high)
+    minutes = settings.SCHEDULE_TARGET_NEW / post_rate * 60
+    return timedelta(minutes=min(high, max(low, minutes)))
+
+
+async def record_board_check(board: Dict, new: int, now: Optional[datetime] = None):
+    """
+    게시판 확인 결과(새 공지 수)로 게시 빈도와 다음 크롤링 시각 갱신
+
+    직전 확인(last_checked_at, 없으면 last_crawled_at) 이후 시간 대비 새 공지 수를 지수이동평균에 반영합니다.
+    변경 탐지에서 바뀐 게 없던 확인도 new=0으로 기록합니다.
+    """
+    now = now or datetime.utcnow()
+    previous = board.get("last_checked_at") or board.get("last_crawled_at")
+    rate = board.get("post_rate")
+    if previous is not None:
+        hours = max((now - previous).total_seconds() / 3600, 0.1)
+        sample = new / hours
+        rate = sample if rate is None else POST_RATE_ALPHA * sample + (1 - POST_RATE_ALPHA) * rate
+
+    fields: Dict[str, Any] = {"last_checked_at": now, "next_crawl_at": now + crawl_interval(rate)}
+    if rate is not None:
+        fields["post_rate"] = round(rate, 4)
+    await Database.boards().update_one({"_id": board["_id"]}, {"$set": fields})
+
+
+def _board_result(board_name: str, **fields: Any) -> Dict[str, Any]:
+    """
+    게시판 크롤링 결과 - 성공/일부 실패/건너뜀/오류 모든 경로에서 같은 키
+
+    errors는 실패한 URL별 [{"url", "error"}] (일부 URL만 실패해도 포함), error는 게시판 전체가 실패했을 때의 대표 오류
+    """
+    return {
+        "board_name": board_name,
+        "new": 0,
+        "updated": 0,
+        "unchanged": 0,
+        "skipped": False,
+        "error": None,
+        "errors": [],
+        "stages": {},
+        "waits": {},
+        "resources": {},
+        **fields
+    }
+
+
+async def _crawl_url(
+    crawler_class: Type[BaseCrawler],
+    board: Dict,
+    url_info: Dict[str, Any],
+    progress: Optional[ProgressCallback] = None
+) -> Dict[str, Any]:
+    """
+    게시판 URL 하나를 자체 크롤러 인스턴스로 크롤링 (전역/호스트 슬롯 안에서)
+
+    URL마다 크롤러를 따로 만들어 목록 탭/컨텍스트를 공유하지 않으므로 동시에 실행해도 안전
+    """
+    async with CrawlLimiter.slot(url_info["url"]):
+        async with crawler_class(board["_id"], board["name"]) as crawler:
+            result = await crawler.crawl_url(url_info, progress=progress)
+            result.update(await crawler.crawl_stats())
+            return result
+
+
+class _Flight:
+    """진행 중인 게시판 크롤링 1건 - 같은 게시판 요청이 붙어서 결과를 공유 (single-flight)"""
+
+    def __init__(self, urls: Optional[List[str]]):
+        self.urls = None if urls is None else set(urls)
+        self.listeners: List[ProgressCallback] = []
+        self.waiters = 0
+        self.task: Optional[asyncio.Task] = None
+
+    def covers(self, urls: Optional[List[str]]) -> bool:
+        """요청한 URL이 모두 이 크롤링 범위에 들어가는지"""
+        return self.urls is None or (urls is not None and set(urls) <= self.urls)
+
+    def progress(self, board_name: str, **counts: int):
+        for listener in list(self.listeners):
+            listener(board_name, **counts)
+
+
+# 이 프로세스에서 진행 중인 게시판 크롤링 (게시판 id → _Flight)
+_flights: Dict[str, _Flight] = {}
+_coalesced = 0  # 진행 중인 크롤링에 붙은 요청 수
+
+
+async def _join(flight: _Flight, progress: Optional[ProgressCallback]) -> Dict:
+    """진행 중인 크롤링 결과 대기 - 기다리던 요청이 모두 취소되면 크롤링도 취소"""
+    if progress is not None:
+        flight.listeners.append(progress)
+    flight.waiters += 1
+    try:
+        return dict(await asyncio.shield(flight.task))
+    finally:
+        flight.waiters -= 1
+        if progress is not None:
+            flight.listeners.remove(progress)
+        if flight.waiters == 0 and not flight.task.done():
+            flight.task.cancel()
+
+
+async def _crawl_board_leased(board: Dict, crawler_class: Type[BaseCrawler], urls: Optional[List[str]], progress: ProgressCallback) -> Dict:
+    """프로세스 간 리스를 잡고 크롤링 - 다른 프로세스(API/MCP/워커)가 크롤링 중이면 건너뜀"""
+    try:
+        async with CrawlLease.hold(f"board:{board['_id']}") as acquired:
+            if not acquired:
+                logger.info(f"[{board['name']}] 다른 프로세스에서 크롤링 중, 건너뜀")
+                return _board_result(board["name"], skipped=True)
+
+            # 리스를 기다리는 사이 다른 프로세스가 갱신했을 수 있는 워터마크/지문을 다시 읽음
+            board = await Database.boards().find_one({"_id": board["_id"]}) or board
+            url_infos = [url_info for url_info in board["urls"] if urls is None or url_info["url"] in urls]
+            return await _crawl_board(board, crawler_class, url_infos, progress)
+    except LeaseLostError as e:
+        logger.error(f"[{board['name']}] 크롤링 중단: {e}")
+        return _board_result(board["name"], error=str(e))
+
+
+async def _crawl_board(board: Dict, crawler_class: Type[BaseCrawler], url_infos: List[Dict[str, Any]], progress: ProgressCallback) -> Dict:
+    """게시판 URL별 동시 크롤링 후 결과 합산"""
+    # 크롤링 실행 - URL별 동시 실행 (CRAWL_CONCURRENCY, CRAWL_PER_HOST 제한)
+    outcomes = await asyncio.gather(
+        *(_crawl_url(crawler_class, board, url_info, progress) for url_info in url_infos),
+        return_exceptions=True
+    )
+    results = []
+    errors = []
+    for url_info, outcome in zip(url_infos, outcomes):
+        if isinstance(outcome, BaseException):
+            logger.error(f"[{board['name']}] 크롤링 오류 ({url_info['url']}): {outcome}")
+            errors.append({"url": url_info["url"], "error": str(outcome)})
+        else:
+            results.append(outcome)
+
+    if errors and not results:
+        return _board_result(board["name"], error=errors[0]["error"], errors=errors)
+
+    now = datetime.utcnow()
+    new = sum(result["new"] for result in results)
+    await record_board_check(board, new, now)
+    await Database.boards().update_one(
+        {"_id": board["_id"]},
+        {"$set": {"last_crawled_at": now}}
+    )
+
+    return _board_result(
+        board["name"],
+        new=new,
+        updated=sum(result["updated"] for result in results),
+        unchanged=sum(result["unchanged"] for result in results),
+        errors=errors,
+        stages=merge_stage_stats([result["stages"] for result in results]),
+        waits=merge_wait_stats([result["waits"] for result in results]),
+        resources=merge_resource_stats([result["resources"] for result in results])
+    )
+
+
+async def crawl_board(
+    board_id: str,
+    urls: Optional[List[str]] = None,
+    progress: Optional[ProgressCallback] = None
+) -> Dict:
     """
     특정 게시판 크롤링
 
+    같은 게시판을 이미 크롤링 중이면 새로 시작하지 않고 그 결과를 함께 받습니다 (범위가 다르면 끝난 뒤 실행).
+    다른 프로세스가 크롤링 중이면 (crawl_leases) 건너뛰고 skipped=True를 반환합니다.
+
     Args:
         board_id: 게시판 ObjectId (문자열)
+        urls: 크롤링할 게시판 URL 목록 (None이면 전체, 변경 탐지에서 바뀐 URL만 넘김)
+        progress: 진행 상황 콜백 (크롤링 작업의 진행률 기록용)
 
     Returns:
-        {"board_name": "...", "new": 0, "updated": 0, "error": None}
+        {"board_name": "...", "new": 0, "updated": 0, "unchanged": 0, "skipped": False, "error": None,
+         "errors": [{"url", "error"}], "stages": {...}, "waits": {...}, "resources": {...}}
     """
+    global _coalesced
+
     # ObjectId 변환
     try:
         oid = ObjectId(board_id)
     except Exception:
-        return {"board_name": "unknown", "new": 0, "updated": 0, "error": "Invalid board_id"}
+        return _board_result("unknown", error="Invalid board_id")
 
     # 게시판 조회
     board = await Database.boards().find_one({"_id": oid})
     if not board:
-        return {"board_name": "unknown", "new": 0, "updated": 0, "error": "Board not found"}
+        return _board_result("unknown", error="Board not found")
 
     # 크롤러 선택
-    crawler_class = CRAWLER_MAP.get(board["crawler_type"])
+    crawler_class = get_crawler_class(board)
     if not crawler_class:
-        return {
-            "board_name": board["name"],
-            "new": 0,
-            "updated": 0,
-            "error": f"Unknown crawler type: {board['crawler_type']}"
-        }
-
-    # 크롤링 실행
-    try:
-        async with crawler_class(board["_id"], board["name"]) as crawler:
-            result = await crawler.crawl_and_save(board["urls"])
+        return _board_result(board["name"], error=f"Unknown crawler type: {board['crawler_type']}")
+
+    key = str(oid)
+    while key in _flights:
+        flight = _flights[key]
+        if flight.covers(urls):
+            _coalesced += 1
+            logger.info(f"[{board['name']}] 진행 중인 크롤링에 합류")
+            return await _join(flight, progress)
+        # 범위가 다른 진행 중 크롤링은 끝날 때까지 기다린 뒤 실행
+        await asyncio.wait([flight.task])
 
-        return {
-            "board_name": board["name"],
-            "new": result["new"],
-            "updated": result["updated"],
-            "error": None
-        }
+    flight = _Flight(urls)
+    flight.task = asyncio.create_task(_crawl_board_leased(board, crawler_class, urls, flight.progress))
+    _flights[key] = flight
 
-    except Exception as e:
-        return {
-            "board_name": board["name"],
-            "new": 0,
-            "updated": 0,
-            "error": str(e)
-        }
+    def finished(_):
+        if _flights.get(key) is flight:
+            del _flights[key]
 
+    flight.task.add_done_callback(finished)
+    return await _join(flight, progress)
 
-async def crawl_all(board_slugs: Optional[List[str]] = None) -> Dict:
+
+async def crawl_all(board_slugs: Optional[List[str]] = None, progress: Optional[ProgressCallback] = None) -> Dict:
     """
     모든 (또는 특정) 게시판 크롤링
 
     Args:
         board_slugs: 크롤링할 게시판 slug 목록 (None이면 전체)
+        progress: 진행 상황 콜백 (크롤링 작업의 진행률 기록용)
 
     Returns:
         {"results": [...], "total_new": 0, "total_updated": 0}
@@ -78,20 +272,28 @@ async def crawl_all(board_slugs: Optional[List[str]] = None) -> Dict:
 
     boards = await Database.boards().find(query).to_list(100)
 
-    results = []
+    # 게시판 동시 실행 (실제 동시성은 crawl_board 안의 URL 슬롯이 제한)
+    started = time.perf_counter()
+    results = await asyncio.gather(*(crawl_board(str(board["_id"]), progress=progress) for board in boards))
+    elapsed = time.perf_counter() - started
+
     total_new = 0
     total_updated = 0
 
-    for board in boards:
-        result = await crawl_board(str(board["_id"]))
-        results.append(result)
-
+    for result in results:
         if not result.get("error"):
             total_new += result["new"]
             total_updated += result["updated"]
 
+    logger.info(f"전체 크롤링 완료: 게시판 {len(boards)}개, {elapsed:.1f}초 (최대 동시 URL {CrawlLimiter.peak}개)")
+    pool_stats = BrowserPool.stats()
+    logger.info(
+        f"브라우저 풀: 실행 {pool_stats['launches']}회, 대여 {pool_stats['leases']}회 "
+        f"(절약된 실행 {pool_stats['launches_saved']}회)"
+    )
+
     return {
-        "results": results,
+        "results": list(results),
         "total_new": total_new,
         "total_updated": total_updated
     }
@@ -110,8 +312,14 @@ async def get_crawl_status() -> Dict:
         "boards": [
             {
                 "name": board["name"],
-                "last_crawled_at": board.get("last_crawled_at")
+                "last_crawled_at": board.get("last_crawled_at"),
+                "post_rate": board.get("post_rate"),
+                "next_crawl_at": board.get("next_crawl_at")
             }
             for board in boards
-        ]
+        ],
+        "browser_pool": BrowserPool.stats(),
+        "crawl_limiter": CrawlLimiter.stats(),
+        "crawl_lease": {**CrawlLease.stats(), "in_flight": len(_flights), "coalesced": _coalesced},
+        "hosts": HostScheduler.stats()
     }
@@ -0,0 +1,323 @@
+"""
+크롤링 작업 서비스
+크롤링을 작업으로 제출하면 작업 id를 바로 돌려주고 백그라운드에서 crawl_all을 실행합니다.
+상태와 게시판별 진행률은 crawl_jobs 컬렉션에 저장되어 프로세스가 재시작돼도 남고,
+종료 시 실행 중이던 작업은 다음 시작 때 이어서 실행합니다.
+실행 중 작업은 진행률 저장(JOB_PROGRESS_FLUSH_SEC)마다 updated_at이 갱신되므로, 시작 시에는
+JOB_STALE_SEC 넘게 갱신이 없는 (실행하던 프로세스가 죽은) 작업만 다시 실행합니다.
+CRAWL_QUEUE 모드에서는 게시판 URL별 작업을 큐(crawl_tasks)에 넣기만 하고, 상태/진행률은 조회할 때 집계합니다.
+"""
+import asyncio
+import logging
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional
+from bson import ObjectId
+
+from app.config import settings
+from app.core.database import Database
+from app.core.crawl_lease import CrawlLease
+from .crawl_service import crawl_all
+from .task_service import enqueue_board, summarize_job_tasks, cancel_job_tasks
+
+logger = logging.getLogger(__name__)
+
+# 끝난 작업 상태
+FINISHED = ("done", "failed", "cancelled")
+
+# 이 프로세스에서 실행 중인 작업 (작업 id → task)
+_tasks: Dict[str, asyncio.Task] = {}
+_shutting_down = False
+
+
+class JobProgress:
+    """
+    작업의 게시판별 진행률 (파이프라인 progress 콜백)
+
+    콜백은 메모리에만 누적하고, JOB_PROGRESS_FLUSH_SEC마다 바뀐 경우만 저장합니다.
+    저장하면서 다른 프로세스에서 들어온 취소 요청(cancel_requested)도 확인합니다.
+    """
+
+    def __init__(self, job_id: ObjectId):
+        self.job_id = job_id
+        self.boards: Dict[str, Dict[str, int]] = {}
+        self._dirty = False
+
+    def __call__(self, board_name: str, **counts: int):
+        board = self.boards.setdefault(
+            board_name, {"pages": 0, "details": 0, "new": 0, "updated": 0, "unchanged": 0}
+        )
+        for key, value in counts.items():
+            board[key] = board.get(key, 0) + value
+        self._dirty = True
+
+    async def flush(self) -> bool:
+        """
+        진행률 저장
+
+        Returns:
+            취소 요청이 있으면 True
+        """
+        fields: Dict[str, Any] = {"updated_at": datetime.utcnow()}
+        if self._dirty:
+            fields["progress"] = self.boards
+            self._dirty = False
+        doc = await Database.crawl_jobs().find_one_and_update(
+            {"_id": self.job_id},
+            {"$set": fields},
+            projection={"cancel_requested": 1}
+        )
+        return bool(doc and doc.get("cancel_requested"))
+
+    async def watch(self, task: asyncio.Task):
+        """작업이 끝날 때까지 주기적으로 저장, 취소 요청이 보이면 작업 취소"""
+        while True:
+            await asyncio.sleep(max(0.1, settings.JOB_PROGRESS_FLUSH_SEC))
+            try:
+                if await self.flush():
+                    logger.info(f"크롤링 작업 취소 요청 확인: {self.job_id}")
+                    task.cancel()
+                    return
+            except Exception as e:
+                logger.warning(f"크롤링 작업 진행률 저장 실패 ({self.job_id}): {e}")
+
+
+def _serialize_job(doc: Dict) -> Dict:
+    """MongoDB 문서 → API 응답 직렬화"""
+    progress = doc.get("progress") or {}
+    totals = {"pages": 0, "details": 0, "new": 0, "updated": 0, "unchanged": 0}
+    for board in progress.values():
+        for key in totals:
+            totals[key] += board.get(key, 0)
+
+    return {
+        "id": str(doc["_id"]),
+        "mode": doc.get("mode", "local"),
+        "status": doc["status"],
+        "boards": doc.get("boards"),
+        "created_at": doc.get("created_at"),
+        "started_at": doc.get("started_at"),
+        "finished_at": doc.get("finished_at"),
+        "attempts": doc.get("attempts", 0),
+        "progress": progress,
+        "totals": totals,
+        "result": doc.get("result"),
+        "error": doc.get("error")
+    }
+
+
+async def _run_job(job_id: ObjectId, board_slugs: Optional[List[str]]):
+    """작업 실행 - queued → running → done/failed/cancelled"""
+    now = datetime.utcnow()
+    claimed = await Database.crawl_jobs().update_one(
+        {"_id": job_id, "status": "queued", "cancel_requested": {"$ne": True}},
+        {"$set": {"status": "running", "owner": CrawlLease.owner, "started_at": now, "updated_at": now}, "$inc": {"attempts": 1}}
+    )
+    if not claimed.modified_count:
+        return
+
+    progress = JobProgress(job_id)
+    crawl = asyncio.create_task(crawl_all(board_slugs=board_slugs, progress=progress))
+    watcher = asyncio.create_task(progress.watch(crawl))
+    fields: Dict[str, Any] = {}
+    try:
+        result = await crawl
+        fields = {"status": "done", "result": result}
+        logger.info(f"크롤링 작업 완료: {job_id} (new={result['total_new']}, updated={result['total_updated']})")
+    except asyncio.CancelledError:
+        crawl.cancel()
+        await asyncio.gather(crawl, return_exceptions=True)
+        # 서버 종료로 끊긴 작업은 다음 시작 때 이어서 실행
+        fields = {"status": "queued"} if _shutting_down else {"status": "cancelled"}
+        logger.info(f"크롤링 작업 {'중단' if _shutting_down else '취소'}: {job_id}")
+    except Exception as e:
+        fields = {"status": "failed", "error": str(e)}
+        logger.error(f"크롤링 작업 실패: {job_id}: {e}")
+    finally:
+        watcher.cancel()
+        fields.update(progress=progress.boards, updated_at=datetime.utcnow())
+        if fields.get("status") in FINISHED:
+            fields["finished_at"] = fields["updated_at"]
+        await Database.crawl_jobs().update_one({"_id": job_id}, {"$set": fields})
+
+
+async def _refresh_queue_job(doc: Dict) -> Dict:
+    """큐 모드 작업 - URL 작업들로 상태/진행률 집계 (끝났으면 저장)"""
+    if doc["status"] in FINISHED:
+        return doc
+    summary = await summarize_job_tasks(doc["_id"])
+    doc["progress"] = summary["progress"]
+    if summary["active"]:
+        return doc
+
+    statuses = summary["statuses"]
+    if doc.get("cancel_requested"):
+        doc["status"] = "cancelled"
+    elif statuses and not statuses.get("done") and statuses.get("failed"):
+        doc["status"] = "failed"
+        doc["error"] = next((r["error"] for r in summary["results"] if r["error"]), None)
+    else:
+        doc["status"] = "done"
+    results = summary["results"]
+    doc["result"] = {
+        "results": results,
+        "total_new": sum(r["new"] for r in results if not r["error"]),
+        "total_updated": sum(r["updated"] for r in results if not r["error"])
+    }
+    now = datetime.utcnow()
+    doc["finished_at"] = doc["updated_at"] = now
+    await Database.crawl_jobs().update_one(
+        {"_id": doc["_id"], "status": {"$nin": list(FINISHED)}},
+        {"$set": {key: doc.get(key) for key in ("status", "progress", "result", "error", "finished_at", "updated_at")}}
+    )
+    return doc
+
+
+async def _enqueue_job(doc: Dict):
+    """큐 모드 작업 - 게시판별 URL 작업 추가 (워커가 처리)"""
+    query: Dict[str, Any] = {"is_active": True}
+    if doc.get("boards"):
+        query["slug"] = {"$in": doc["boards"]}
+    boards = await Database.boards().find(query).to_list(100)
+    for board in boards:
+        await enqueue_board(board, job_id=doc["_id"])
+    doc["started_at"] = datetime.utcnow()
+    await Database.crawl_jobs().update_one(
+        {"_id": doc["_id"]},
+        {"$set": {"status": "running", "started_at": doc["started_at"]}}
+    )
+    doc["status"] = "running"
+
+
+def _start(doc: Dict):
+    """이 프로세스에서 작업 실행 시작"""
+    key = str(doc["_id"])
+    task = asyncio.create_task(_run_job(doc["_id"], doc.get("boards")))
+    _tasks[key] = task
+    task.add_done_callback(lambda _: _tasks.pop(key, None))
+
+
+async def submit_crawl_job(board_slugs: Optional[List[str]] = None) -> Dict:
+    """
+    크롤링 작업 제출 - 바로 반환하고 백그라운드에서 실행 (CRAWL_QUEUE면 작업 큐에 넣고 워커가 실행)
+
+    Args:
+        board_slugs: 크롤링할 게시판 slug 목록 (None이면 전체)
+
+    Returns:
+        작업 정보 (status="queued")
+    """
+    doc = {
+        "mode": "queue" if settings.CRAWL_QUEUE else "local",
+        "status": "queued",
+        "boards": board_slugs,
+        "created_at": datetime.utcnow(),
+        "attempts": 0,
+        "progress": {},
+        "result": None,
+        "error": None
+    }
+    inserted = await Database.crawl_jobs().insert_one(doc)
+    doc["_id"] = inserted.inserted_id
+    if doc["mode"] == "queue":
+        await _enqueue_job(doc)
+    else:
+        _start(doc)
+    return _serialize_job(doc)
+
+
+async def get_job(job_id: str) -> Optional[Dict]:
+    """작업 상태/진행률 조회"""
+    try:
+        oid = ObjectId(job_id)
+    except Exception:
+        return None
+    doc = await Database.crawl_jobs().find_one({"_id": oid})
+    if doc and doc.get("mode") == "queue":
+        doc = await _refresh_queue_job(doc)
+    return _serialize_job(doc) if doc else None
+
+
+async def list_jobs(limit: int = 20) -> List[Dict]:
+    """최근 작업 목록 (최신순)"""
+    docs = await Database.crawl_jobs().find().sort("created_at", -1).limit(limit).to_list(limit)
+    for index, doc in enumerate(docs):
+        if doc.get("mode") == "queue":
+            docs[index] = await _refresh_queue_job(doc)
+    return [_serialize_job(doc) for doc in docs]
+
+
+async def cancel_job(job_id: str) -> Optional[Dict]:
+    """
+    작업 취소
+
+    이 프로세스에서 실행 중이면 바로 취소하고, 대기 중이면 cancelled로 바꾸며,
+    다른 프로세스에서 실행 중이면 cancel_requested를 남겨 그쪽 진행률 저장 때 취소되게 합니다.
+    큐 모드 작업은 대기 중인 URL 작업을 취소하고, 실행 중인 것은 워커가 하트비트 때 취소합니다.
+    """
+    try:
+        oid = ObjectId(job_id)
+    except Exception:
+        return None
+
+    doc = await Database.crawl_jobs().find_one_and_update(
+        {"_id": oid, "status": {"$nin": list(FINISHED)}},
+        {"$set": {"cancel_requested": True}}
+    )
+    if doc is not None and doc.get("mode") == "queue":
+        await cancel_job_tasks(oid)
+    elif doc is not None:
+        task = _tasks.get(job_id)
+        if task is not None:
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+        elif doc["status"] == "queued":
+            now = datetime.utcnow()
+            await Database.crawl_jobs().update_one(
+                {"_id": oid, "status": "queued"},
+                {"$set": {"status": "cancelled", "finished_at": now, "updated_at": now}}
+            )
+    return await get_job(job_id)
+
+
+async def resume_jobs():
+    """
+    서버 시작 시 끝나지 않은 작업 이어서 실행
+
+    실행 중 작업은 이 프로세스 것이면서 실행 중이 아니거나, JOB_STALE_SEC 넘게 진행률 저장이 없는 것만
+    (실행하던 프로세스가 죽음) 다시 대기시킵니다. 다른 프로세스가 실행 중인 작업은 그대로 둡니다.
+    """
+    global _shutting_down
+    _shutting_down = False
+    # 큐 모드 작업은 워커가 이어서 처리
+    local = {"mode": {"$ne": "queue"}}
+    stale_before = datetime.utcnow() - timedelta(seconds=max(settings.JOB_STALE_SEC, settings.JOB_PROGRESS_FLUSH_SEC * 3))
+    running_here = [ObjectId(job_id) for job_id in _tasks]
+    await Database.crawl_jobs().update_many(
+        {
+            **local,
+            "status": "running",
+            "_id": {"$nin": running_here},
+            "$or": [
+                {"owner": CrawlLease.owner},
+                {"updated_at": None},
+                {"updated_at": {"$lte": stale_before}},
+            ]
+        },
+        {"$set": {"status": "queued"}}
+    )
+    docs = await Database.crawl_jobs().find(
+        {**local, "status": "queued", "cancel_requested": {"$ne": True}}
+    ).sort("created_at", 1).to_list(100)
+    for doc in docs:
+        logger.info(f"크롤링 작업 이어서 실행: {doc['_id']}")
+        _start(doc)
+
+
+async def stop_jobs():
+    """서버 종료 시 실행 중인 작업 중단 (queued로 되돌려 다음 시작 때 이어서 실행)"""
+    global _shutting_down
+    _shutting_down = True
+    tasks = list(_tasks.values())
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
@@ -7,6 +7,7 @@ from datetime import datetime, timedelta
 from bson import ObjectId
 
 from app.core.database import Database
+from app.crawlers.versioning import restore_version
 
 
 def _serialize_notice(n: Dict) -> Dict:
@@ -99,6 +100,32 @@ async def get_notice_by_id(notice_id: str) -> Optional[Dict]:
     return _serialize_notice(notice)
 
 
+async def get_notice_history(notice_id: str) -> Optional[List[Dict]]:
+    """
+    공지 변경 이력 - 최신 변경부터 이전 버전을 차례로 복원
+
+    Returns:
+        [{"changed_at": ..., "title": ..., "content": ..., "attachments": [...]}, ...] (공지가 없으면 None)
+    """
+    try:
+        oid = ObjectId(notice_id)
+    except Exception:
+        return None
+
+    notice = await Database.notices().find_one({"_id": oid})
+    if not notice:
+        return None
+
+    entries = await Database.notice_history().find({"notice_id": oid}).sort("changed_at", -1).to_list(100)
+
+    versions = []
+    current = {key: notice.get(key) for key in ("title", "content", "attachments")}
+    for entry in entries:
+        current = restore_version(current, entry["diff"])
+        versions.append({"changed_at": entry["changed_at"], **current})
+    return versions
+
+
 async def get_boards() -> List[Dict]:
     """게시판 목록 조회"""
     boards = await Database.boards().find({"is_active": True}).to_list(100)
@@ -0,0 +1,109 @@
+"""
+변경 탐지 서비스
+게시판 URL마다 목록 1페이지만 가져와 상단 행 지문을 저장된 지문과 비교하고,
+바뀐 URL이 있는 게시판만 crawl_board로 크롤링합니다.
+최근 공지 재확인 순회(DETAIL_REFRESH_HOURS)가 필요한 URL은 지문과 상관없이 크롤링 대상에 포함합니다.
+"""
+import time
+import asyncio
+import logging
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+from app.core.database import Database
+from app.crawlers import get_probe_class
+from app.crawlers.watermark import refresh_due
+from .crawl_service import crawl_board
+
+logger = logging.getLogger(__name__)
+
+
+async def _probe_url(board: Dict, url_info: Dict[str, Any]) -> str:
+    """목록 1페이지 지문 계산 (HTTP/API 엔진이면 브라우저 없이)"""
+    probe_class = get_probe_class(board)
+    async with probe_class(board["_id"], board["name"]) as crawler:
+        return await crawler.probe(url_info["url"])
+
+
+async def probe_board(board: Dict) -> Dict[str, Any]:
+    """
+    게시판의 모든 URL 변경 탐지
+
+    지문이 다르거나 저장된 지문이 없으면 바뀐 것으로 보고, 탐지에 실패한 URL도 크롤링 대상에 포함합니다.
+    재확인 순회가 필요한 URL은 탐지하지 않고 바로 포함합니다.
+
+    Returns:
+        {"board_name": "...", "changed": [url, ...], "errors": 0}
+    """
+    if get_probe_class(board) is None:
+        return {"board_name": board["name"], "changed": [], "errors": 0}
+
+    now = datetime.utcnow()
+    changed = [url_info["url"] for url_info in board["urls"] if refresh_due(url_info, now)]
+    url_infos = [url_info for url_info in board["urls"] if url_info["url"] not in changed]
+    outcomes = await asyncio.gather(
+        *(_probe_url(board, url_info) for url_info in url_infos),
+        return_exceptions=True
+    )
+    errors = 0
+    for url_info, outcome in zip(url_infos, outcomes):
+        if isinstance(outcome, BaseException):
+            logger.warning(f"[{board['name']}] 변경 탐지 실패, 크롤링 대상에 포함 ({url_info['url']}): {outcome}")
+            errors += 1
+            changed.append(url_info["url"])
+        elif outcome != url_info.get("fingerprint"):
+            changed.append(url_info["url"])
+
+    return {"board_name": board["name"], "changed": changed, "errors": errors}
+
+
+async def probe_and_crawl(board_slugs: Optional[List[str]] = None) -> Dict:
+    """
+    모든 (또는 특정) 게시판 변경 탐지 후 바뀐 URL만 크롤링
+
+    Args:
+        board_slugs: 확인할 게시판 slug 목록 (None이면 전체)
+
+    Returns:
+        {"results": [...], "total_new": 0, "total_updated": 0,
+         "probe": {"urls": 0, "changed": 0, "errors": 0, "elapsed_sec": 0.0}}
+    """
+    query = {"is_active": True}
+    if board_slugs:
+        query["slug"] = {"$in": board_slugs}
+
+    boards = await Database.boards().find(query).to_list(100)
+
+    started = time.perf_counter()
+    probes = await asyncio.gather(*(probe_board(board) for board in boards))
+    probe_elapsed = time.perf_counter() - started
+
+    targets = [(board, probe) for board, probe in zip(boards, probes) if probe["changed"]]
+    results = await asyncio.gather(*(
+        crawl_board(str(board["_id"]), urls=probe["changed"]) for board, probe in targets
+    ))
+
+    total_new = 0
+    total_updated = 0
+    for result in results:
+        if not result.get("error"):
+            total_new += result["new"]
+            total_updated += result["updated"]
+
+    probe_stats = {
+        "urls": sum(len(board["urls"]) for board in boards),
+        "changed": sum(len(probe["changed"]) for probe in probes),
+        "errors": sum(probe["errors"] for probe in probes),
+        "elapsed_sec": round(probe_elapsed, 3),
+    }
+    logger.info(
+        f"변경 탐지 완료: URL {probe_stats['urls']}개 중 {probe_stats['changed']}개 변경 "
+        f"({probe_elapsed:.1f}초), 크롤링 게시판 {len(targets)}개"
+    )
+
+    return {
+        "results": list(results),
+        "total_new": total_new,
+        "total_updated": total_updated,
+        "probe": probe_stats
+    }
@@ -0,0 +1,186 @@
+"""
+자동 크롤링 스케줄러
+FastAPI lifespan에서 시작하는 프로세스 내 스케줄러로, 게시판마다 게시 빈도에 맞춘 간격으로 크롤링합니다.
+- 간격: crawl_service.record_board_check가 게시 빈도(지수이동평균)로 정한 next_crawl_at
+- 조용한 시간대(SCHEDULE_QUIET_HOURS)에는 크롤링하지 않음
+- SCHEDULE_PROBE면 변경 탐지 후 바뀐 URL만 크롤링
+- CRAWL_QUEUE면 직접 크롤링하지 않고 작업 큐에 넣음 (워커가 끝낸 뒤 다음 크롤링 시각 갱신)
+"""
+import asyncio
+import logging
+from datetime import datetime, timedelta
+from typing import Any, Dict, Optional, Set, Tuple
+from zoneinfo import ZoneInfo
+
+from app.config import settings
+from app.core.database import Database
+from .crawl_service import crawl_board, record_board_check
+from .probe_service import probe_board
+from .task_service import enqueue_board
+
+logger = logging.getLogger(__name__)
+
+
+def _quiet_hours() -> Optional[Tuple[int, int]]:
+    """SCHEDULE_QUIET_HOURS("01-07") → (1, 7), 비어 있거나 형식이 틀리면 None"""
+    value = settings.SCHEDULE_QUIET_HOURS.strip()
+    if not value:
+        return None
+    try:
+        start, end = (int(part) for part in value.split("-"))
+    except ValueError:
+        logger.warning(f"SCHEDULE_QUIET_HOURS 형식 오류 (예: 01-07): {value}")
+        return None
+    return start % 24, end % 24
+
+
+def is_quiet(now: Optional[datetime] = None) -> bool:
+    """지금이 조용한 시간대인지 (자정을 넘는 범위 지원, 예: 23-06)"""
+    hours = _quiet_hours()
+    if hours is None:
+        return False
+    start, end = hours
+    hour = (now or datetime.now(ZoneInfo(settings.SCHEDULE_TIMEZONE))).hour
+    if start <= end:
+        return start <= hour < end
+    return hour >= start or hour < end
+
+
+class CrawlScheduler:
+    """게시판별 적응형 크롤링 스케줄러 관리 클래스"""
+
+    _task: Optional[asyncio.Task] = None
+    _running: Set[asyncio.Task] = set()
+    _boards: Set[str] = set()     # 실행 중인 게시판 id
+
+    # 통계
+    runs: int = 0                 # 게시판 실행 횟수
+    probed_unchanged: int = 0     # 변경 탐지 결과 크롤링하지 않은 횟수
+    lease_skipped: int = 0        # 다른 프로세스가 크롤링 중이라 건너뛴 횟수
+    failures: int = 0
+    last_tick_at: Optional[datetime] = None
+
+    @classmethod
+    def is_running(cls) -> bool:
+        return cls._task is not None and not cls._task.done()
+
+    @classmethod
+    def start(cls):
+        """스케줄러 시작 (이미 시작되었으면 무시)"""
+        if cls.is_running():
+            return
+        cls._task = asyncio.create_task(cls._loop())
+        print(f"크롤링 스케줄러 시작: {settings.SCHEDULE_TICK_SEC}초마다 확인")
+
+    @classmethod
+    async def stop(cls):
+        """스케줄러 종료 - 진행 중인 게시판 크롤링 취소"""
+        if cls._task is None:
+            return
+        tasks = [cls._task, *cls._running]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        cls._task = None
+        cls._running = set()
+        cls._boards = set()
+        print(f"크롤링 스케줄러 종료 ({cls.stats()})")
+
+    @classmethod
+    async def _loop(cls):
+        while True:
+            try:
+                await cls._tick()
+            except Exception as e:
+                logger.error(f"스케줄러 확인 오류: {e}")
+            await asyncio.sleep(max(1, settings.SCHEDULE_TICK_SEC))
+
+    @classmethod
+    async def _tick(cls):
+        """next_crawl_at이 지난 (또는 아직 없는) 활성 게시판 실행"""
+        cls.last_tick_at = datetime.utcnow()
+        if is_quiet():
+            return
+
+        due = await Database.boards().find({
+            "is_active": True,
+            "$or": [
+                {"next_crawl_at": {"$exists": False}},
+                {"next_crawl_at": {"$lte": cls.last_tick_at}},
+            ]
+        }).to_list(100)
+
+        for board in due:
+            board_id = str(board["_id"])
+            if board_id in cls._boards:
+                continue
+            cls._boards.add(board_id)
+            task = asyncio.create_task(cls._run_board(board))
+            cls._running.add(task)
+            task.add_done_callback(cls._running.discard)
+
+    @classmethod
+    async def _run_board(cls, board: Dict):
+        board_id = str(board["_id"])
+        try:
+            cls.runs += 1
+            urls = None
+            if settings.SCHEDULE_PROBE:
+                probe = await probe_board(board)
+                if not probe["changed"]:
+                    cls.probed_unchanged += 1
+                    await record_board_check(board, 0)
+                    return
+                urls = probe["changed"]
+
+            if settings.CRAWL_QUEUE:
+                # 그때까지 최소 간격 뒤 재확인 (대기 중인 URL은 중복 추가 안 됨), 워커가 묶음을 끝내면 게시 빈도로 다시 정함
+                await Database.boards().update_one(
+                    {"_id": board["_id"]},
+                    {"$set": {"next_crawl_at": datetime.utcnow() + timedelta(minutes=settings.SCHEDULE_MIN_INTERVAL_MIN)}}
+                )
+                await enqueue_board(board, urls=urls)
+                return
+
+            result = await crawl_board(board_id, urls=urls)
+            if result.get("error"):
+                raise RuntimeError(result["error"])
+            if result.get("skipped"):
+                # 다른 프로세스가 크롤링 중 - 매 확인마다 다시 시도하지 않게 최소 간격 뒤로 (그쪽이 끝나며 정한 시각이 있으면 유지)
+                cls.lease_skipped += 1
+                now = datetime.utcnow()
+                await Database.boards().update_one(
+                    {
+                        "_id": board["_id"],
+                        "$or": [{"next_crawl_at": {"$exists": False}}, {"next_crawl_at": {"$lte": now}}]
+                    },
+                    {"$set": {"next_crawl_at": now + timedelta(minutes=settings.SCHEDULE_MIN_INTERVAL_MIN)}}
+                )
+                return
+            logger.info(f"[{board['name']}] 예약 크롤링 완료: new={result['new']}, updated={result['updated']}")
+
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            # 실패한 게시판은 최소 간격 뒤에 다시 시도
+            cls.failures += 1
+            logger.error(f"[{board['name']}] 예약 크롤링 실패: {e}")
+            await Database.boards().update_one(
+                {"_id": board["_id"]},
+                {"$set": {"next_crawl_at": datetime.utcnow() + timedelta(minutes=settings.SCHEDULE_MIN_INTERVAL_MIN)}}
+            )
+        finally:
+            cls._boards.discard(board_id)
+
+    @classmethod
+    def stats(cls) -> Dict[str, Any]:
+        return {
+            "running": cls.is_running(),
+            "quiet": is_quiet(),
+            "active_boards": len(cls._boards),
+            "runs": cls.runs,
+            "probed_unchanged": cls.probed_unchanged,
+            "lease_skipped": cls.lease_skipped,
+            "failures": cls.failures,
+            "last_tick_at": cls.last_tick_at,
+        }
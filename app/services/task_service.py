@@ -0,0 +1,465 @@
+"""
+크롤링 작업 큐 서비스 (MongoDB crawl_tasks)
+CRAWL_QUEUE 모드에서 API/스케줄러는 게시판 URL마다 작업을 넣기만 하고, 워커(worker.py)가 가져가서 크롤링합니다.
+- 가져가기: 대기 중이거나 리스가 만료된 작업을 원자적으로 가져감 (owner, lease_until)
+- 하트비트: 실행 중에는 TASK_LEASE_SEC의 1/3마다 리스 연장 + 진행률 저장 + 취소 요청 확인
+- 체크포인트: 목록 페이지를 저장할 때마다 (페이지, 마지막 URL) 기록 → 죽은 워커의 작업은 다른 워커가 그 페이지부터 이어서 처리
+- 같은 URL은 대기/실행 중인 작업이 하나만 있음 (active 부분 유니크 인덱스), 묶음(batch)이 끝나면 게시판 게시 빈도 갱신
+- 게시판 리스: 다른 프로세스(API/MCP/다른 워커)가 같은 게시판을 크롤링 중이면 TASK_BUSY_DELAY_SEC 뒤로 미뤄 다시 대기
+"""
+import asyncio
+import logging
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional
+from bson import ObjectId
+from pymongo import ReturnDocument
+from pymongo.errors import DuplicateKeyError
+
+from app.config import settings
+from app.core.database import Database
+from app.core.crawl_limiter import CrawlLimiter
+from app.core.crawl_lease import CrawlLease
+from app.crawlers import get_crawler_class
+from .crawl_service import record_board_check
+
+logger = logging.getLogger(__name__)
+
+# 끝난 작업 상태
+FINISHED = ("done", "failed", "cancelled")
+
+# 작업 진행률 항목
+PROGRESS_KEYS = ("pages", "details", "new", "updated", "unchanged")
+
+
+class BoardBusyError(Exception):
+    """다른 프로세스가 같은 게시판을 크롤링 중 (게시판 리스를 잡지 못함)"""
+
+
+def _lease() -> timedelta:
+    return timedelta(seconds=max(1, settings.TASK_LEASE_SEC))
+
+
+async def enqueue_board(board: Dict, urls: Optional[List[str]] = None, job_id: Optional[ObjectId] = None) -> Dict:
+    """
+    게시판 URL별 크롤링 작업 추가
+
+    같은 URL의 작업이 이미 대기/실행 중이면 새로 넣지 않고 그 작업에 job_id만 붙입니다.
+
+    Args:
+        board: 게시판 문서
+        urls: 크롤링할 게시판 URL 목록 (None이면 전체)
+        job_id: 이 작업들을 묶는 크롤링 작업 id (진행률/취소용)
+
+    Returns:
+        {"board_name": "...", "queued": 추가한 작업 수, "joined": 이미 있던 작업 수}
+    """
+    batch = ObjectId()
+    now = datetime.utcnow()
+    queued = 0
+    joined = 0
+    for url_info in board["urls"]:
+        url = url_info["url"]
+        if urls is not None and url not in urls:
+            continue
+        try:
+            await Database.crawl_tasks().insert_one({
+                "batch": batch,
+                "board_id": board["_id"],
+                "board_name": board["name"],
+                "url": url,
+                "job_ids": [job_id] if job_id else [],
+                "status": "queued",
+                "active": True,
+                "attempts": 0,
+                "checkpoint": None,
+                "progress": {},
+                "result": None,
+                "error": None,
+                "created_at": now,
+                "updated_at": now
+            })
+            queued += 1
+        except DuplicateKeyError:
+            joined += 1
+            if job_id:
+                await Database.crawl_tasks().update_one(
+                    {"url": url, "active": True},
+                    {"$addToSet": {"job_ids": job_id}}
+                )
+
+    # 이번 묶음이 끝나면 (_finish_batch) 게시 빈도/다음 크롤링 시각 갱신
+    if queued:
+        await Database.boards().update_one({"_id": board["_id"]}, {"$set": {"pending_batch": batch}})
+        logger.info(f"[{board['name']}] 크롤링 작업 {queued}개 추가 (이미 대기 중 {joined}개)")
+    return {"board_name": board["name"], "queued": queued, "joined": joined}
+
+
+async def claim_task(owner: str) -> Optional[Dict]:
+    """
+    대기 중인 (또는 리스가 만료된 실행 중) 작업 하나를 가져감 - 오래된 작업부터
+
+    Returns:
+        작업 문서, 없으면 None
+    """
+    while True:
+        now = datetime.utcnow()
+        task = await Database.crawl_tasks().find_one_and_update(
+            {
+                "$or": [
+                    {"status": "queued", "not_before": None},
+                    {"status": "queued", "not_before": {"$lte": now}},
+                    {"status": "running", "lease_until": {"$lte": now}},
+                ],
+                "cancel_requested": {"$ne": True}
+            },
+            {
+                "$set": {"status": "running", "owner": owner, "lease_until": now + _lease(), "started_at": now, "updated_at": now},
+                "$inc": {"attempts": 1}
+            },
+            sort=[("created_at", 1)],
+            return_document=ReturnDocument.AFTER
+        )
+        if task is None:
+            return None
+        if task["attempts"] <= max(1, settings.TASK_MAX_ATTEMPTS):
+            return task
+        # 워커가 계속 죽는 작업 (리스 만료로만 돌아온 경우)
+        await finish_task(task, owner, "failed", error="최대 시도 횟수 초과")
+
+
+async def heartbeat(task_id: ObjectId, owner: str, progress: Dict[str, int]) -> Optional[str]:
+    """
+    리스 연장 + 진행률 저장
+
+    Returns:
+        None이면 계속 실행, "lost"면 다른 워커가 가져감, "cancelled"면 취소 요청됨
+    """
+    now = datetime.utcnow()
+    doc = await Database.crawl_tasks().find_one_and_update(
+        {"_id": task_id, "owner": owner, "status": "running"},
+        {"$set": {"lease_until": now + _lease(), "progress": progress, "updated_at": now}},
+        projection={"cancel_requested": 1}
+    )
+    if doc is None:
+        return "lost"
+    if doc.get("cancel_requested"):
+        return "cancelled"
+    return None
+
+
+async def save_checkpoint(task_id: ObjectId, owner: str, checkpoint: Dict[str, Any]):
+    """목록 페이지 저장 지점 기록 (다른 워커가 이어받을 때 사용)"""
+    await Database.crawl_tasks().update_one(
+        {"_id": task_id, "owner": owner},
+        {"$set": {"checkpoint": checkpoint, "updated_at": datetime.utcnow()}}
+    )
+
+
+async def finish_task(task: Dict, owner: str, status: str, **fields: Any) -> bool:
+    """
+    작업 종료 (done/failed/cancelled) - 아직 이 워커 것일 때만
+
+    Returns:
+        종료 처리했으면 True
+    """
+    now = datetime.utcnow()
+    result = await Database.crawl_tasks().update_one(
+        {"_id": task["_id"], "owner": owner, "status": "running"},
+        {
+            "$set": {"status": status, "finished_at": now, "updated_at": now, **fields},
+            "$unset": {"active": "", "lease_until": ""}
+        }
+    )
+    if not result.modified_count:
+        return False
+    await _finish_batch(task)
+    return True
+
+
+async def fail_task(task: Dict, owner: str, error: str):
+    """실패 - 시도 횟수가 남았으면 체크포인트를 유지한 채 다시 대기"""
+    if task["attempts"] >= max(1, settings.TASK_MAX_ATTEMPTS):
+        await finish_task(task, owner, "failed", error=error)
+        return
+    await Database.crawl_tasks().update_one(
+        {"_id": task["_id"], "owner": owner, "status": "running"},
+        {"$set": {"status": "queued", "error": error, "updated_at": datetime.utcnow()}, "$unset": {"owner": "", "lease_until": ""}}
+    )
+
+
+async def release_task(task: Dict, owner: str):
+    """워커 종료로 중단 - 시도 횟수를 되돌리고 다시 대기 (체크포인트부터 이어서 처리)"""
+    await Database.crawl_tasks().update_one(
+        {"_id": task["_id"], "owner": owner, "status": "running"},
+        {
+            "$set": {"status": "queued", "updated_at": datetime.utcnow()},
+            "$unset": {"owner": "", "lease_until": ""},
+            "$inc": {"attempts": -1}
+        }
+    )
+
+
+async def defer_task(task: Dict, owner: str, delay: float):
+    """게시판이 다른 프로세스에서 크롤링 중 - 시도 횟수를 되돌리고 delay초 뒤에 다시 대기"""
+    now = datetime.utcnow()
+    await Database.crawl_tasks().update_one(
+        {"_id": task["_id"], "owner": owner, "status": "running"},
+        {
+            "$set": {"status": "queued", "not_before": now + timedelta(seconds=delay), "updated_at": now},
+            "$unset": {"owner": "", "lease_until": ""},
+            "$inc": {"attempts": -1}
+        }
+    )
+
+
+async def expire_cancelled():
+    """취소 요청 후 리스가 만료된 작업 정리 (처리하던 워커가 죽은 경우)"""
+    now = datetime.utcnow()
+    await Database.crawl_tasks().update_many(
+        {"status": "running", "cancel_requested": True, "lease_until": {"$lte": now}},
+        {"$set": {"status": "cancelled", "finished_at": now, "updated_at": now}, "$unset": {"active": "", "lease_until": ""}}
+    )
+
+
+async def _finish_batch(task: Dict):
+    """묶음의 마지막 작업이 끝나면 게시판 게시 빈도/다음 크롤링 시각 갱신 (한 번만)"""
+    if await Database.crawl_tasks().count_documents({"batch": task["batch"], "active": True}, limit=1):
+        return
+    board = await Database.boards().find_one_and_update(
+        {"_id": task["board_id"], "pending_batch": task["batch"]},
+        {"$unset": {"pending_batch": ""}}
+    )
+    if board is None:
+        return  # 더 새 묶음이 있거나 이미 처리됨
+
+    done = await Database.crawl_tasks().find(
+        {"batch": task["batch"], "status": "done"}, {"result": 1}
+    ).to_list(None)
+    now = datetime.utcnow()
+    if not done:
+        # 전부 실패/취소 - 최소 간격 뒤에 다시 시도
+        await Database.boards().update_one(
+            {"_id": board["_id"]},
+            {"$set": {"next_crawl_at": now + timedelta(minutes=settings.SCHEDULE_MIN_INTERVAL_MIN)}}
+        )
+        return
+
+    new = sum((doc.get("result") or {}).get("new", 0) for doc in done)
+    await record_board_check(board, new, now)
+    await Database.boards().update_one({"_id": board["_id"]}, {"$set": {"last_crawled_at": now}})
+
+
+async def execute_task(task: Dict, owner: str, progress) -> Dict[str, Any]:
+    """
+    작업 하나 크롤링 (게시판 리스를 잡고 전역/호스트 슬롯 안에서) - 체크포인트가 있으면 그 페이지부터
+
+    Returns:
+        {"new": 0, "updated": 0, "unchanged": 0}
+
+    Raises:
+        BoardBusyError: 다른 프로세스가 같은 게시판을 크롤링 중
+        LeaseLostError: 크롤링 중 게시판 리스를 잃음
+    """
+    board = await Database.boards().find_one({"_id": task["board_id"]})
+    if not board:
+        raise LookupError("Board not found")
+    url_info = next((info for info in board["urls"] if info["url"] == task["url"]), None)
+    if url_info is None:
+        raise LookupError(f"게시판에 없는 URL: {task['url']}")
+    crawler_class = get_crawler_class(board)
+    if not crawler_class:
+        raise LookupError(f"Unknown crawler type: {board['crawler_type']}")
+
+    async def checkpoint(state: Dict[str, Any]):
+        await save_checkpoint(task["_id"], owner, state)
+
+    # crawl_board와 같은 게시판 리스 (이 워커의 같은 게시판 작업끼리는 함께 보유)
+    async with CrawlLease.hold(f"board:{board['_id']}") as acquired:
+        if not acquired:
+            raise BoardBusyError(f"다른 프로세스에서 크롤링 중: {board['name']}")
+        async with CrawlLimiter.slot(task["url"]):
+            async with crawler_class(board["_id"], board["name"]) as crawler:
+                result = await crawler.crawl_url(
+                    url_info, progress=progress, checkpoint=checkpoint, resume=task.get("checkpoint")
+                )
+    return {"new": result["new"], "updated": result["updated"], "unchanged": result["unchanged"]}
+
+
+async def summarize_job_tasks(job_id: ObjectId) -> Dict[str, Any]:
+    """
+    크롤링 작업에 속한 URL 작업 집계
+
+    Returns:
+        {"active": 대기/실행 중 수, "statuses": {상태: 수}, "progress": {게시판: {...}},
+         "results": [{"board_name", "new", "updated", "unchanged", "error"}]}
+    """
+    tasks = await Database.crawl_tasks().find({"job_ids": job_id}).to_list(None)
+    statuses: Dict[str, int] = {}
+    progress: Dict[str, Dict[str, int]] = {}
+    results: Dict[str, Dict[str, Any]] = {}
+    for task in tasks:
+        statuses[task["status"]] = statuses.get(task["status"], 0) + 1
+        name = task["board_name"]
+        board = progress.setdefault(name, dict.fromkeys(PROGRESS_KEYS, 0))
+        for key, value in (task.get("progress") or {}).items():
+            board[key] = board.get(key, 0) + value
+
+        result = results.setdefault(name, {"board_name": name, "new": 0, "updated": 0, "unchanged": 0, "error": None})
+        if task["status"] == "done":
+            for key in ("new", "updated", "unchanged"):
+                result[key] += (task.get("result") or {}).get(key, 0)
+        elif task["status"] == "failed":
+            result["error"] = task.get("error")
+
+    return {
+        "active": statuses.get("queued", 0) + statuses.get("running", 0),
+        "statuses": statuses,
+        "progress": progress,
+        "results": list(results.values())
+    }
+
+
+async def cancel_job_tasks(job_id: ObjectId):
+    """크롤링 작업 취소 - 이 작업만 기다리는 URL 작업만 (다른 작업과 공유하는 작업은 계속)"""
+    now = datetime.utcnow()
+    await Database.crawl_tasks().update_many(
+        {"job_ids": [job_id], "status": "queued"},
+        {"$set": {"status": "cancelled", "finished_at": now, "updated_at": now}, "$unset": {"active": ""}}
+    )
+    await Database.crawl_tasks().update_many(
+        {"job_ids": [job_id], "status": "running"},
+        {"$set": {"cancel_requested": True, "updated_at": now}}
+    )
+
+
+class CrawlWorker:
+    """작업 큐 워커 관리 클래스 (worker.py에서 실행)"""
+
+    owner: str = CrawlLease.owner
+    _task: Optional[asyncio.Task] = None
+    _running: Dict[asyncio.Task, Dict] = {}
+    _stopping: bool = False
+
+    # 통계
+    claimed: int = 0
+    done: int = 0
+    failed: int = 0
+    cancelled: int = 0
+    lost: int = 0
+    deferred: int = 0
+
+    @classmethod
+    def start(cls):
+        """워커 시작 (이미 시작되었으면 무시)"""
+        if cls._task is not None and not cls._task.done():
+            return
+        cls._stopping = False
+        cls._task = asyncio.create_task(cls._loop())
+        print(f"크롤링 워커 시작: {cls.owner} (동시 작업 {settings.WORKER_CONCURRENCY}개)")
+
+    @classmethod
+    async def stop(cls):
+        """워커 종료 - 실행 중인 작업은 다시 대기시켜 다른 워커가 체크포인트부터 이어서 처리"""
+        if cls._task is None:
+            return
+        cls._stopping = True
+        tasks = [cls._task, *cls._running]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        cls._task = None
+        print(f"크롤링 워커 종료 ({cls.stats()})")
+
+    @classmethod
+    async def _loop(cls):
+        poll = max(0.1, settings.WORKER_POLL_SEC)
+        while True:
+            try:
+                while len(cls._running) < max(1, settings.WORKER_CONCURRENCY):
+                    task = await claim_task(cls.owner)
+                    if task is None:
+                        await expire_cancelled()
+                        break
+                    cls.claimed += 1
+                    runner = asyncio.create_task(cls._run(task))
+                    cls._running[runner] = task
+                    runner.add_done_callback(lambda t: cls._running.pop(t, None))
+            except Exception as e:
+                logger.error(f"작업 큐 확인 오류: {e}")
+
+            if cls._running:
+                await asyncio.wait(list(cls._running), timeout=poll, return_when=asyncio.FIRST_COMPLETED)
+            else:
+                await asyncio.sleep(poll)
+
+    @classmethod
+    async def _heartbeat(cls, task: Dict, crawl: asyncio.Task, progress: Dict[str, int]) -> Optional[str]:
+        """실행 중 주기적 하트비트 - 리스를 잃거나 취소 요청이 오면 crawl을 취소하고 이유 반환"""
+        while True:
+            await asyncio.sleep(_lease().total_seconds() / 3)
+            try:
+                reason = await heartbeat(task["_id"], cls.owner, progress)
+            except Exception as e:
+                # 일시적인 DB 오류는 다음 주기에 재시도 (리스 안에 성공하면 유지)
+                logger.warning(f"작업 하트비트 오류 ({task['_id']}): {e}")
+                continue
+            if reason:
+                crawl.cancel()
+                return reason
+
+    @classmethod
+    async def _run(cls, task: Dict):
+        """작업 실행 - done/failed(재시도)/cancelled, 워커 종료면 다시 대기"""
+        label = f"[{task['board_name']}] {task['url']}"
+        progress = dict.fromkeys(PROGRESS_KEYS, 0)
+
+        def report(board_name: str, **counts: int):
+            for key, value in counts.items():
+                progress[key] = progress.get(key, 0) + value
+
+        crawl = asyncio.create_task(execute_task(task, cls.owner, report))
+        keeper = asyncio.create_task(cls._heartbeat(task, crawl, progress))
+        try:
+            result = await crawl
+            await finish_task(task, cls.owner, "done", result=result, progress=progress)
+            cls.done += 1
+            logger.info(f"{label} 작업 완료: new={result['new']}, updated={result['updated']}")
+        except asyncio.CancelledError:
+            crawl.cancel()
+            await asyncio.gather(crawl, return_exceptions=True)
+            reason = keeper.result() if keeper.done() and not keeper.cancelled() else None
+            if reason == "cancelled":
+                await finish_task(task, cls.owner, "cancelled", progress=progress)
+                cls.cancelled += 1
+                logger.info(f"{label} 작업 취소")
+            elif reason == "lost":
+                cls.lost += 1
+                logger.warning(f"{label} 작업 리스 상실 (다른 워커가 이어서 처리)")
+            elif cls._stopping:
+                await release_task(task, cls.owner)
+                logger.info(f"{label} 워커 종료로 작업 중단, 다시 대기")
+            else:
+                raise
+        except BoardBusyError as e:
+            cls.deferred += 1
+            logger.info(f"{label} {e}, {settings.TASK_BUSY_DELAY_SEC}초 뒤 다시 시도")
+            await defer_task(task, cls.owner, settings.TASK_BUSY_DELAY_SEC)
+        except Exception as e:
+            cls.failed += 1
+            logger.error(f"{label} 작업 실패 (시도 {task['attempts']}회): {e}")
+            await fail_task(task, cls.owner, str(e))
+        finally:
+            keeper.cancel()
+
+    @classmethod
+    def stats(cls) -> Dict[str, Any]:
+        return {
+            "owner": cls.owner,
+            "running": len(cls._running),
+            "claimed": cls.claimed,
+            "done": cls.done,
+            "failed": cls.failed,
+            "cancelled": cls.cancelled,
+            "lost": cls.lost,
+            "deferred": cls.deferred,
+        }
@@ -0,0 +1,196 @@
+"""
+크롤링 처리량 벤치마크 (로컬 게시판 서버 대상 end-to-end)
+benchmarks/sites.py 로컬 서버에 사이트별 게시판을 만들고, 메모리 MongoDB(benchmarks/memory_db.py)로 crawl_board를 실행해
+공지/초, 상세 요청/초, 최대 RSS, 단계별(목록/상세/저장) 시간을 측정합니다.
+
+- 사이트마다 새 프로세스(spawn)에서 크롤링 - 최대 RSS가 사이트별로 분리되고 싱글톤(풀/클라이언트) 상태가 섞이지 않음
+- 로컬 서버도 별도 프로세스라 크롤러 CPU/메모리에 포함되지 않음
+- 호스트 요청 속도 제한은 기본으로 풀어 크롤러 자체 처리량을 측정 (--host-rate로 지정 가능)
+
+결과는 benchmarks/results/crawl_<시각>_<커밋>.json에 저장하고, --compare로 이전 결과와 비교합니다.
+
+사용법:
+    python benchmarks/crawl_bench.py
+    python benchmarks/crawl_bench.py --sites csai jbnu --pages 20 --per-page 15 --latency-ms 20
+    python benchmarks/crawl_bench.py --compare benchmarks/results/crawl_20261017-120000_ea6db62.json
+"""
+import sys
+import time
+import asyncio
+import argparse
+import resource
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+# 프로젝트 루트를 path에 추가
+ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(ROOT))
+
+from benchmarks.report import metadata, save, load, print_comparison
+from benchmarks.sites import SITES, SiteConfig, SiteServer, board_urls
+
+# 사이트별 게시판 설정 (INITIAL_BOARDS와 같은 crawler_type/engine)
+BOARDS = {
+    "csai": {"name": "컴퓨터인공지능학부", "crawler_type": "csai", "engine": "http"},
+    "swuniv": {"name": "SW중심대학사업단", "crawler_type": "swuniv", "engine": "http"},
+    "jbnu": {"name": "학생공지", "crawler_type": "jbnu", "engine": "http"},
+    "eng": {"name": "공과대학", "crawler_type": "eng", "engine": "api"},
+}
+
+# 비교 출력 지표 (이름, 클수록 좋은지)
+COMPARE_METRICS = [
+    ("notices_per_sec", True),
+    ("detail_fetches_per_sec", True),
+    ("elapsed_sec", False),
+    ("peak_rss_mb", False),
+]
+
+
+def _peak_rss_mb(who: int) -> float:
+    """최대 RSS (MB) - ru_maxrss는 Linux KB, macOS 바이트"""
+    peak = resource.getrusage(who).ru_maxrss
+    return round(peak / (1024 * 1024 if sys.platform == "darwin" else 1024), 1)
+
+
+async def _crawl_site(site: str, origin: str, config: SiteConfig, engine: Optional[str], host_rate: float) -> Dict[str, Any]:
+    from app.config import settings
+    from app.core.database import Database
+    from app.core.browser_pool import BrowserPool
+    from app.core.http_client import HttpClient
+    from app.core.extract_pool import ExtractPool
+    from app.crawlers import CRAWLER_MAP
+    from app.services.crawl_service import crawl_board
+    from benchmarks.memory_db import MemoryDatabase
+
+    # 크롤러의 절대 URL/외부 링크 판별 기준을 로컬 서버로
+    CRAWLER_MAP[site].base_domain = origin
+    if host_rate > 0:
+        settings.HOST_RATE = host_rate
+    else:
+        settings.HOST_RATE, settings.HOST_BURST = 1e6, 10**6
+
+    Database.db = MemoryDatabase()
+    await Database.create_indexes()
+    board = {**BOARDS[site], "slug": site, "urls": board_urls(site, origin, config), "is_active": True}
+    if engine is not None:
+        board["engine"] = engine
+    else:
+        board.pop("engine")
+    board_id = (await Database.boards().insert_one(board)).inserted_id
+
+    try:
+        started = time.perf_counter()
+        result = await crawl_board(str(board_id))
+        elapsed = time.perf_counter() - started
+    finally:
+        await BrowserPool.stop()
+        ExtractPool.stop()
+        await HttpClient.close()
+
+    result["elapsed_sec"] = elapsed
+    result["stored"] = await Database.notices().count_documents({})
+    return result
+
+
+def run_site(site: str, origin: str, config: Dict[str, Any], engine: Optional[str], host_rate: float) -> Dict[str, Any]:
+    """사이트 하나 크롤링 (새 프로세스에서 실행) - 크롤링 결과와 이 프로세스/하위 프로세스의 최대 RSS"""
+    result = asyncio.run(_crawl_site(site, origin, SiteConfig(**config), engine, host_rate))
+    # 종료 중인 추출 워커를 회수해야 RUSAGE_CHILDREN에 잡힘 (ExtractPool.stop은 기다리지 않음)
+    for child in multiprocessing.active_children():
+        child.join(timeout=10)
+    result["peak_rss_mb"] = _peak_rss_mb(resource.RUSAGE_SELF)
+    result["peak_child_rss_mb"] = _peak_rss_mb(resource.RUSAGE_CHILDREN)   # 브라우저/추출 워커
+    return result
+
+
+def _site_report(site: str, engine: Optional[str], config: SiteConfig, result: Dict[str, Any], requests: Dict[str, int]) -> Dict[str, Any]:
+    elapsed = result["elapsed_sec"]
+    new = result.get("new", 0)
+    detail_fetches = requests.get("detail", 0) + requests.get("api_detail", 0)
+    return {
+        "site": site,
+        "engine": engine or "browser",
+        "expected_notices": config.total * config.urls,
+        "new": new,
+        "updated": result.get("updated", 0),
+        "stored": result["stored"],
+        "error": result.get("error"),
+        "elapsed_sec": round(elapsed, 3),
+        "notices_per_sec": round(new / elapsed, 2) if elapsed else 0.0,
+        "detail_fetches": detail_fetches,
+        "detail_fetches_per_sec": round(detail_fetches / elapsed, 2) if elapsed else 0.0,
+        "requests": requests,
+        "peak_rss_mb": result["peak_rss_mb"],
+        "peak_child_rss_mb": result["peak_child_rss_mb"],
+        "stages": result.get("stages", {}),
+        "waits": result.get("waits", {}),
+    }
+
+
+def run_benchmark(
+    sites: List[str],
+    config: SiteConfig,
+    engine: str = "default",
+    host_rate: float = 0.0
+) -> Dict[str, Any]:
+    """사이트별로 새 프로세스에서 벤치마크 실행 후 메타데이터와 함께 반환"""
+    context = multiprocessing.get_context("spawn")
+    results = []
+    for site in sites:
+        site_engine = None if engine == "browser" else BOARDS[site]["engine"]
+        # 서버는 이 프로세스에서 띄워 크롤링 프로세스의 하위 프로세스 RSS에 섞이지 않게
+        with SiteServer(config) as server, ProcessPoolExecutor(max_workers=1, mp_context=context) as executor:
+            result = executor.submit(run_site, site, server.origin, config.to_dict(), site_engine, host_rate).result()
+            results.append(_site_report(site, site_engine, config, result, server.stats()))
+
+    return {**metadata({**config.to_dict(), "engine": engine, "host_rate": host_rate}), "sites": results}
+
+
+def print_report(report: Dict[str, Any]):
+    print("=" * 60)
+    print(f"커밋 {report['commit']}, 설정 {report['config']}")
+    print("=" * 60)
+    for site in report["sites"]:
+        status = f"오류: {site['error']}" if site["error"] else f"new {site['new']}/{site['expected_notices']}"
+        print(
+            f"[{site['site']}] {status}, {site['elapsed_sec']:.2f}초, "
+            f"공지 {site['notices_per_sec']}/초, 상세 {site['detail_fetches']}건 ({site['detail_fetches_per_sec']}/초), "
+            f"RSS {site['peak_rss_mb']}MB (하위 프로세스 {site['peak_child_rss_mb']}MB)"
+        )
+        for name, stage in site["stages"].items():
+            print(
+                f"    {name}: {stage['items']}건, 작업 {stage['busy_sec']:.2f}초, "
+                f"대기 {stage['wait_sec']:.2f}초, 최대 큐 {stage['queue_max']}"
+            )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="로컬 게시판 서버 대상 크롤링 처리량 벤치마크")
+    parser.add_argument("--sites", nargs="*", choices=SITES, default=list(SITES), help="벤치마크할 사이트 (기본 전체)")
+    parser.add_argument("--pages", type=int, default=5, help="게시판당 목록 페이지 수")
+    parser.add_argument("--per-page", type=int, default=10, help="페이지당 공지 수")
+    parser.add_argument("--urls", type=int, default=1, help="사이트당 게시판 URL 수")
+    parser.add_argument("--paragraphs", type=int, default=8, help="상세 본문 문단 수")
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="서버 응답 지연 (ms)")
+    parser.add_argument("--host-rate", type=float, default=0.0, help="호스트당 초당 요청 수 (0이면 제한 없음)")
+    parser.add_argument("--engine", choices=("default", "browser"), default="default", help="default: 게시판 기본 엔진, browser: 브라우저 크롤러")
+    parser.add_argument("--output", help="결과 JSON 경로 (기본 benchmarks/results/crawl_<시각>_<커밋>.json)")
+    parser.add_argument("--compare", help="비교할 이전 결과 JSON")
+    args = parser.parse_args()
+
+    config = SiteConfig(
+        pages=args.pages, per_page=args.per_page, urls=args.urls,
+        paragraphs=args.paragraphs, latency_ms=args.latency_ms
+    )
+    report = run_benchmark(args.sites, config, args.engine, args.host_rate)
+    print_report(report)
+    print(f"💾 저장: {save(report, 'crawl', args.output)}")
+
+    if args.compare:
+        print_comparison(report, load(args.compare), "sites", "site", COMPARE_METRICS)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,377 @@
+"""
+벤치마크용 메모리 MongoDB (Motor 호환 일부)
+크롤링 경로(crawl_board → 크롤러 저장/워터마크/리스, 원본 보관)가 쓰는 컬렉션 메서드와 연산자만 구현합니다.
+문서는 저장/조회 때마다 BSON으로 직렬화해 실제 드라이버처럼 복사 비용과 타입 제약을 유지합니다.
+
+사용법:
+    Database.db = MemoryDatabase()
+"""
+import re
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import bson
+from bson import ObjectId
+from pymongo import ReturnDocument
+from pymongo.errors import DuplicateKeyError
+
+_MISSING = object()
+
+
+def _roundtrip(doc: Dict[str, Any]) -> Dict[str, Any]:
+    return bson.decode(bson.encode(doc))
+
+
+# ===== 조회 조건 =====
+
+def _values(doc: Any, path: List[str]) -> List[Any]:
+    """점 경로의 값들 (배열은 펼침 - "urls.url"은 각 원소의 url)"""
+    if not path:
+        return [doc]
+    if isinstance(doc, list):
+        return [value for item in doc for value in _values(item, path)]
+    if not isinstance(doc, dict) or path[0] not in doc:
+        return [_MISSING]
+    return _values(doc[path[0]], path[1:])
+
+
+def _compare(op: str, value: Any, arg: Any) -> bool:
+    if op == "$in":
+        return any(_equals(value, a) for a in arg)
+    if op == "$nin":
+        return not any(_equals(value, a) for a in arg)
+    if op == "$ne":
+        return not _equals(value, arg)
+    if op == "$exists":
+        return (value is not _MISSING) == bool(arg)
+    if value is _MISSING or value is None:
+        return False
+    try:
+        return {
+            "$gt": lambda: value > arg,
+            "$gte": lambda: value >= arg,
+            "$lt": lambda: value < arg,
+            "$lte": lambda: value <= arg,
+        }[op]()
+    except TypeError:
+        return False
+
+
+def _equals(value: Any, expected: Any) -> bool:
+    if value is _MISSING:
+        return expected is None
+    if isinstance(value, list) and not isinstance(expected, list):
+        return expected in value
+    return value == expected
+
+
+def _match_field(doc: Dict[str, Any], key: str, condition: Any) -> bool:
+    values = _values(doc, key.split("."))
+    if isinstance(condition, dict) and condition and all(k.startswith("$") for k in condition):
+        for op, arg in condition.items():
+            if op in ("$ne", "$nin"):
+                if not all(_compare(op, value, arg) for value in values):
+                    return False
+            elif not any(_compare(op, value, arg) for value in values):
+                return False
+        return True
+    return any(_equals(value, condition) for value in values)
+
+
+def matches(doc: Dict[str, Any], query: Dict[str, Any]) -> bool:
+    for key, condition in query.items():
+        if key == "$or":
+            if not any(matches(doc, sub) for sub in condition):
+                return False
+        elif key == "$and":
+            if not all(matches(doc, sub) for sub in condition):
+                return False
+        elif not _match_field(doc, key, condition):
+            return False
+    return True
+
+
+# ===== 프로젝션 =====
+
+def _evaluate(doc: Dict[str, Any], expr: Any) -> Any:
+    """집계 표현식 일부 ($gt, $strLenCP, $ifNull, "$필드")"""
+    if isinstance(expr, str) and expr.startswith("$"):
+        value = _values(doc, expr[1:].split("."))[0]
+        return None if value is _MISSING else value
+    if isinstance(expr, dict) and len(expr) == 1:
+        op, args = next(iter(expr.items()))
+        if op == "$gt":
+            left, right = (_evaluate(doc, a) for a in args)
+            return left is not None and left > right
+        if op == "$strLenCP":
+            return len(_evaluate(doc, args))
+        if op == "$ifNull":
+            value = _evaluate(doc, args[0])
+            return _evaluate(doc, args[1]) if value is None else value
+    return expr
+
+
+def project(doc: Dict[str, Any], projection: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    if not projection:
+        return doc
+    include_id = projection.get("_id", 1)
+    fields = {k: v for k, v in projection.items() if k != "_id"}
+    if fields and all(v == 0 for v in fields.values()):
+        result = {k: v for k, v in doc.items() if k not in fields}
+    else:
+        result = {}
+        for key, value in fields.items():
+            if isinstance(value, dict):
+                result[key] = _evaluate(doc, value)
+            elif key in doc:
+                result[key] = doc[key]
+    if include_id and "_id" in doc:
+        result["_id"] = doc["_id"]
+    elif not include_id:
+        result.pop("_id", None)
+    return result
+
+
+# ===== 갱신 =====
+
+def _positional(doc: Dict[str, Any], query: Dict[str, Any], key: str) -> str:
+    """"arr.$.field"의 $를 조회 조건에 맞은 배열 원소 번호로"""
+    if ".$" not in key:
+        return key
+    array = key.split(".$")[0]
+    for condition_key, condition in query.items():
+        if condition_key.startswith(array + "."):
+            sub = condition_key[len(array) + 1:]
+            for i, item in enumerate(doc.get(array) or []):
+                if isinstance(item, dict) and _match_field(item, sub, condition):
+                    return key.replace("$", str(i), 1)
+    raise ValueError(f"positional 갱신 대상 없음: {key}")
+
+
+def _set(doc: Dict[str, Any], key: str, value: Any):
+    parts = key.split(".")
+    target: Any = doc
+    for part in parts[:-1]:
+        target = target[int(part)] if isinstance(target, list) else target.setdefault(part, {})
+    if isinstance(target, list):
+        target[int(parts[-1])] = value
+    else:
+        target[parts[-1]] = value
+
+
+def _get(doc: Dict[str, Any], key: str) -> Any:
+    value = _values(doc, key.split("."))[0]
+    return None if value is _MISSING else value
+
+
+def _unset(doc: Dict[str, Any], key: str):
+    parts = key.split(".")
+    target: Any = doc
+    for part in parts[:-1]:
+        target = target[int(part)] if isinstance(target, list) else target.get(part, {})
+    if isinstance(target, dict):
+        target.pop(parts[-1], None)
+
+
+def apply_update(doc: Dict[str, Any], update: Dict[str, Any], query: Dict[str, Any], inserting: bool = False) -> bool:
+    """갱신 연산 적용 - 바뀌었으면 True"""
+    before = bson.encode(doc)
+    for op, fields in update.items():
+        for key, value in fields.items():
+            key = _positional(doc, query, key)
+            if op == "$set" or (op == "$setOnInsert" and inserting):
+                _set(doc, key, value)
+            elif op == "$unset":
+                _unset(doc, key)
+            elif op == "$inc":
+                _set(doc, key, (_get(doc, key) or 0) + value)
+            elif op == "$addToSet":
+                items = _get(doc, key) or []
+                if value not in items:
+                    _set(doc, key, items + [value])
+            elif op == "$push":
+                _set(doc, key, (_get(doc, key) or []) + [value])
+            elif op != "$setOnInsert":
+                raise NotImplementedError(f"지원하지 않는 갱신 연산: {op}")
+    return bson.encode(doc) != before
+
+
+def _upsert_base(query: Dict[str, Any]) -> Dict[str, Any]:
+    """upsert 새 문서의 기본 필드 (조회 조건의 단순 일치 값)"""
+    doc: Dict[str, Any] = {}
+    for key, value in query.items():
+        if not key.startswith("$") and "." not in key and not (isinstance(value, dict) and any(k.startswith("$") for k in value)):
+            doc[key] = value
+    return doc
+
+
+class _Result:
+    def __init__(self, **fields):
+        self.matched_count = 0
+        self.modified_count = 0
+        self.upserted_id = None
+        self.upserted_count = 0
+        self.inserted_count = 0
+        self.deleted_count = 0
+        self.__dict__.update(fields)
+
+
+class MemoryCursor:
+    def __init__(self, docs: List[Dict[str, Any]]):
+        self._docs = docs
+
+    def sort(self, key: Any, direction: int = 1) -> "MemoryCursor":
+        keys: List[Tuple[str, int]] = key if isinstance(key, list) else [(key, direction)]
+        for name, order in reversed(keys):
+            self._docs.sort(key=lambda d: (_get(d, name) is not None, _get(d, name)), reverse=order < 0)
+        return self
+
+    def limit(self, count: int) -> "MemoryCursor":
+        if count:
+            self._docs = self._docs[:count]
+        return self
+
+    async def to_list(self, length: Optional[int] = None) -> List[Dict[str, Any]]:
+        return self._docs if length is None else self._docs[:length]
+
+    def __aiter__(self):
+        return self._iter()
+
+    async def _iter(self):
+        for doc in self._docs:
+            yield doc
+
+
+class MemoryCollection:
+    """컬렉션 1개 (_id 외 unique 인덱스는 upsert 조건으로 대신함)"""
+
+    def __init__(self, name: str):
+        self.name = name
+        self._docs: Dict[Any, Dict[str, Any]] = {}
+
+    def _find(self, query: Optional[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        query = query or {}
+        if set(query) == {"_id"} and not isinstance(query["_id"], dict):
+            doc = self._docs.get(query["_id"])
+            return [doc] if doc is not None else []
+        return [doc for doc in self._docs.values() if matches(doc, query)]
+
+    def _insert(self, doc: Dict[str, Any]) -> Any:
+        doc = _roundtrip({"_id": ObjectId(), **doc} if "_id" not in doc else doc)
+        if doc["_id"] in self._docs:
+            raise DuplicateKeyError(f"E11000 duplicate key: {self.name}._id {doc['_id']}")
+        self._docs[doc["_id"]] = doc
+        return doc["_id"]
+
+    async def create_index(self, keys: Any, **kwargs) -> str:
+        return kwargs.get("name") or str(keys)
+
+    def find(self, query: Optional[Dict[str, Any]] = None, projection: Optional[Dict[str, Any]] = None, **kwargs) -> MemoryCursor:
+        return MemoryCursor([project(_roundtrip(doc), projection) for doc in self._find(query)])
+
+    async def find_one(self, query: Optional[Dict[str, Any]] = None, projection: Optional[Dict[str, Any]] = None, **kwargs) -> Optional[Dict[str, Any]]:
+        docs = self._find(query)
+        return project(_roundtrip(docs[0]), projection) if docs else None
+
+    async def count_documents(self, query: Dict[str, Any], **kwargs) -> int:
+        return len(self._find(query))
+
+    async def insert_one(self, doc: Dict[str, Any], **kwargs) -> _Result:
+        inserted_id = self._insert(doc)
+        doc.setdefault("_id", inserted_id)
+        return _Result(inserted_id=inserted_id)
+
+    async def insert_many(self, docs: Iterable[Dict[str, Any]], ordered: bool = True, **kwargs) -> _Result:
+        ids = [self._insert(doc) for doc in docs]
+        return _Result(inserted_ids=ids, inserted_count=len(ids))
+
+    def _update(self, query: Dict[str, Any], update: Dict[str, Any], upsert: bool, many: bool = False) -> _Result:
+        docs = self._find(query)
+        if not many:
+            docs = docs[:1]
+        if docs:
+            modified = sum(apply_update(doc, update, query) for doc in docs)
+            return _Result(matched_count=len(docs), modified_count=modified)
+        if not upsert:
+            return _Result()
+        doc = _upsert_base(query)
+        apply_update(doc, update, query, inserting=True)
+        upserted_id = self._insert(doc)
+        return _Result(upserted_id=upserted_id, upserted_count=1)
+
+    async def update_one(self, query: Dict[str, Any], update: Dict[str, Any], upsert: bool = False, **kwargs) -> _Result:
+        return self._update(query, update, upsert)
+
+    async def update_many(self, query: Dict[str, Any], update: Dict[str, Any], upsert: bool = False, **kwargs) -> _Result:
+        return self._update(query, update, upsert, many=True)
+
+    async def find_one_and_update(
+        self,
+        query: Dict[str, Any],
+        update: Dict[str, Any],
+        projection: Optional[Dict[str, Any]] = None,
+        sort: Optional[List[Tuple[str, int]]] = None,
+        upsert: bool = False,
+        return_document: bool = ReturnDocument.BEFORE,
+        **kwargs
+    ) -> Optional[Dict[str, Any]]:
+        docs = self._find(query)
+        if sort:
+            docs = MemoryCursor(docs).sort(sort)._docs
+        if docs:
+            doc = docs[0]
+            before = _roundtrip(doc)
+            apply_update(doc, update, query)
+            return project(_roundtrip(doc) if return_document == ReturnDocument.AFTER else before, projection)
+        if not upsert:
+            return None
+        doc = _upsert_base(query)
+        apply_update(doc, update, query, inserting=True)
+        self._insert(doc)
+        return project(_roundtrip(doc), projection) if return_document == ReturnDocument.AFTER else None
+
+    async def delete_one(self, query: Dict[str, Any], **kwargs) -> _Result:
+        docs = self._find(query)[:1]
+        for doc in docs:
+            del self._docs[doc["_id"]]
+        return _Result(deleted_count=len(docs))
+
+    async def delete_many(self, query: Dict[str, Any], **kwargs) -> _Result:
+        docs = self._find(query)
+        for doc in docs:
+            del self._docs[doc["_id"]]
+        return _Result(deleted_count=len(docs))
+
+    async def bulk_write(self, requests: List[Any], ordered: bool = True, **kwargs) -> _Result:
+        """UpdateOne/InsertOne 목록"""
+        total = _Result()
+        for request in requests:
+            if hasattr(request, "_doc") and not hasattr(request, "_filter"):
+                self._insert(request._doc)
+                total.inserted_count += 1
+                continue
+            result = self._update(request._filter, request._doc, bool(request._upsert))
+            total.matched_count += result.matched_count
+            total.modified_count += result.modified_count
+            total.upserted_count += result.upserted_count
+        return total
+
+
+class MemoryDatabase:
+    """컬렉션 이름 → MemoryCollection (Database.db 자리에 넣어 사용)"""
+
+    def __init__(self):
+        self._collections: Dict[str, MemoryCollection] = {}
+
+    def __getattr__(self, name: str) -> MemoryCollection:
+        if name.startswith("_"):
+            raise AttributeError(name)
+        return self[name]
+
+    def __getitem__(self, name: str) -> MemoryCollection:
+        if name not in self._collections:
+            self._collections[name] = MemoryCollection(name)
+        return self._collections[name]
+
+    def sizes(self) -> Dict[str, int]:
+        """컬렉션별 문서 수"""
+        return {name: len(collection._docs) for name, collection in self._collections.items()}
@@ -0,0 +1,196 @@
+"""
+파서 마이크로 벤치마크 (이동/DB 없이 크롤러 파싱 단계만)
+크롤러별 저장된 목록/상세 HTML(tests/fixtures/parsers/)로 다음을 따로 측정합니다.
+- 목록 행 추출: extract_rows(목록 HTML, row_selector, row_schema) - HTTP 엔진 목록 파싱 (행/초)
+- parse_row: 추출된 행 → 공지 dict 후처리 (행/초)
+- 본문 추출: extract_content(상세 HTML, content_selector) - _extract_content가 추출 풀에서 실행하는 함수 (페이지당 ms)
+- 첨부파일 추출: extract_links + _filter_attachments (페이지당 ms, html_attachments가 False인 공과대학은 제외)
+
+측정 전에 결과가 정답(tests/fixtures/parsers/<crawler>.json)과 같은지 확인하고, 다르면 측정 결과와 함께 실패로 표시합니다.
+선택자/추출 규칙을 의도적으로 바꿨으면 --update-golden으로 정답을 다시 쓰고 diff를 확인합니다.
+
+결과는 benchmarks/results/parsers_<시각>_<커밋>.json에 저장하고, --compare로 이전 결과와 비교합니다.
+
+사용법:
+    python benchmarks/parser_bench.py
+    python benchmarks/parser_bench.py --crawlers csai jbnu --min-time 0.5
+    python benchmarks/parser_bench.py --compare benchmarks/results/parsers_20261017-120000_ea6db62.json
+    python benchmarks/parser_bench.py --update-golden
+"""
+import sys
+import json
+import time
+import argparse
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+# 프로젝트 루트를 path에 추가
+ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(ROOT))
+
+from bson import ObjectId
+
+from app.core.database import INITIAL_BOARDS
+from app.crawlers import CRAWLER_MAP, BaseCrawler
+from app.crawlers.html_extract import extract_content, extract_links, extract_rows
+from benchmarks.report import metadata, save, load, print_comparison
+
+FIXTURES = ROOT / "tests" / "fixtures" / "parsers"
+CRAWLERS = ("csai", "swuniv", "jbnu", "eng")
+
+# 비교 출력 지표 (이름, 클수록 좋은지)
+COMPARE_METRICS = [
+    ("list_rows_per_sec", True),
+    ("parse_row_per_sec", True),
+    ("content_ms", False),
+    ("attachments_ms", False),
+]
+
+
+def list_url(name: str) -> str:
+    """parse_row의 base_url (INITIAL_BOARDS의 첫 게시판 URL)"""
+    return next(board["urls"][0]["url"] for board in INITIAL_BOARDS if board["crawler_type"] == name)
+
+
+def read_fixture(name: str, kind: str) -> str:
+    with open(FIXTURES / f"{name}_{kind}.html", encoding="utf-8", newline="") as f:
+        return f.read()
+
+
+def golden_path(name: str) -> Path:
+    return FIXTURES / f"{name}.json"
+
+
+def load_golden(name: str) -> Dict[str, Any]:
+    return json.loads(golden_path(name).read_text(encoding="utf-8"))
+
+
+def _attachments(crawler_class: type, html: str) -> Optional[List[Dict[str, str]]]:
+    if not crawler_class.html_attachments:
+        return None
+    return crawler_class._filter_attachments(extract_links(html, crawler_class.attachment_selector))
+
+
+def parse_fixture(name: str) -> Dict[str, Any]:
+    """크롤러 fixture 파싱 결과 (정답 형식: 목록 parse_row 결과, 본문, 첨부파일)"""
+    crawler_class = CRAWLER_MAP[name]
+    crawler: BaseCrawler = crawler_class(ObjectId(), name)
+    raw_rows = extract_rows(read_fixture(name, "list"), crawler_class.row_selector, crawler_class.row_schema)
+    detail = read_fixture(name, "detail")
+    return {
+        "rows": [row for row in (crawler.parse_row(raw, list_url(name)) for raw in raw_rows) if row is not None],
+        "content": extract_content(detail, crawler_class.content_selector),
+        "attachments": _attachments(crawler_class, detail),
+    }
+
+
+def check_golden(name: str, parsed: Dict[str, Any]) -> List[str]:
+    """정답과 다른 필드 이름 목록"""
+    golden = load_golden(name)
+    return [field for field in ("rows", "content", "attachments") if parsed.get(field) != golden.get(field)]
+
+
+def measure(fn: Callable[[], Any], min_time: float, rounds: int) -> float:
+    """호출 1회 시간 (초) - 한 라운드가 min_time 이상이 되도록 반복 횟수를 정하고 rounds번 중 가장 빠른 값"""
+    number = 1
+    while True:
+        started = time.perf_counter()
+        for _ in range(number):
+            fn()
+        elapsed = time.perf_counter() - started
+        if elapsed >= min_time or number >= 1_000_000:
+            break
+        number *= 2 if elapsed <= 0 else max(2, min(10, int(min_time / elapsed) + 1))
+
+    best = elapsed / number
+    for _ in range(rounds - 1):
+        started = time.perf_counter()
+        for _ in range(number):
+            fn()
+        best = min(best, (time.perf_counter() - started) / number)
+    return best
+
+
+def bench_crawler(name: str, min_time: float = 0.2, rounds: int = 5) -> Dict[str, Any]:
+    """크롤러 하나 정답 확인 후 단계별 측정"""
+    crawler_class = CRAWLER_MAP[name]
+    crawler: BaseCrawler = crawler_class(ObjectId(), name)
+    list_html = read_fixture(name, "list")
+    detail_html = read_fixture(name, "detail")
+    base_url = list_url(name)
+    raw_rows = extract_rows(list_html, crawler_class.row_selector, crawler_class.row_schema)
+    parsed = parse_fixture(name)
+
+    list_sec = measure(lambda: extract_rows(list_html, crawler_class.row_selector, crawler_class.row_schema), min_time, rounds)
+    parse_sec = measure(lambda: [crawler.parse_row(raw, base_url) for raw in raw_rows], min_time, rounds)
+    content_sec = measure(lambda: extract_content(detail_html, crawler_class.content_selector), min_time, rounds)
+    attachments_sec = measure(lambda: _attachments(crawler_class, detail_html), min_time, rounds) if crawler_class.html_attachments else None
+
+    return {
+        "crawler": name,
+        "class": crawler_class.__name__,
+        "golden_mismatch": check_golden(name, parsed),
+        "list_kb": round(len(list_html.encode()) / 1024, 1),
+        "detail_kb": round(len(detail_html.encode()) / 1024, 1),
+        "rows": len(raw_rows),
+        "notices": len(parsed["rows"]),
+        "list_ms": round(list_sec * 1000, 3),
+        "list_rows_per_sec": round(len(raw_rows) / list_sec),
+        "parse_row_per_sec": round(len(raw_rows) / parse_sec),
+        "content_ms": round(content_sec * 1000, 3),
+        "attachments_ms": round(attachments_sec * 1000, 3) if attachments_sec is not None else None,
+    }
+
+
+def run_benchmark(crawlers: List[str], min_time: float = 0.2, rounds: int = 5) -> Dict[str, Any]:
+    results = [bench_crawler(name, min_time, rounds) for name in crawlers]
+    return {**metadata({"min_time": min_time, "rounds": rounds}), "crawlers": results}
+
+
+def update_golden(crawlers: List[str]):
+    for name in crawlers:
+        path = golden_path(name)
+        path.write_text(json.dumps(parse_fixture(name), ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
+        print(f"📝 정답 갱신: {path.relative_to(ROOT)}")
+
+
+def print_report(report: Dict[str, Any]):
+    print("=" * 60)
+    print(f"커밋 {report['commit']}, 설정 {report['config']}")
+    print("=" * 60)
+    for item in report["crawlers"]:
+        status = f"❌ 정답과 다름: {', '.join(item['golden_mismatch'])}" if item["golden_mismatch"] else "✅ 정답 일치"
+        attachments = f"{item['attachments_ms']}ms" if item["attachments_ms"] is not None else "-"
+        print(
+            f"[{item['crawler']}] {status}\n"
+            f"    목록 {item['list_kb']}KB {item['rows']}행 → 공지 {item['notices']}건: "
+            f"행 추출 {item['list_ms']}ms ({item['list_rows_per_sec']}행/초), parse_row {item['parse_row_per_sec']}행/초\n"
+            f"    상세 {item['detail_kb']}KB: 본문 {item['content_ms']}ms, 첨부파일 {attachments}"
+        )
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="크롤러 파서 마이크로 벤치마크")
+    parser.add_argument("--crawlers", nargs="*", choices=CRAWLERS, default=list(CRAWLERS), help="측정할 크롤러 (기본 전체)")
+    parser.add_argument("--min-time", type=float, default=0.2, help="라운드당 최소 측정 시간 (초)")
+    parser.add_argument("--rounds", type=int, default=5, help="측정 라운드 수 (가장 빠른 값 사용)")
+    parser.add_argument("--output", help="결과 JSON 경로 (기본 benchmarks/results/parsers_<시각>_<커밋>.json)")
+    parser.add_argument("--compare", help="비교할 이전 결과 JSON")
+    parser.add_argument("--update-golden", action="store_true", help="현재 파싱 결과로 정답 JSON을 다시 씀 (측정 안 함)")
+    args = parser.parse_args()
+
+    if args.update_golden:
+        update_golden(args.crawlers)
+        return 0
+
+    report = run_benchmark(args.crawlers, args.min_time, max(1, args.rounds))
+    print_report(report)
+    print(f"💾 저장: {save(report, 'parsers', args.output)}")
+
+    if args.compare:
+        print_comparison(report, load(args.compare), "crawlers", "crawler", COMPARE_METRICS)
+    return 1 if any(item["golden_mismatch"] for item in report["crawlers"]) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
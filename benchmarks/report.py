@@ -0,0 +1,84 @@
+"""
+벤치마크 결과 저장/비교 (crawl_bench, parser_bench 공용)
+결과 JSON은 benchmarks/results/<종류>_<시각>_<커밋>.json에 저장합니다.
+"""
+import json
+import platform
+import subprocess
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+ROOT = Path(__file__).parent.parent
+RESULTS_DIR = ROOT / "benchmarks" / "results"
+
+
+def commit() -> str:
+    """현재 커밋 (작업 트리가 바뀌었으면 +dirty)"""
+    try:
+        head = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=ROOT, capture_output=True, text=True, check=True
+        ).stdout.strip()
+        dirty = subprocess.run(
+            ["git", "status", "--porcelain", "--untracked-files=no"], cwd=ROOT, capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+    return f"{head}+dirty" if dirty else head
+
+
+def metadata(config: Dict[str, Any]) -> Dict[str, Any]:
+    """결과 공통 필드 (커밋, 시각, 실행 환경, 설정)"""
+    return {
+        "commit": commit(),
+        "created_at": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "config": config,
+    }
+
+
+def save(report: Dict[str, Any], kind: str, output: Optional[str] = None) -> Path:
+    path = Path(output) if output else RESULTS_DIR / f"{kind}_{datetime.now():%Y%m%d-%H%M%S}_{report['commit']}.json"
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(report, ensure_ascii=False, indent=2), encoding="utf-8")
+    return path
+
+
+def load(path: str) -> Dict[str, Any]:
+    return json.loads(Path(path).read_text(encoding="utf-8"))
+
+
+def print_comparison(
+    report: Dict[str, Any],
+    baseline: Dict[str, Any],
+    section: str,
+    key: str,
+    metrics: List[Tuple[str, bool]]
+):
+    """
+    이전 결과 대비 항목별 지표 변화 (%)
+
+    Args:
+        section: 항목 목록 필드 ("sites", "crawlers")
+        key: 항목 이름 필드 ("site", "crawler")
+        metrics: (지표 이름, 클수록 좋은지) 목록 - 5% 이상 변하면 ✅/❌ 표시
+    """
+    print("=" * 60)
+    print(f"비교: {baseline['commit']} ({baseline['created_at']}) → {report['commit']}")
+    if baseline.get("config") != report.get("config"):
+        print(f"⚠️  설정이 다름: {baseline.get('config')}")
+    previous = {item[key]: item for item in baseline.get(section, [])}
+    for item in report[section]:
+        before = previous.get(item[key])
+        if before is None:
+            continue
+        changes = []
+        for metric, higher_is_better in metrics:
+            old, new = before.get(metric), item.get(metric)
+            if not old or new is None:
+                continue
+            delta = (new - old) / old * 100
+            mark = "" if abs(delta) < 5 else ("✅" if (delta > 0) == higher_is_better else "❌")
+            changes.append(f"{metric} {old} → {new} ({delta:+.1f}%){mark}")
+        print(f"[{item[key]}] " + ", ".join(changes))
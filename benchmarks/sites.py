@@ -0,0 +1,469 @@
+"""
+벤치마크용 로컬 게시판 서버
+네 사이트의 목록/상세 구조를 흉내 낸 HTML/JSON을 설정한 페이지 수 × 페이지당 공지 수만큼 만들어 응답합니다.
+- csai: .artclTable 목록 (?page=N, 1페이지 상단 고정 공지), .artclView 상세, .artclItem 첨부파일
+- swuniv: ?gc=...&do=list&page=N 목록, do=view 상세(.content_wrap), do=download 첨부파일
+- jbnu: pf_LinkPage(n) form POST 페이지네이션, pf_DetailMove(id) → /web/Board/{id}/detailView.do
+- eng: Vue 스타일 SPA (목록/상세를 JSON API로 받아 그림), .file_item 버튼 클릭 다운로드
+
+크롤러 프로세스와 CPU/메모리를 나누지 않도록 별도 프로세스(spawn)에서 실행하고,
+종류별 요청 수는 GET /__stats, 초기화는 POST /__reset으로 확인합니다.
+"""
+import re
+import json
+import time
+import html
+import multiprocessing
+from datetime import date, timedelta
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import urlsplit, parse_qs
+from urllib.request import Request, urlopen
+
+SITES = ("csai", "swuniv", "jbnu", "eng")
+
+# 공지 번호 = (URL 번호 + 1) × ID_BASE + 게시판 안 순번
+ID_BASE = 100000
+
+
+class SiteConfig:
+    """생성할 게시판 크기와 응답 지연"""
+
+    def __init__(self, pages: int = 5, per_page: int = 10, urls: int = 1, paragraphs: int = 8, latency_ms: float = 0.0):
+        self.pages = pages
+        self.per_page = per_page
+        self.urls = urls                # 사이트당 게시판 URL 수
+        self.paragraphs = paragraphs    # 상세 본문 문단 수
+        self.latency_ms = latency_ms    # 모든 응답 전 대기 (네트워크 지연 흉내)
+
+    @property
+    def total(self) -> int:
+        return self.pages * self.per_page
+
+    def to_dict(self) -> Dict[str, Any]:
+        return dict(vars(self))
+
+
+# ===== 공지 생성 =====
+
+def notice(config: SiteConfig, board: int, index: int) -> Dict[str, Any]:
+    """게시판 board의 index번째 공지 (0이 최신) - 같은 설정이면 항상 같은 내용"""
+    number = config.total - index
+    post_id = (board + 1) * ID_BASE + number
+    # 게시일은 최대 300일 범위에 고르게 (min_year에 걸리지 않게)
+    posted = date.today() - timedelta(days=index * 300 // max(1, config.total))
+    return {
+        "id": post_id,
+        "number": number,
+        "title": f"[벤치마크] {board + 1}번 게시판 공지 {number}",
+        "author": ("학사팀", "학생지원과", "학부 사무실")[post_id % 3],
+        "date": posted.isoformat(),
+        "views": 100 + post_id % 900,
+        "files": [f"안내문_{post_id}.hwp", f"신청서_{post_id}.pdf"][: post_id % 3],
+    }
+
+
+def page_notices(config: SiteConfig, board: int, page: int) -> List[Dict[str, Any]]:
+    if page < 1 or board >= config.urls:
+        return []
+    start = (page - 1) * config.per_page
+    return [notice(config, board, i) for i in range(start, min(start + config.per_page, config.total))]
+
+
+def body_html(config: SiteConfig, item: Dict[str, Any]) -> str:
+    """상세 본문 (문단 + 멀티라인 셀이 있는 표 + 공백 문단)"""
+    e = html.escape
+    parts = [f"<p>{e(item['title'])} 관련하여 다음과 같이 안내합니다.</p>", "<p>&nbsp;</p>"]
+    for i in range(config.paragraphs):
+        parts.append(
+            f"<p>{i + 1}. 세부 사항 {i + 1}: 신청 기간과 제출 서류, 문의처를 반드시 확인하시기 바랍니다. "
+            f"관련 규정에 따라 처리되며 기한 내 미제출 시 불이익이 있을 수 있습니다.</p>"
+        )
+        if i == config.paragraphs // 2:
+            parts.append(
+                "<table><thead><tr><th>구분</th><th>일정</th><th>비고</th></tr></thead><tbody>"
+                "<tr><td>신청</td><td>3.2.(월) ~ 3.6.(금)</td><td>온라인</td></tr>"
+                "<tr><td>심사</td><td><p>서류: 3.9.(월)</p><p>면접: 3.11.(수)</p></td><td></td></tr>"
+                "<tr><td>발표</td><td>3.16.(월)</td><td>홈페이지 공지</td></tr>"
+                "</tbody></table>"
+            )
+    parts.append(f"<p>문의: {e(item['author'])}</p>")
+    return "\n".join(parts)
+
+
+def _page(title: str, body: str, head: str = "") -> str:
+    return (
+        f'<!DOCTYPE html>\n<html lang="ko">\n<head><meta charset="utf-8"><title>{html.escape(title)}</title>{head}</head>\n'
+        f"<body>\n{body}\n</body>\n</html>\n"
+    )
+
+
+# ===== csai =====
+
+def csai_list(config: SiteConfig, board: int, page: int) -> str:
+    e = html.escape
+    rows = []
+    if page == 1:
+        rows.append(
+            f'<tr class="headline"><td class="_artclTdNum">공지</td><td class="_artclTdTitle artclTitle">'
+            f'<a href="/bbs/csai/{board + 1}/{(board + 1) * ID_BASE}/artclView.do"><strong>[필독] 학부 공지 이용 안내</strong></a></td>'
+            f'<td class="_artclTdWriter">관리자</td><td class="_artclTdRdate">2025.03.02</td><td>9999</td></tr>'
+        )
+    for item in page_notices(config, board, page):
+        rows.append(
+            f'<tr><td class="_artclTdNum">{item["number"]}</td><td class="_artclTdTitle artclTitle">'
+            f'<a href="/bbs/csai/{board + 1}/{item["id"]}/artclView.do" class="artclLinkView"><strong>{e(item["title"])}</strong></a></td>'
+            f'<td class="_artclTdWriter">{e(item["author"])}</td><td class="_artclTdRdate">{item["date"].replace("-", ".")}</td>'
+            f'<td class="_artclTdAccess">{item["views"]}</td></tr>'
+        )
+    if not page_notices(config, board, page):
+        rows.append('<tr><td colspan="5">등록된 글이 없습니다.</td></tr>')
+    paging = " ".join(f'<a href="?page={n}">{n}</a>' for n in range(1, config.pages + 1))
+    return _page("학사공지", (
+        '<div class="_fnctWrap"><table class="artclTable artclHorNum1"><thead><tr>'
+        "<th>번호</th><th>제목</th><th>작성자</th><th>작성일</th><th>조회수</th></tr></thead>\n<tbody>\n"
+        + "\n".join(rows) +
+        f'\n</tbody></table><div class="_paging">{paging}</div></div>'
+    ))
+
+
+def csai_detail(config: SiteConfig, item: Dict[str, Any], board: int) -> str:
+    e = html.escape
+    files = "".join(
+        f'<li><a href="/bbs/csai/{board + 1}/download.do?fileId={item["id"]}{i}" title="다운로드">{e(name)}</a></li>'
+        for i, name in enumerate(item["files"])
+    )
+    return _page(item["title"], (
+        f'<div class="artclViewHead"><h2 class="artclViewTitle">{e(item["title"])}</h2>'
+        f'<dl><dt>작성자</dt><dd>{e(item["author"])}</dd><dt>작성일</dt><dd>{item["date"]}</dd></dl></div>\n'
+        f'<div class="artclView">\n{body_html(config, item)}\n</div>\n'
+        f'<div class="artclItem viewForm"><dl><dt>첨부파일</dt><dd><ul>{files}</ul></dd></dl></div>'
+    ))
+
+
+# ===== swuniv =====
+
+def swuniv_list(config: SiteConfig, board: int, page: int) -> str:
+    e = html.escape
+    gc = f"605XOAS{board}"
+    icon = '<img src="/img/file.gif" alt="첨부">'
+    rows = [
+        f'<tr><td>{item["number"]}</td><td class="subject"><a href="?gc={gc}&amp;do=view&amp;idx={item["id"]}">{e(item["title"])}</a></td>'
+        f'<td>{icon if item["files"] else ""}</td><td>{e(item["author"])}</td>'
+        f'<td>{item["date"]}</td><td>{item["views"]}</td></tr>'
+        for item in page_notices(config, board, page)
+    ] or ['<tr><td colspan="6">게시물이 없습니다.</td></tr>']
+    return _page("공지사항", (
+        '<div class="board"><table class="board_list"><thead><tr>'
+        "<th>번호</th><th>제목</th><th>첨부</th><th>작성자</th><th>작성일</th><th>조회</th></tr></thead>\n<tbody>\n"
+        + "\n".join(rows) + "\n</tbody></table></div>"
+    ))
+
+
+def swuniv_detail(config: SiteConfig, item: Dict[str, Any], board: int) -> str:
+    e = html.escape
+    files = "".join(
+        f'<a href="/main/jbnusw?gc=605XOAS{board}&amp;do=download&amp;file={item["id"]}{i}">{e(name)}</a>'
+        for i, name in enumerate(item["files"])
+    )
+    return _page(item["title"], (
+        f'<div class="content_wrap">\n<h3>{e(item["title"])}</h3>\n'
+        f'<div class="info"><span>{e(item["author"])}</span> <span>{item["date"]}</span></div>\n'
+        f'<div class="txt">\n{body_html(config, item)}\n</div>\n<div class="file">{files}</div>\n</div>'
+    ))
+
+
+# ===== jbnu =====
+
+JBNU_SCRIPT = """<script>
+function pf_LinkPage(num) {
+  document.frm.pageIndex.value = num;
+  document.frm.submit();
+}
+function pf_DetailMove(id) {
+  location.href = "/web/Board/" + id + "/detailView.do";
+}
+</script>"""
+
+
+def jbnu_list(config: SiteConfig, board: int, page: int) -> str:
+    e = html.escape
+    path = f"/web/news/notice/sub{board + 1:02d}.do"
+    rows = [
+        f'<tr><td class="td-num">{item["number"]}</td><td class="td-title">'
+        f'<a href="javascript:void(0);" onclick="pf_DetailMove(\'{item["id"]}\')" class="title">{e(item["title"])}</a>'
+        f'<ul class="etc-list"><li>{item["date"]}</li><li>조회 {item["views"]}</li></ul></td>'
+        f'<td class="td-file">{"첨부" if item["files"] else ""}</td><td class="td-hit">{item["views"]}</td>'
+        f'<td class="td-writer">{e(item["author"])}</td></tr>'
+        for item in page_notices(config, board, page)
+    ] or ['<tr><td colspan="5">등록된 게시물이 없습니다.</td></tr>']
+
+    # 10페이지 단위 블록 + 처음/이전/다음/끝
+    block = (page - 1) // 10 * 10
+    links = ['<a href="javascript:void(0);" onclick="pf_LinkPage(1)" class="first">처음</a>']
+    if block:
+        links.append(f'<a href="javascript:void(0);" onclick="pf_LinkPage({block})" class="prev">이전</a>')
+    for n in range(block + 1, min(block + 10, config.pages) + 1):
+        links.append(f"<strong>{n}</strong>" if n == page else f'<a href="javascript:void(0);" onclick="pf_LinkPage({n})">{n}</a>')
+    if block + 10 < config.pages:
+        links.append(f'<a href="javascript:void(0);" onclick="pf_LinkPage({block + 11})" class="next">다음</a>')
+    links.append(f'<a href="javascript:void(0);" onclick="pf_LinkPage({config.pages})" class="last">끝</a>')
+
+    return _page("학생공지", (
+        f'<form name="frm" id="frm" method="post" action="{path}">'
+        f'<input type="hidden" name="pageIndex" value="{page}"><input type="hidden" name="menuCd" value="DOM_00000{board + 1}">'
+        '<input type="text" name="searchKeyword" value=""><button type="submit">검색</button></form>\n'
+        '<table class="board-list"><caption>목록</caption><tbody>\n' + "\n".join(rows) + "\n</tbody></table>\n"
+        f'<div class="paging">{" ".join(links)}</div>'
+    ), head=JBNU_SCRIPT)
+
+
+def jbnu_detail(config: SiteConfig, item: Dict[str, Any], board: int) -> str:
+    e = html.escape
+    files = "".join(f'<a href="/fileDown.do?fileId={item["id"]}{i}">{e(name)}</a>' for i, name in enumerate(item["files"]))
+    return _page(item["title"], (
+        f'<div class="com-post-hd-01"><h3>{e(item["title"])}</h3><ul class="etc-list"><li>{item["date"]}</li>'
+        f'<li>{e(item["author"])}</li></ul></div>\n'
+        f'<div class="com-post-content-01">\n{body_html(config, item)}\n</div>\n<div class="file-wrap">{files}</div>'
+    ))
+
+
+# ===== eng (Vue 스타일 SPA) =====
+
+ENG_SHELL = _page("공과대학", '<div id="app"></div>', head='<script src="/eng/static/app.js" defer></script>')
+
+ENG_APP_JS = """(function () {
+  var m = location.pathname.match(/^\\/(\\w+)\\/(\\d+)\\/notice(?:\\/detail\\/(\\d+))?/);
+  var app = document.getElementById("app");
+  var board = m[2];
+  var base = "/" + m[1] + "/" + board + "/notice";
+  function esc(s) {
+    return String(s).replace(/&/g, "&amp;").replace(/</g, "&lt;").replace(/>/g, "&gt;");
+  }
+  if (m[3]) {
+    fetch("/api/board/" + board + "/articles/" + m[3]).then(function (r) { return r.json(); }).then(function (res) {
+      var d = res.data;
+      var files = d.files.map(function (f) {
+        return '<li class="file_item"><span>' + esc(f.fileName) + '</span><button type="button" data-file="' + f.fileSeq + '">download</button></li>';
+      }).join("");
+      app.innerHTML = '<div class="board_view"><h3>' + esc(d.title) + '</h3><div class="content_wrap">' + d.contents + '</div><ul class="file_list">' + files + "</ul></div>";
+      app.querySelectorAll(".file_item button").forEach(function (b) {
+        b.addEventListener("click", function () { location.href = "/api/file/download/" + b.dataset.file; });
+      });
+    });
+  } else {
+    var page = new URLSearchParams(location.search).get("page") || "1";
+    fetch("/api/board/" + board + "/articles?page=" + page + "&size=__SIZE__").then(function (r) { return r.json(); }).then(function (res) {
+      var rows = res.data.list.map(function (a) {
+        return "<tr><td>" + a.articleNo + '</td><td class="title"><a href="' + base + "/detail/" + a.articleNo + '?type=board">' + esc(a.title) + "</a></td><td>" + esc(a.writer) + "</td><td>" + a.regDate + "</td><td>" + a.hit + "</td></tr>";
+      }).join("");
+      app.innerHTML = '<table class="board_list"><thead><tr><th>번호</th><th>제목</th><th>작성자</th><th>작성일</th><th>조회</th></tr></thead><tbody>' + rows + "</tbody></table>";
+    });
+  }
+})();
+"""
+
+
+def eng_record(item: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        "articleNo": item["id"],
+        "title": item["title"],
+        "writer": item["author"],
+        "regDate": f"{item['date']} 09:00:00",
+        "hit": item["views"],
+    }
+
+
+def eng_list_json(config: SiteConfig, board: int, page: int) -> Dict[str, Any]:
+    return {"code": 200, "data": {"list": [eng_record(item) for item in page_notices(config, board, page)], "total": config.total}}
+
+
+def eng_detail_json(config: SiteConfig, item: Dict[str, Any]) -> Dict[str, Any]:
+    return {"code": 200, "data": {
+        **eng_record(item),
+        "contents": body_html(config, item),
+        "files": [{"fileSeq": f"F{item['id']}-{i}", "fileName": name, "fileSize": 20480 + i} for i, name in enumerate(item["files"])],
+    }}
+
+
+# ===== 라우팅 =====
+
+def _find(config: SiteConfig, post_id: int) -> Optional[Tuple[int, Dict[str, Any]]]:
+    """공지 번호 → (게시판 번호, 공지)"""
+    board, number = divmod(post_id, ID_BASE)
+    board -= 1
+    if board < 0 or board >= config.urls or not 1 <= number <= config.total:
+        return None
+    return board, notice(config, board, config.total - number)
+
+
+# (종류, 응답) - 종류는 요청 통계용: list / detail / api_list / api_detail / download / asset
+Routed = Tuple[str, int, str, bytes, Dict[str, str]]
+
+
+def route(config: SiteConfig, method: str, path: str, query: Dict[str, List[str]], form: Dict[str, List[str]]) -> Routed:
+    html_type = "text/html; charset=utf-8"
+
+    def ok(kind: str, text: str, content_type: str = html_type, headers: Optional[Dict[str, str]] = None) -> Routed:
+        return kind, 200, content_type, text.encode("utf-8"), headers or {}
+
+    def arg(params: Dict[str, List[str]], name: str, default: str = "") -> str:
+        return (params.get(name) or [default])[0]
+
+    # csai
+    m = re.fullmatch(r"/csai/(\d+)/subview\.do", path)
+    if m:
+        return ok("list", csai_list(config, int(m.group(1)) - 29105, int(arg(query, "page", "1") or 1)))
+    m = re.fullmatch(r"/bbs/csai/\d+/(\d+)/artclView\.do", path)
+    if m and (found := _find(config, int(m.group(1)))):
+        return ok("detail", csai_detail(config, found[1], found[0]))
+
+    # swuniv
+    if path == "/main/jbnusw":
+        board = int(arg(query, "gc", "605XOAS0")[7:] or 0)
+        action = arg(query, "do", "list")
+        if action == "list":
+            return ok("list", swuniv_list(config, board, int(arg(query, "page", "1") or 1)))
+        if action == "view" and (found := _find(config, int(arg(query, "idx", "0") or 0))):
+            return ok("detail", swuniv_detail(config, found[1], found[0]))
+        if action == "download":
+            return ok("download", "file", "application/octet-stream")
+
+    # jbnu
+    m = re.fullmatch(r"/web/news/notice/sub(\d+)\.do", path)
+    if m:
+        page = int(arg(form, "pageIndex", "1") or 1) if method == "POST" else 1
+        return ok("list", jbnu_list(config, int(m.group(1)) - 1, page))
+    m = re.fullmatch(r"/web/Board/(\d+)/detailView\.do", path)
+    if m and (found := _find(config, int(m.group(1)))):
+        return ok("detail", jbnu_detail(config, found[1], found[0]))
+
+    # eng
+    if path == "/eng/static/app.js":
+        return ok("asset", ENG_APP_JS.replace("__SIZE__", str(config.per_page)), "application/javascript; charset=utf-8")
+    if re.fullmatch(r"/\w+/\d+/notice(/detail/\d+)?", path):
+        return ok("detail" if "/detail/" in path else "list", ENG_SHELL)
+    m = re.fullmatch(r"/api/board/(\d+)/articles", path)
+    if m:
+        data = eng_list_json(config, int(m.group(1)) - 38, int(arg(query, "page", "1") or 1))
+        return ok("api_list", json.dumps(data, ensure_ascii=False), "application/json;charset=UTF-8")
+    m = re.fullmatch(r"/api/board/\d+/articles/(\d+)", path)
+    if m and (found := _find(config, int(m.group(1)))):
+        return ok("api_detail", json.dumps(eng_detail_json(config, found[1]), ensure_ascii=False), "application/json;charset=UTF-8")
+    m = re.fullmatch(r"/api/file/download/([\w-]+)", path)
+    if m:
+        return ok("download", "file", "application/octet-stream", {"Content-Disposition": f'attachment; filename="{m.group(1)}.bin"'})
+
+    if path.endswith("/download.do") or path == "/fileDown.do":
+        return ok("download", "file", "application/octet-stream")
+    return "other", 404, html_type, b"not found", {}
+
+
+# ===== 서버 =====
+
+def _make_handler(config: SiteConfig, counts: Dict[str, int]):
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"   # keep-alive (실제 사이트처럼 커넥션 재사용)
+
+        def log_message(self, format, *args):
+            pass
+
+        def _send(self, status: int, content_type: str, body: bytes, headers: Dict[str, str]):
+            self.send_response(status)
+            self.send_header("Content-Type", content_type)
+            self.send_header("Content-Length", str(len(body)))
+            for name, value in headers.items():
+                self.send_header(name, value)
+            self.end_headers()
+            if self.command != "HEAD":
+                self.wfile.write(body)
+
+        def _handle(self, method: str):
+            parts = urlsplit(self.path)
+            if parts.path == "/__stats":
+                return self._send(200, "application/json", json.dumps(counts).encode(), {})
+            if parts.path == "/__reset":
+                counts.clear()
+                return self._send(200, "application/json", b"{}", {})
+
+            form: Dict[str, List[str]] = {}
+            length = int(self.headers.get("Content-Length") or 0)
+            if length:
+                form = parse_qs(self.rfile.read(length).decode("utf-8"), keep_blank_values=True)
+            if config.latency_ms > 0:
+                time.sleep(config.latency_ms / 1000)
+
+            kind, status, content_type, body, headers = route(config, method, parts.path, parse_qs(parts.query), form)
+            counts[kind] = counts.get(kind, 0) + 1
+            counts["bytes"] = counts.get("bytes", 0) + len(body)
+            self._send(status, content_type, body, headers)
+
+        def do_GET(self):
+            self._handle("GET")
+
+        def do_HEAD(self):
+            self._handle("HEAD")
+
+        def do_POST(self):
+            self._handle("POST")
+
+    return Handler
+
+
+def _serve(config: Dict[str, Any], ready):
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _make_handler(SiteConfig(**config), {}))
+    server.daemon_threads = True
+    ready.put(server.server_address[1])
+    server.serve_forever()
+
+
+class SiteServer:
+    """
+    로컬 게시판 서버 (별도 프로세스)
+
+    사용법:
+        with SiteServer(SiteConfig(pages=5, per_page=10)) as server:
+            server.origin      # "http://127.0.0.1:PORT"
+            server.stats()     # {"list": 5, "detail": 50, ...}
+    """
+
+    def __init__(self, config: SiteConfig):
+        self.config = config
+        self.origin: Optional[str] = None
+        self._process = None
+
+    def __enter__(self) -> "SiteServer":
+        context = multiprocessing.get_context("spawn")
+        ready = context.Queue()
+        self._process = context.Process(target=_serve, args=(self.config.to_dict(), ready), daemon=True)
+        self._process.start()
+        self.origin = f"http://127.0.0.1:{ready.get(timeout=30)}"
+        return self
+
+    def __exit__(self, *exc):
+        if self._process is not None:
+            self._process.terminate()
+            self._process.join()
+            self._process = None
+
+    def _call(self, path: str, method: str = "GET") -> Dict[str, int]:
+        with urlopen(Request(f"{self.origin}{path}", method=method), timeout=10) as response:
+            return json.loads(response.read())
+
+    def stats(self) -> Dict[str, int]:
+        """종류별 요청 수 (+ 응답 바이트)"""
+        return self._call("/__stats")
+
+    def reset(self):
+        self._call("/__reset", "POST")
+
+
+def board_urls(site: str, origin: str, config: SiteConfig) -> List[Dict[str, str]]:
+    """사이트 게시판 문서의 urls (INITIAL_BOARDS와 같은 경로 규칙)"""
+    paths = {
+        "csai": lambda i: f"/csai/{29105 + i}/subview.do",
+        "swuniv": lambda i: f"/main/jbnusw?gc=605XOAS{i}",
+        "jbnu": lambda i: f"/web/news/notice/sub{i + 1:02d}.do",
+        "eng": lambda i: f"/eng/{38 + i}/notice",
+    }[site]
+    return [{"url": f"{origin}{paths(i)}", "name": f"게시판 {i + 1}"} for i in range(config.urls)]
@@ -4,11 +4,13 @@ JBNU 공지사항 크롤러 - 서버 실행
 사용법:
     python main.py              # FastAPI 서버 실행
     python main.py --mcp        # MCP 서버 실행 (Claude 연동)
+    python main.py --worker     # 크롤링 워커 실행 (작업 큐, CRAWL_QUEUE=true)
 
     또는
 
     uvicorn app.main:app --reload     # FastAPI
     uv run python mcp_server.py       # MCP
+    uv run python worker.py           # 워커
 """
 import sys
 
@@ -21,6 +23,10 @@ def main():
         print("=" * 50)
         from mcp_server import mcp
         mcp.run()
+    elif "--worker" in sys.argv:
+        import asyncio
+        from worker import run
+        asyncio.run(run())
     else:
         # FastAPI 서버 실행
         import uvicorn
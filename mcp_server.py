@@ -10,6 +10,7 @@ from typing import Optional, List
 from fastmcp import FastMCP
 
 from app.core.database import Database, init_boards
+from app.core.browser_pool import BrowserPool
 from app.services import (
     get_notices,
     search_notices,
@@ -137,6 +138,7 @@ async def trigger_notice_crawl(boards: Optional[List[str]] = None) -> dict:
         - "컴공 공지만 업데이트" → trigger_notice_crawl(boards=["csai"])
     """
     await _ensure_db_connected()
+    await BrowserPool.start()
 
     result = await crawl_all(board_slugs=boards)
 
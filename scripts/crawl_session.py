@@ -0,0 +1,102 @@
+"""
+네트워크 세션 녹화/재생 크롤링 스크립트
+라이브 사이트 크롤링에서 받은 목록/상세 응답을 녹화하고, 같은 크롤링을 네트워크 없이 재생해 성능 문제/회귀를 재현합니다.
+매 실행은 전용 DB(기본 <MONGODB_DB_NAME>_session)를 비우고 게시판 초기 데이터부터 시작하므로 녹화와 재생이 같은 상태에서 출발합니다.
+실행 결과(소요 시간, 게시판별 수, 세션 통계)는 세션 디렉터리의 runs.jsonl에 쌓입니다.
+
+사용법:
+    python scripts/crawl_session.py record sessions/1017 --boards csai eng
+    python scripts/crawl_session.py replay sessions/1017 --boards csai eng
+    python scripts/crawl_session.py replay sessions/1017 --latency 0     # 녹화된 지연 없이
+"""
+import sys
+import json
+import time
+import asyncio
+import argparse
+from datetime import datetime
+from pathlib import Path
+
+# 프로젝트 루트를 path에 추가
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.config import settings
+from app.core.database import Database, init_boards
+from app.core.browser_pool import BrowserPool
+from app.core.http_client import HttpClient
+from app.core.extract_pool import ExtractPool
+from app.core.net_session import NetSession, MODES
+from app.services.crawl_service import crawl_all
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="크롤링 네트워크 세션 녹화/재생")
+    parser.add_argument("mode", choices=MODES, help="record: 라이브 사이트 응답 녹화, replay: 녹화된 응답으로 크롤링")
+    parser.add_argument("directory", help="세션 디렉터리")
+    parser.add_argument("--boards", nargs="*", help="게시판 slug (없으면 전체)")
+    parser.add_argument("--latency", type=float, default=settings.NET_REPLAY_LATENCY, help="재생 지연 시간 배율 (0이면 지연 없이)")
+    parser.add_argument("--db", default=f"{settings.MONGODB_DB_NAME}_session", help="크롤링 결과를 저장할 DB (실행마다 비움)")
+    parser.add_argument("--keep-db", action="store_true", help="DB를 비우지 않고 이어서 크롤링")
+    args = parser.parse_args()
+
+    directory = Path(args.directory)
+    if args.mode == "record" and (directory / "index.jsonl").exists():
+        parser.error(f"이미 녹화된 세션: {directory} (다른 디렉터리 지정)")
+    if args.db == settings.MONGODB_DB_NAME and not args.keep_db:
+        parser.error("운영 DB는 비울 수 없음 (--db로 다른 DB 지정 또는 --keep-db)")
+
+    print("=" * 50)
+    print(f"🎞️  네트워크 세션 {args.mode}: {directory}")
+    print("=" * 50)
+
+    # HttpClient/브라우저 route보다 먼저 시작해야 녹화/재생 transport가 적용됨
+    NetSession.start(args.mode, str(directory), args.latency)
+
+    await Database.connect(uri=settings.MONGODB_URI, db_name=args.db)
+    if not args.keep_db:
+        await Database.client.drop_database(args.db)
+    await Database.create_indexes()
+    await init_boards()
+    await BrowserPool.start()
+
+    started_at = datetime.utcnow()
+    started = time.perf_counter()
+    try:
+        result = await crawl_all(args.boards or None)
+    finally:
+        elapsed = time.perf_counter() - started
+        await BrowserPool.stop()
+        ExtractPool.stop()
+        await HttpClient.close()
+        await Database.disconnect()
+
+    run = {
+        "mode": args.mode,
+        "started_at": started_at.isoformat(),
+        "latency": args.latency if args.mode == "replay" else None,
+        "elapsed_sec": round(elapsed, 3),
+        "total_new": result["total_new"],
+        "total_updated": result["total_updated"],
+        "boards": [
+            {key: board.get(key) for key in ("board_name", "new", "updated", "unchanged", "error")}
+            for board in result["results"]
+        ],
+        "session": NetSession.stats(),
+    }
+    with open(directory / "runs.jsonl", "a", encoding="utf-8") as f:
+        f.write(json.dumps(run, ensure_ascii=False) + "\n")
+
+    print("=" * 50)
+    for board in run["boards"]:
+        status = f"오류: {board['error']}" if board["error"] else f"new {board['new']}, updated {board['updated']}"
+        print(f"  {board['board_name']}: {status}")
+    stats = run["session"]
+    print(
+        f"✅ {args.mode} 완료: {elapsed:.1f}초, 새 공지 {run['total_new']}건 "
+        f"(녹화 {stats['recorded']}건, 재생 {stats['replayed']}건, 세션에 없음 {stats['misses']}건)"
+    )
+    print("=" * 50)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,138 @@
+"""
+원본 HTML 재추출 스크립트
+raw_pages에 보관된 상세 원본으로 공지 본문/첨부파일을 다시 추출해 갱신 (사이트 요청 없음)
+본문 선택자(content_selector)나 표 변환 규칙을 바꾼 뒤 실행합니다.
+
+사용법:
+    python scripts/reextract.py                     # 전체 게시판
+    python scripts/reextract.py --boards csai eng   # 특정 게시판
+    python scripts/reextract.py --dry-run           # 바뀌는 공지 수만 확인
+    python scripts/reextract.py --workers 4 --batch 200
+"""
+import os
+import sys
+import time
+import asyncio
+import argparse
+from datetime import datetime
+from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor
+
+# 프로젝트 루트를 path에 추가
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from pymongo import UpdateOne
+
+from app.core.database import Database
+from app.crawlers.raw_archive import reextract, latest_by_url
+from app.crawlers.versioning import content_hash, version_diff
+
+
+async def reextract_batch(pool: ProcessPoolExecutor, notices: list, crawler_types: dict, dry_run: bool) -> dict:
+    """공지 한 묶음 재추출 - 원본 조회 → 프로세스 풀에서 추출 → 바뀐 공지만 갱신 (이전 버전은 notice_history에 diff로)"""
+    raws = await Database.raw_pages().find(
+        {"url": {"$in": [notice["url"] for notice in notices]}},
+        {"url": 1, "kind": 1, "body": 1, "fetched_at": 1}
+    ).to_list(None)
+    latest = latest_by_url(raws)
+
+    targets = [notice for notice in notices if notice["url"] in latest]
+    loop = asyncio.get_running_loop()
+    results = await asyncio.gather(*(
+        loop.run_in_executor(
+            pool, reextract,
+            crawler_types[notice["board_id"]], latest[notice["url"]]["kind"], bytes(latest[notice["url"]]["body"])
+        )
+        for notice in targets
+    ))
+
+    now = datetime.utcnow()
+    ops = []
+    history = []
+    for notice, result in zip(targets, results):
+        attachments = result["attachments"] if result["attachments"] is not None else notice.get("attachments") or []
+        updated = {"title": notice.get("title"), "content": result["content"], "attachments": attachments}
+        notice_hash = content_hash(updated)
+        if notice_hash == notice.get("content_hash") and result["content"] == notice.get("content"):
+            continue
+        ops.append(UpdateOne(
+            {"_id": notice["_id"]},
+            {"$set": {"content": result["content"], "attachments": attachments, "content_hash": notice_hash, "reextracted_at": now}}
+        ))
+
+        # 이력은 현재 내용에서 역방향 diff로 복원하므로 save_notices처럼 이전 버전 diff를 남김
+        diff = version_diff(notice, updated)
+        if diff:
+            history.append({
+                "notice_id": notice["_id"],
+                "url": notice["url"],
+                "board_id": notice["board_id"],
+                "changed_at": now,
+                "prev_hash": notice.get("content_hash") or content_hash(notice),
+                "hash": notice_hash,
+                "diff": diff,
+                "source": "reextract",
+            })
+
+    if ops and not dry_run:
+        await Database.notices().bulk_write(ops, ordered=False)
+        if history:
+            await Database.notice_history().insert_many(history, ordered=False)
+    return {"archived": len(targets), "changed": len(ops)}
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="보관된 원본 HTML로 공지 본문/첨부파일 재추출")
+    parser.add_argument("--boards", nargs="*", help="게시판 slug (없으면 전체)")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="추출 프로세스 수")
+    parser.add_argument("--batch", type=int, default=200, help="한 번에 처리할 공지 수")
+    parser.add_argument("--dry-run", action="store_true", help="갱신하지 않고 바뀌는 공지 수만 출력")
+    args = parser.parse_args()
+
+    print("=" * 50)
+    print("♻️  원본 HTML 재추출 시작" + (" (dry-run)" if args.dry_run else ""))
+    print("=" * 50)
+
+    await Database.connect()
+
+    query = {"slug": {"$in": args.boards}} if args.boards else {}
+    boards = await Database.boards().find(query).to_list(100)
+    crawler_types = {board["_id"]: board["crawler_type"] for board in boards}
+
+    started = time.perf_counter()
+    totals = {"notices": 0, "archived": 0, "changed": 0}
+    cursor = Database.notices().find(
+        {"board_id": {"$in": list(crawler_types)}},
+        {"url": 1, "board_id": 1, "title": 1, "content": 1, "attachments": 1, "content_hash": 1}
+    )
+
+    with ProcessPoolExecutor(max_workers=max(1, args.workers)) as pool:
+        batch = []
+        async for notice in cursor:
+            batch.append(notice)
+            if len(batch) >= args.batch:
+                result = await reextract_batch(pool, batch, crawler_types, args.dry_run)
+                totals["notices"] += len(batch)
+                totals["archived"] += result["archived"]
+                totals["changed"] += result["changed"]
+                print(f"  {totals['notices']}건 처리 (원본 {totals['archived']}건, 변경 {totals['changed']}건)")
+                batch = []
+        if batch:
+            result = await reextract_batch(pool, batch, crawler_types, args.dry_run)
+            totals["notices"] += len(batch)
+            totals["archived"] += result["archived"]
+            totals["changed"] += result["changed"]
+
+    elapsed = time.perf_counter() - started
+    await Database.disconnect()
+
+    print("=" * 50)
+    print(
+        f"✅ 재추출 완료: 공지 {totals['notices']}건 중 원본 {totals['archived']}건, "
+        f"변경 {totals['changed']}건 ({elapsed:.1f}초, 원본 없음 {totals['notices'] - totals['archived']}건)"
+    )
+    print("=" * 50)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
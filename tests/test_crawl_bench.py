@@ -0,0 +1,68 @@
+"""
+크롤링 벤치마크 테스트
+로컬 게시판 서버(benchmarks/sites.py)를 HTTP 엔진으로 끝까지 크롤링했을 때 모든 공지가 상세까지 한 번씩 저장되는지,
+메모리 MongoDB(benchmarks/memory_db.py)가 크롤링 경로의 갱신 연산을 MongoDB처럼 처리하는지 확인합니다.
+공과대학(api 엔진)은 API 탐색에 Chromium이 필요해 제외합니다.
+"""
+import asyncio
+
+import pytest
+from pymongo import ReturnDocument, UpdateOne
+from pymongo.errors import DuplicateKeyError
+
+from benchmarks.crawl_bench import run_benchmark
+from benchmarks.memory_db import MemoryDatabase
+from benchmarks.sites import SiteConfig
+
+
+def test_benchmark_crawls_every_notice():
+    config = SiteConfig(pages=3, per_page=4, urls=2, paragraphs=2)
+    report = run_benchmark(["csai", "swuniv", "jbnu"], config)
+
+    for site in report["sites"]:
+        assert site["error"] is None, site
+        assert site["new"] == site["stored"] == site["expected_notices"] == 24
+        # 상세는 공지마다 한 번
+        assert site["detail_fetches"] == 24
+        assert site["stages"]["detail"]["items"] > 0
+        assert site["peak_rss_mb"] > 0
+
+
+def test_memory_db_crawl_operations():
+    async def run():
+        db = MemoryDatabase()
+
+        # 게시판 URL 워터마크 (positional 갱신)
+        board = {"name": "b", "urls": [{"url": "u1"}, {"url": "u2"}]}
+        await db.boards.insert_one(board)
+        await db.boards.update_one(
+            {"_id": board["_id"], "urls.url": "u2"}, {"$set": {"urls.$.watermark": {"id": "9"}}}
+        )
+        saved = await db.boards.find_one({"_id": board["_id"]})
+
+        # 공지 upsert + 본문 유무 프로젝션
+        await db.notices.bulk_write([
+            UpdateOne({"board_id": 1, "post_id": "a"}, {"$set": {"content": "본문"}, "$setOnInsert": {"n": 1}}, upsert=True),
+            UpdateOne({"board_id": 1, "post_id": "b"}, {"$set": {"content": ""}}, upsert=True),
+        ])
+        projected = await db.notices.find(
+            {"post_id": {"$in": ["a", "b"]}},
+            {"post_id": 1, "has_content": {"$gt": [{"$strLenCP": {"$ifNull": ["$content", ""]}}, 0]}, "_id": 0},
+        ).to_list(None)
+
+        # 리스: 만료 안 된 다른 소유자면 upsert가 중복 키
+        lease = await db.crawl_leases.find_one_and_update(
+            {"_id": "k", "$or": [{"owner": "p1"}, {"expires": {"$lte": 0}}]},
+            {"$set": {"owner": "p1", "expires": 10}}, upsert=True, return_document=ReturnDocument.AFTER,
+        )
+        with pytest.raises(DuplicateKeyError):
+            await db.crawl_leases.find_one_and_update(
+                {"_id": "k", "$or": [{"owner": "p2"}, {"expires": {"$lte": 0}}]},
+                {"$set": {"owner": "p2", "expires": 10}}, upsert=True,
+            )
+        return saved, projected, lease
+
+    saved, projected, lease = asyncio.run(run())
+    assert saved["urls"] == [{"url": "u1"}, {"url": "u2", "watermark": {"id": "9"}}]
+    assert projected == [{"post_id": "a", "has_content": True}, {"post_id": "b", "has_content": False}]
+    assert lease == {"_id": "k", "owner": "p1", "expires": 10}
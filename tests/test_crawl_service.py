@@ -0,0 +1,67 @@
+"""
+게시판 크롤링 결과 형식 테스트 (메모리 MongoDB)
+일부 URL만 실패해도 URL별 오류가 결과에 남는지, 성공/일부 실패/건너뜀/오류 모든 경로의 결과 키가 같은지 확인합니다.
+"""
+import asyncio
+from datetime import datetime, timedelta
+
+import pytest
+
+from app.core.database import Database
+from app.services import crawl_service
+from app.services.crawl_service import crawl_board
+from benchmarks.memory_db import MemoryDatabase
+
+BOARD = {
+    "name": "학생공지", "slug": "jbnu", "crawler_type": "jbnu", "engine": "http", "is_active": True,
+    "urls": [{"url": "https://www.jbnu.ac.kr/ok", "name": "학사"}, {"url": "https://www.jbnu.ac.kr/fail", "name": "장학"}]
+}
+KEYS = {"board_name", "new", "updated", "unchanged", "skipped", "error", "errors", "stages", "waits", "resources"}
+
+
+@pytest.fixture
+def fake_crawl(monkeypatch):
+    monkeypatch.setattr(Database, "db", MemoryDatabase())
+
+    async def crawl_url(crawler_class, board, url_info, progress=None):
+        if url_info["url"].endswith("/fail"):
+            raise RuntimeError("목록 요청 실패")
+        return {"new": 2, "updated": 1, "unchanged": 3, "stages": {}, "waits": {}, "resources": {}}
+
+    monkeypatch.setattr(crawl_service, "_crawl_url", crawl_url)
+
+
+def test_partial_failure_reports_url_errors(fake_crawl):
+    async def run():
+        board_id = (await Database.boards().insert_one(dict(BOARD))).inserted_id
+        return await crawl_board(str(board_id))
+
+    result = asyncio.run(run())
+    assert set(result) == KEYS
+    assert (result["new"], result["updated"], result["unchanged"], result["error"]) == (2, 1, 3, None)
+    assert result["errors"] == [{"url": "https://www.jbnu.ac.kr/fail", "error": "목록 요청 실패"}]
+
+
+@pytest.mark.parametrize("case", ["all_failed", "skipped", "invalid_id", "not_found", "unknown_type"])
+def test_result_shape_on_every_path(fake_crawl, case):
+    async def run():
+        board = dict(BOARD)
+        if case == "all_failed":
+            board["urls"] = [BOARD["urls"][1]]
+        if case == "unknown_type":
+            board["crawler_type"] = "없는크롤러"
+        board_id = (await Database.boards().insert_one(board)).inserted_id
+        if case == "skipped":
+            await Database.crawl_leases().insert_one({
+                "_id": f"board:{board_id}", "owner": "other", "expires_at": datetime.utcnow() + timedelta(minutes=5)
+            })
+        if case == "invalid_id":
+            return await crawl_board("not-an-id")
+        if case == "not_found":
+            await Database.boards().delete_one({"_id": board_id})
+        return await crawl_board(str(board_id))
+
+    result = asyncio.run(run())
+    assert set(result) == KEYS
+    assert result["skipped"] == (case == "skipped")
+    assert (result["error"] is None) == (case == "skipped")
@@ -0,0 +1,27 @@
+"""
+초기 게시판 데이터 테스트 (메모리 MongoDB)
+engine 도입 전 게시판은 INITIAL_BOARDS의 engine으로 채우고, 운영자가 DB에서 고른 engine은 덮어쓰지 않는지 확인합니다.
+"""
+import asyncio
+
+from app.core.database import INITIAL_BOARDS, Database, init_boards
+from benchmarks.memory_db import MemoryDatabase
+
+
+def test_init_boards_fills_missing_engine(monkeypatch):
+    monkeypatch.setattr(Database, "db", MemoryDatabase())
+    # engine 도입 전에 만들어진 게시판
+    old = [{k: v for k, v in board.items() if k != "engine"} for board in INITIAL_BOARDS]
+    # 운영자가 브라우저 크롤러로 바꾼 게시판
+    old[0]["engine"] = "browser"
+
+    async def run():
+        await Database.boards().insert_many(old)
+        await init_boards()
+        return await Database.boards().find({}).to_list(None)
+
+    boards = {board["name"]: board for board in asyncio.run(run())}
+    assert len(boards) == len(INITIAL_BOARDS)
+    assert boards[INITIAL_BOARDS[0]["name"]]["engine"] == "browser"
+    for board in INITIAL_BOARDS[1:]:
+        assert boards[board["name"]]["engine"] == board["engine"]
@@ -0,0 +1,100 @@
+"""
+본문 추출 테스트
+fixture 상세 페이지(tests/fixtures/extract/*.html)에서 Python 추출 결과가 정답(*.txt)과 바이트 단위로 같은지,
+Chromium이 있으면 브라우저 JS 추출(CONTENT_EXTRACT_JS)과도 같은지 확인합니다.
+
+사용법:
+    uv run --with pytest pytest tests
+"""
+import asyncio
+from pathlib import Path
+
+import pytest
+
+from app.crawlers import CRAWLER_MAP
+from app.crawlers.base import CONTENT_EXTRACT_JS
+from app.crawlers.html_extract import extract_content, clean_content, parse_html, text_content
+from app.core.extract_pool import ExtractPool
+
+FIXTURES = Path(__file__).parent / "fixtures" / "extract"
+BOARDS = ["csai", "jbnu", "swuniv", "eng"]
+
+
+def read_fixture(name: str, suffix: str) -> str:
+    # CRLF 그대로 읽기 (브라우저처럼 파서가 정규화해야 함)
+    with open(FIXTURES / f"{name}.{suffix}", encoding="utf-8", newline="") as f:
+        return f.read()
+
+
+@pytest.mark.parametrize("name", BOARDS)
+def test_extract_content_matches_golden(name):
+    html = read_fixture(name, "html")
+    selector = CRAWLER_MAP[name].content_selector
+    assert extract_content(html, selector) == read_fixture(name, "txt")
+
+
+def test_whitespace_only_text_preserved():
+    # 들여쓰기 같은 공백 문자열도 textContent처럼 그대로 유지
+    soup = parse_html("<div>\n  <p>a</p>\n    <p>b</p>\r\n</div>")
+    assert text_content(soup.div) == "\n  a\n    b\n"
+
+
+def test_extract_in_process_pool():
+    async def run():
+        return await asyncio.gather(*(
+            ExtractPool.run(extract_content, read_fixture(name, "html"), CRAWLER_MAP[name].content_selector)
+            for name in BOARDS
+        ))
+
+    try:
+        results = asyncio.run(run())
+    finally:
+        ExtractPool.stop()
+    assert results == [read_fixture(name, "txt") for name in BOARDS]
+
+
+def test_extract_detail_html_attachments():
+    csai = CRAWLER_MAP["csai"].extract_detail_html(read_fixture("csai", "html"))
+    # 상대 경로는 절대 URL로, 외부 도메인 링크는 제외
+    assert csai["attachments"] == [
+        {"name": "수강신청_안내.hwp", "url": "https://csai.jbnu.ac.kr/bbs/csai/1/download.do?fileId=101"},
+        {"name": "시간표.pdf", "url": "https://csai.jbnu.ac.kr/bbs/csai/1/download.do?fileId=102"},
+    ]
+
+    swuniv = CRAWLER_MAP["swuniv"].extract_detail_html(read_fixture("swuniv", "html"))
+    # 이름이 빈 링크는 제외, &amp; 디코딩
+    assert swuniv["attachments"] == [
+        {"name": "모집요강.hwp", "url": "https://swuniv.jbnu.ac.kr/main/jbnusw?do=download&file=1"},
+    ]
+
+    # 공과대학은 첨부파일을 JSON API에서 가져옴
+    assert CRAWLER_MAP["eng"].extract_detail_html(read_fixture("eng", "html"))["attachments"] is None
+
+
+def test_browser_js_parity():
+    """브라우저가 파싱한 같은 페이지에서 JS 추출과 Python 추출이 같은지 (Chromium 없으면 건너뜀)"""
+    async_playwright = pytest.importorskip("playwright.async_api").async_playwright
+
+    async def run():
+        results = {}
+        async with async_playwright() as p:
+            try:
+                browser = await p.chromium.launch(headless=True)
+            except Exception as e:
+                return str(e)
+            page = await browser.new_page()
+            for name in BOARDS:
+                selector = CRAWLER_MAP[name].content_selector
+                await page.set_content(read_fixture(name, "html"))
+                js = clean_content(await page.evaluate(CONTENT_EXTRACT_JS, selector))
+                python = extract_content(await page.content(), selector)
+                results[name] = (js, python)
+            await browser.close()
+        return results
+
+    results = asyncio.run(run())
+    if isinstance(results, str):
+        pytest.skip(f"Chromium 실행 불가: {results.splitlines()[0]}")
+
+    for name, (js, python) in results.items():
+        assert js == python == read_fixture(name, "txt"), name
@@ -0,0 +1,112 @@
+"""
+JBNU 직접 페이지네이션 테스트
+"끝" 링크 없이 10페이지 블록 + "다음"만 있는 목록에서 목록 동시 요청(LIST_PREFETCH) 중에도
+다음 블록 페이지를 끝으로 오인하지 않고, 실제 끝 신호(빈 목록 / 이전 페이지와 같은 목록)에서만 멈추는지 확인합니다.
+"""
+import asyncio
+from typing import Callable
+from urllib.parse import parse_qs
+
+import httpx
+import pytest
+from bson import ObjectId
+
+from app.config import settings
+from app.core.host_scheduler import HostScheduler
+from app.crawlers import JbnuHttpCrawler
+
+LIST_URL = "https://www.jbnu.ac.kr/web/news/notice/sub01.do"
+PAGES = 25
+PER_PAGE = 5
+
+SCRIPT = (
+    "<script>function pf_LinkPage(n){document.frm.pageIndex.value=n;document.frm.submit();}"
+    "function pf_DetailMove(id){location.href='/web/Board/'+id+'/detailView.do';}</script>"
+)
+
+
+def list_page(page: int, day: str = "2026-03-01") -> str:
+    rows = []
+    if 1 <= page <= PAGES:
+        for i in range(PER_PAGE):
+            post_id = 500000 - (page - 1) * PER_PAGE - i
+            rows.append(
+                f'<tr><td class="td-num">{post_id}</td><td class="td-title">'
+                f'<a href="javascript:void(0);" onclick="pf_DetailMove(\'{post_id}\')" class="title">공지 {post_id}</a>'
+                f'<ul class="etc-list"><li>{day}</li></ul></td><td></td><td>1</td><td class="td-writer">학사과</td></tr>'
+            )
+    else:
+        rows.append('<tr><td colspan="5">등록된 게시물이 없습니다.</td></tr>')
+
+    # 10페이지 블록 + 이전/다음 ("끝" 링크 없음)
+    block = (page - 1) // 10 * 10
+    links = [f'<a onclick="pf_LinkPage({block})">이전</a>'] if block else []
+    links += [f'<a onclick="pf_LinkPage({n})">{n}</a>' for n in range(block + 1, min(block + 10, PAGES) + 1)]
+    if block + 10 < PAGES:
+        links.append(f'<a onclick="pf_LinkPage({block + 11})">다음</a>')
+    return (
+        f"<html><head>{SCRIPT}</head><body>"
+        '<form name="frm" method="post" action="/web/news/notice/sub01.do"><input type="hidden" name="pageIndex" value="1"></form>'
+        f'<table><tbody>{"".join(rows)}</tbody></table><div class="paging">{"".join(links)}</div></body></html>'
+    )
+
+
+def handler(beyond: str, day: Callable[[int], str] = lambda page: "2026-03-01"):
+    async def handle(request: httpx.Request) -> httpx.Response:
+        await asyncio.sleep(0.01)   # 동시 요청이 실제로 겹치도록
+        page = 1
+        if request.method == "POST":
+            page = int(parse_qs(request.content.decode())["pageIndex"][0])
+        if page > PAGES and beyond == "clamp":
+            page = PAGES   # 범위 밖 페이지에 마지막 페이지를 주는 서버
+        return httpx.Response(200, text=list_page(page, day(page)))
+    return handle
+
+
+@pytest.mark.parametrize("beyond", ["empty", "clamp"])
+def test_http_pagination_crosses_blocks_without_last_link(monkeypatch, beyond):
+    monkeypatch.setattr(settings, "LIST_PREFETCH", 3)
+    monkeypatch.setattr(settings, "HOST_RATE", 1000.0)
+    monkeypatch.setattr(settings, "HOST_BURST", 1000)
+    monkeypatch.setattr(HostScheduler, "_hosts", {})
+
+    async def run():
+        crawler = JbnuHttpCrawler(ObjectId(), "학생공지")
+        crawler.client = httpx.AsyncClient(transport=httpx.MockTransport(handler(beyond)))
+        try:
+            return [page async for page in crawler.parse_list(LIST_URL)]
+        finally:
+            await crawler.client.aclose()
+
+    pages = asyncio.run(run())
+    assert len(pages) == PAGES
+    urls = [notice["url"] for page in pages for notice in page]
+    assert len(urls) == len(set(urls)) == PAGES * PER_PAGE
+
+
+def test_http_pagination_clamps_resume_page_to_max_pages(monkeypatch):
+    monkeypatch.setattr(settings, "LIST_PREFETCH", 3)
+    monkeypatch.setattr(settings, "HOST_RATE", 1000.0)
+    monkeypatch.setattr(settings, "HOST_BURST", 1000)
+    monkeypatch.setattr(HostScheduler, "_hosts", {})
+
+    async def run():
+        crawler = JbnuHttpCrawler(ObjectId(), "학생공지")
+        crawler.client = httpx.AsyncClient(transport=httpx.MockTransport(handler("empty")))
+        try:
+            pages = await asyncio.wait_for(
+                _collect(crawler.parse_list(LIST_URL, max_pages=3, start_page=10)), timeout=10
+            )
+            return pages, crawler._list_end
+        finally:
+            await crawler.client.aclose()
+
+    pages, list_end = asyncio.run(run())
+    # 체크포인트(10페이지)가 max_pages(3)를 넘으면 마지막 페이지만 읽고 끝남
+    assert len(pages) == 1
+    assert pages[0][0]["url"].endswith(f"/{500000 - 2 * PER_PAGE}/detailView.do")
+    assert list_end == "max_pages"
+
+
+async def _collect(pages):
+    return [page async for page in pages]
@@ -0,0 +1,55 @@
+"""
+크롤러 파서 정답 테스트
+크롤러별 목록/상세 fixture(tests/fixtures/parsers/*_list.html, *_detail.html)의 parse_row/본문/첨부파일 결과가
+정답(*.json)과 같은지 확인합니다. 선택자/추출 규칙을 의도적으로 바꿨으면
+python benchmarks/parser_bench.py --update-golden으로 정답을 다시 쓰고 diff를 확인합니다.
+"""
+import re
+
+import pytest
+from bson import ObjectId
+
+from app.crawlers import CRAWLER_MAP
+from app.crawlers.html_extract import extract_rows
+from benchmarks.parser_bench import CRAWLERS, bench_crawler, list_url, load_golden, parse_fixture, read_fixture
+
+
+@pytest.mark.parametrize("name", CRAWLERS)
+@pytest.mark.parametrize("field", ["rows", "content", "attachments"])
+def test_parser_matches_golden(name, field):
+    assert parse_fixture(name)[field] == load_golden(name)[field]
+
+
+def test_golden_skips_pinned_and_invalid_rows():
+    # csai 상단 고정 공지(headline), 공과대학 번호 없는 고정 공지는 목록에서 제외
+    assert len(load_golden("csai")["rows"]) == 15
+    assert len(load_golden("eng")["rows"]) == 15
+    # 외부 도메인 첨부파일은 제외, 공과대학은 HTML로 첨부파일을 알 수 없음
+    assert all(a["url"].startswith("https://csai.jbnu.ac.kr/") for a in load_golden("csai")["attachments"])
+    assert load_golden("eng")["attachments"] is None
+
+
+def test_list_without_tbody_matches_golden():
+    # <tbody> 없이 렌더링하는 서버 HTML - 브라우저처럼 암묵적 tbody가 있어야 "table tbody tr"가 행을 찾음
+    crawler_class = CRAWLER_MAP["jbnu"]
+    crawler = crawler_class(ObjectId(), "jbnu")
+    raw_rows = extract_rows(read_fixture("jbnu", "list_no_tbody"), crawler_class.row_selector, crawler_class.row_schema)
+    rows = [row for row in (crawler.parse_row(raw, list_url("jbnu")) for raw in raw_rows) if row is not None]
+    assert rows == load_golden("jbnu")["rows"]
+
+
+@pytest.mark.parametrize("name", CRAWLERS)
+def test_rows_same_without_tbody(name):
+    crawler_class = CRAWLER_MAP[name]
+    html = read_fixture(name, "list")
+    stripped = re.sub(r"</?tbody[^>]*>", "", html)
+    assert stripped != html
+    selector, schema = crawler_class.row_selector, crawler_class.row_schema
+    assert extract_rows(stripped, selector, schema) == extract_rows(html, selector, schema)
+
+
+def test_bench_crawler_reports_throughput():
+    result = bench_crawler("csai", min_time=0, rounds=1)
+    assert result["golden_mismatch"] == []
+    assert result["list_rows_per_sec"] > 0 and result["parse_row_per_sec"] > 0
+    assert result["content_ms"] > 0 and result["attachments_ms"] > 0
@@ -0,0 +1,67 @@
+"""
+원본 보관/재추출 테스트 (메모리 MongoDB)
+재추출로 바뀐 공지의 이전 버전이 notice_history로 복원되는지, URL별 원본이 RAW_ARCHIVE_KEEP개로 유지되는지 확인합니다.
+"""
+import asyncio
+import importlib.util
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from bson import ObjectId
+
+from app.config import settings
+from app.core.database import Database
+from app.crawlers.raw_archive import html_hash, save_raw_pages
+from app.crawlers.versioning import content_hash
+from app.services.notice_service import get_notice_history
+from benchmarks.memory_db import MemoryDatabase
+from benchmarks.parser_bench import read_fixture
+
+ROOT = Path(__file__).parent.parent
+URL = "https://csai.jbnu.ac.kr/csai/29107/subview.do?enc=1"
+
+
+def load_reextract():
+    spec = importlib.util.spec_from_file_location("reextract_script", ROOT / "scripts" / "reextract.py")
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def test_reextract_records_previous_version(monkeypatch):
+    monkeypatch.setattr(Database, "db", MemoryDatabase())
+    reextract_batch = load_reextract().reextract_batch
+    board_id = ObjectId()
+    old = {"title": "공지", "content": "예전 본문\n둘째 줄", "attachments": []}
+
+    async def run():
+        notice_id = (await Database.notices().insert_one(
+            {"url": URL, "board_id": board_id, **old, "content_hash": content_hash(old)}
+        )).inserted_id
+        await save_raw_pages(board_id, [{"url": URL, "html": read_fixture("csai", "detail"), "kind": "page"}])
+        notices = await Database.notices().find({}).to_list(None)
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            result = await reextract_batch(pool, notices, {board_id: "csai"}, dry_run=False)
+        return result, await Database.notices().find_one({"_id": notice_id}), await get_notice_history(str(notice_id))
+
+    result, notice, versions = asyncio.run(run())
+    assert result == {"archived": 1, "changed": 1}
+    assert notice["content"] != old["content"]
+    assert len(versions) == 1
+    assert {key: versions[0][key] for key in old} == old
+
+
+def test_save_raw_pages_keeps_latest(monkeypatch):
+    monkeypatch.setattr(Database, "db", MemoryDatabase())
+    monkeypatch.setattr(settings, "RAW_ARCHIVE_KEEP", 2)
+    board_id = ObjectId()
+
+    async def run():
+        for html in ["<p>조회수 1</p>", "<p>조회수 2</p>", "<p>조회수 3</p>", "<p>조회수 2</p>", "<p>조회수 4</p>"]:
+            await save_raw_pages(board_id, [{"url": URL, "html": html, "kind": "page"}])
+            await asyncio.sleep(0.005)   # fetched_at은 ms 단위로 저장됨
+        return await Database.raw_pages().find({"url": URL}).sort("fetched_at", -1).to_list(None)
+
+    docs = asyncio.run(run())
+    # 같은 원본은 한 번만 저장 (다시 보면 fetched_at만 갱신), 최근 2개만 남음
+    assert [doc["html_hash"] for doc in docs] == [html_hash("<p>조회수 4</p>"), html_hash("<p>조회수 2</p>")]
@@ -0,0 +1,84 @@
+"""
+최근 공지 재확인 순회 테스트
+워터마크가 1페이지에 있어도 재확인 순회 중이면 게시일이 DETAIL_REFRESH_MAX_AGE_DAYS 이내인 페이지까지 읽는지,
+순회는 URL마다 DETAIL_REFRESH_HOURS에 한 번만 필요한지, 본문이 같고 목록 메타데이터만 바뀐 공지는
+한 번 저장되면 다시 상세 대상이 되지 않는지 확인합니다.
+"""
+import asyncio
+from datetime import datetime, timedelta
+
+import httpx
+import pytest
+from bson import ObjectId
+
+from app.config import settings
+from app.core.database import Database
+from app.core.host_scheduler import HostScheduler
+from app.crawlers import JbnuHttpCrawler
+from app.crawlers.watermark import Watermark, refresh_cutoff, refresh_due
+from benchmarks.memory_db import MemoryDatabase
+from tests.test_jbnu_pagination import LIST_URL, handler
+
+DAYS_PER_PAGE = 5
+
+
+@pytest.mark.parametrize("refreshing, expected_pages", [(False, 1), (True, 30 // DAYS_PER_PAGE + 2)])
+def test_refresh_sweep_reads_past_watermark(monkeypatch, refreshing, expected_pages):
+    monkeypatch.setattr(settings, "LIST_PREFETCH", 3)
+    monkeypatch.setattr(settings, "HOST_RATE", 1000.0)
+    monkeypatch.setattr(settings, "HOST_BURST", 1000)
+    monkeypatch.setattr(settings, "DETAIL_REFRESH_MAX_AGE_DAYS", 30)
+    monkeypatch.setattr(HostScheduler, "_hosts", {})
+    today = datetime.utcnow()
+
+    async def run():
+        crawler = JbnuHttpCrawler(ObjectId(), "학생공지")
+        # 페이지마다 DAYS_PER_PAGE일씩 이전 글
+        day = lambda page: (today - timedelta(days=(page - 1) * DAYS_PER_PAGE)).strftime("%Y-%m-%d")
+        crawler.client = httpx.AsyncClient(transport=httpx.MockTransport(handler("empty", day)))
+        # 새 글 없음 - 워터마크는 1페이지 첫 글
+        first = [page async for page in crawler.parse_list(LIST_URL, max_pages=1)][0][0]
+        watermark = Watermark(first["url"], first["date"], crawler.post_id(first["url"]))
+        crawler._refresh_cutoff = refresh_cutoff(today) if refreshing else None
+        try:
+            return [page async for page in crawler.parse_list(LIST_URL, watermark=watermark)], crawler._list_end
+        finally:
+            await crawler.client.aclose()
+
+    pages, list_end = asyncio.run(run())
+    # 재확인 구간(30일)의 마지막 페이지 다음 페이지(구간 밖)에서 멈춤
+    assert len(pages) == expected_pages
+    assert list_end == "watermark"
+
+
+def test_refresh_due_once_per_interval(monkeypatch):
+    monkeypatch.setattr(settings, "DETAIL_REFRESH_HOURS", 72)
+    now = datetime.utcnow()
+    assert refresh_due({"url": LIST_URL}, now)
+    assert not refresh_due({"url": LIST_URL, "refreshed_at": now - timedelta(hours=1)}, now)
+    assert refresh_due({"url": LIST_URL, "refreshed_at": now - timedelta(hours=72)}, now)
+    monkeypatch.setattr(settings, "DETAIL_REFRESH_HOURS", 0)
+    assert not refresh_due({"url": LIST_URL}, now)
+
+
+def test_metadata_change_saved_once(monkeypatch):
+    monkeypatch.setattr(Database, "db", MemoryDatabase())
+    notice = {"url": f"{LIST_URL}?id=1", "title": "공지", "date": "2026-03-01", "author": "학사과", "content": "본문", "attachments": []}
+
+    async def crawl(crawler, listed):
+        targets = await crawler.select_for_detail([listed])
+        result = await crawler.save_notices([{**listed, "content": "본문", "attachments": []} for _ in targets])
+        return len(targets), result
+
+    async def run():
+        crawler = JbnuHttpCrawler(ObjectId(), "학생공지")
+        await crawler.save_notices([notice])
+        listed = {key: notice[key] for key in ("url", "title", "date")} | {"author": "교무과"}
+        first, second = await crawl(crawler, listed), await crawl(crawler, listed)
+        return first, second, await Database.notices().find_one({"url": notice["url"]})
+
+    first, second, doc = asyncio.run(run())
+    # 본문이 같으면 unchanged로 집계하면서 작성자만 갱신, 다음 크롤링에서는 상세를 다시 가져오지 않음
+    assert first == (1, {"new": 0, "updated": 0, "unchanged": 1})
+    assert second == (0, {"new": 0, "updated": 0, "unchanged": 0})
+    assert doc["author"] == "교무과"
@@ -0,0 +1,31 @@
+"""
+리소스 차단 통계 테스트
+크기를 측정하지 않으면(RESOURCE_MEASURE_BLOCKED=false) 절약 바이트를 0이 아닌 미상(None)으로 보고하고,
+합산할 때는 측정한 크롤러의 값만 더하는지 확인합니다.
+"""
+from app.config import settings
+from app.crawlers.resource_policy import ResourceStats, merge_resource_stats
+
+BASE = "https://www.jbnu.ac.kr"
+
+
+def test_unmeasured_bytes_are_unknown(monkeypatch):
+    monkeypatch.setattr(settings, "RESOURCE_MEASURE_BLOCKED", False)
+    stats = ResourceStats(BASE)
+    stats.record_blocked("image", f"{BASE}/banner.png")
+    stats.record_blocked("font", "https://fonts.example.com/a.woff2")
+
+    result = stats.to_dict()
+    assert result["blocked"] == result["unsized"] == 2
+    assert result["bytes_avoided"] is None
+
+
+def test_merge_sums_only_measured_bytes():
+    unknown = {"allowed": 3, "blocked": 2, "blocked_by_type": {"image": 2}, "bytes_avoided": None, "unsized": 2}
+    measured = {"allowed": 1, "blocked": 2, "blocked_by_type": {"image": 1, "font": 1}, "bytes_avoided": 2048, "unsized": 1}
+
+    assert merge_resource_stats([unknown, unknown])["bytes_avoided"] is None
+    merged = merge_resource_stats([unknown, measured, {}])
+    assert merged == {
+        "allowed": 4, "blocked": 4, "blocked_by_type": {"image": 3, "font": 1}, "bytes_avoided": 2048, "unsized": 3
+    }
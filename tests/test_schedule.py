@@ -0,0 +1,31 @@
+"""
+적응형 스케줄러 테스트 (메모리 MongoDB)
+다른 프로세스가 게시판 리스를 잡고 있어 건너뛴 게시판도 next_crawl_at을 미뤄 매 확인마다 다시 시도하지 않는지 확인합니다.
+"""
+import asyncio
+from datetime import datetime, timedelta
+
+from app.config import settings
+from app.core.database import Database
+from app.services import schedule_service
+from app.services.schedule_service import CrawlScheduler
+from benchmarks.memory_db import MemoryDatabase
+
+
+def test_lease_skip_advances_next_crawl(monkeypatch):
+    monkeypatch.setattr(Database, "db", MemoryDatabase())
+    monkeypatch.setattr(settings, "SCHEDULE_PROBE", False)
+    monkeypatch.setattr(settings, "CRAWL_QUEUE", False)
+
+    async def skipped(board_id, urls=None):
+        return {"board_name": "학생공지", "new": 0, "updated": 0, "unchanged": 0, "skipped": True, "error": None}
+
+    monkeypatch.setattr(schedule_service, "crawl_board", skipped)
+
+    async def run():
+        board_id = (await Database.boards().insert_one({"name": "학생공지", "is_active": True, "urls": []})).inserted_id
+        await CrawlScheduler._run_board(await Database.boards().find_one({"_id": board_id}))
+        return await Database.boards().find_one({"_id": board_id})
+
+    board = asyncio.run(run())
+    assert board["next_crawl_at"] >= datetime.utcnow() + timedelta(minutes=settings.SCHEDULE_MIN_INTERVAL_MIN - 1)
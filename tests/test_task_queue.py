@@ -0,0 +1,119 @@
+"""
+작업 큐/크롤링 작업 테스트 (메모리 MongoDB)
+워커 작업이 crawl_board와 같은 게시판 리스를 잡는지, 다른 프로세스가 보유 중이면 미뤄서 다시 대기하는지,
+같은 프로세스의 작업끼리는 리스를 함께 보유하고 마지막 작업이 끝날 때 반납하는지,
+서버 시작 시 죽은 프로세스의 크롤링 작업만 다시 실행하는지 확인합니다.
+"""
+import asyncio
+from datetime import datetime, timedelta
+
+from bson import ObjectId
+
+from app.core.crawl_lease import CrawlLease
+from app.core.database import Database
+from app.services import job_service, task_service
+from app.services.task_service import BoardBusyError, claim_task, defer_task, enqueue_board, execute_task
+from benchmarks.memory_db import MemoryDatabase
+
+BOARD = {"name": "학생공지", "crawler_type": "jbnu", "urls": [{"url": "https://www.jbnu.ac.kr/a"}, {"url": "https://www.jbnu.ac.kr/b"}]}
+
+
+def test_lease_shared_within_process(monkeypatch):
+    monkeypatch.setattr(Database, "db", MemoryDatabase())
+    key = "board:shared"
+
+    async def hold(release: asyncio.Event, entered: asyncio.Event):
+        async with CrawlLease.hold(key) as acquired:
+            entered.set()
+            await release.wait()
+            return acquired
+
+    async def run():
+        first_release, second_release = asyncio.Event(), asyncio.Event()
+        first_entered, second_entered = asyncio.Event(), asyncio.Event()
+        first = asyncio.create_task(hold(first_release, first_entered))
+        second = asyncio.create_task(hold(second_release, second_entered))
+        await first_entered.wait()
+        await second_entered.wait()
+
+        # 먼저 끝난 작업은 리스를 반납하지 않음
+        second_release.set()
+        assert await second
+        assert await Database.crawl_leases().find_one({"_id": key}) is not None
+
+        first_release.set()
+        assert await first
+        return await Database.crawl_leases().find_one({"_id": key})
+
+    assert asyncio.run(run()) is None
+    assert CrawlLease._holders == {}
+
+
+def test_busy_board_task_is_deferred(monkeypatch):
+    monkeypatch.setattr(Database, "db", MemoryDatabase())
+
+    async def run():
+        board_id = (await Database.boards().insert_one(dict(BOARD))).inserted_id
+        await enqueue_board({**BOARD, "_id": board_id})
+        # 다른 프로세스가 게시판 리스 보유 중
+        await Database.crawl_leases().insert_one({
+            "_id": f"board:{board_id}", "owner": "other", "expires_at": datetime.utcnow() + timedelta(minutes=5)
+        })
+
+        task = await claim_task("worker")
+        try:
+            await execute_task(task, "worker", None)
+        except BoardBusyError:
+            await defer_task(task, "worker", 60)
+        deferred = await Database.crawl_tasks().find_one({"_id": task["_id"]})
+
+        # 미룬 작업은 건너뛰고 다음 작업을 가져감
+        other = await claim_task("worker")
+        return task, deferred, other
+
+    task, deferred, other = asyncio.run(run())
+    assert deferred["status"] == "queued"
+    assert deferred["attempts"] == 0
+    assert deferred["not_before"] > datetime.utcnow()
+    assert other is not None and other["_id"] != task["_id"]
+
+
+def test_worker_defers_busy_task(monkeypatch):
+    monkeypatch.setattr(Database, "db", MemoryDatabase())
+    calls = []
+
+    async def busy(task, owner, progress):
+        raise BoardBusyError("다른 프로세스에서 크롤링 중")
+
+    async def defer(task, owner, delay):
+        calls.append((task["_id"], owner, delay))
+
+    monkeypatch.setattr(task_service, "execute_task", busy)
+    monkeypatch.setattr(task_service, "defer_task", defer)
+    task = {"_id": ObjectId(), "board_name": "학생공지", "url": "https://www.jbnu.ac.kr/a", "attempts": 1}
+    asyncio.run(task_service.CrawlWorker._run(task))
+    assert calls == [(task["_id"], task_service.CrawlWorker.owner, task_service.settings.TASK_BUSY_DELAY_SEC)]
+
+
+def test_resume_jobs_requeues_only_stale_jobs(monkeypatch):
+    monkeypatch.setattr(Database, "db", MemoryDatabase())
+    started = []
+    monkeypatch.setattr(job_service, "_start", lambda doc: started.append(doc["_id"]))
+    now = datetime.utcnow()
+
+    async def run():
+        jobs = Database.crawl_jobs()
+        alive = (await jobs.insert_one({"mode": "local", "status": "running", "owner": "other", "updated_at": now, "created_at": now})).inserted_id
+        dead = (await jobs.insert_one({
+            "mode": "local", "status": "running", "owner": "other",
+            "updated_at": now - timedelta(seconds=job_service.settings.JOB_STALE_SEC + 1), "created_at": now
+        })).inserted_id
+        mine = (await jobs.insert_one({"mode": "local", "status": "running", "owner": CrawlLease.owner, "updated_at": now, "created_at": now})).inserted_id
+        await job_service.resume_jobs()
+        return alive, dead, mine, {doc["_id"]: doc["status"] for doc in await jobs.find({}).to_list(None)}
+
+    alive, dead, mine, statuses = asyncio.run(run())
+    # 다른 프로세스가 실행 중인 작업은 그대로, 죽은 프로세스/이 프로세스의 작업은 다시 실행
+    assert statuses[alive] == "running"
+    assert statuses[dead] == statuses[mine] == "queued"
+    assert sorted(started) == sorted([dead, mine])
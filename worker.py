@@ -0,0 +1,67 @@
+"""
+JBNU 공지사항 크롤러 워커
+
+작업 큐(crawl_tasks)에서 게시판 URL 크롤링 작업을 가져와 실행하는 독립 프로세스
+여러 대/여러 프로세스로 띄우면 작업을 나눠 처리하고, 죽은 워커의 작업은 리스 만료 후 체크포인트부터 이어서 처리합니다.
+API/스케줄러가 작업을 큐에 넣게 하려면 CRAWL_QUEUE=true로 설정합니다.
+
+사용법:
+    python worker.py
+    uv run python worker.py
+"""
+import signal
+import asyncio
+import logging
+
+from app.core.database import Database
+from app.core.browser_pool import BrowserPool
+from app.core.http_client import HttpClient
+from app.core.extract_pool import ExtractPool
+from app.core.net_session import NetSession
+from app.services.task_service import CrawlWorker
+from app.config import settings
+
+# 로깅 설정
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s [%(levelname)s] %(name)s: %(message)s",
+    datefmt="%Y-%m-%d %H:%M:%S"
+)
+
+
+async def run():
+    print("=" * 50)
+    print("🛠️ JBNU 공지사항 크롤러 워커 시작")
+    print("=" * 50)
+
+    await Database.connect(
+        uri=settings.MONGODB_URI,
+        db_name=settings.MONGODB_DB_NAME
+    )
+    await Database.create_indexes()
+    await BrowserPool.start()
+    NetSession.start()
+
+    # SIGINT/SIGTERM이면 실행 중인 작업을 다시 대기시키고 종료
+    stop = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        try:
+            loop.add_signal_handler(sig, stop.set)
+        except NotImplementedError:
+            pass  # Windows
+
+    CrawlWorker.start()
+    try:
+        await stop.wait()
+    finally:
+        print("🛑 워커 종료 중...")
+        await CrawlWorker.stop()
+        await BrowserPool.stop()
+        ExtractPool.stop()
+        await HttpClient.close()
+        await Database.disconnect()
+
+
+if __name__ == "__main__":
+    asyncio.run(run())